@@ -1,11 +1,11 @@
 import os
 import logging
-from flask import Flask, request, make_response
+from flask import Flask
 from flask_cors import CORS
 from config.settings import config
 from models import db
-from routes import health_bp, channels_bp, accounts_bp, monitoring_bp
-from tasks import initialize_periodic_validation, start_periodic_validation
+from utils.cache import TTLCache
+from utils.serialization import ORJSONProvider
 
 # Configure logging
 logging.basicConfig(
@@ -26,6 +26,9 @@ def create_app(config_name=None):
     """
     app = Flask(__name__)
     
+    # Encode responses with orjson; datetimes become ISO 8601 UTC ('...Z') strings
+    app.json = ORJSONProvider(app)
+    
     # Load configuration
     if config_name is None:
         config_name = os.getenv('FLASK_ENV', 'development')
@@ -35,20 +38,23 @@ def create_app(config_name=None):
     # Initialize extensions
     db.init_app(app)
     
-    # Enable CORS for dashboard integration
+    # Enable CORS for dashboard integration (Flask-CORS also answers
+    # preflight requests; max_age lets browsers cache them)
     CORS(app, 
          origins=[
              'https://telegive-dashboard-production.up.railway.app',
              'http://localhost:5173',  # For development
              'http://localhost:3000',  # Alternative dev port
-             'https://telegive-dashboard-*.up.railway.app'  # For staging environments
+             r'https://telegive-dashboard-.*\.up\.railway\.app'  # For staging environments
          ],
          methods=['GET', 'POST', 'PUT', 'DELETE', 'OPTIONS'],
          allow_headers=['Content-Type', 'Authorization', 'Accept', 'X-Requested-With'],
          supports_credentials=True,
          max_age=86400)
     
-    # Register blueprints
+    # Register blueprints (imported here so the views and their dependencies
+    # are only loaded when an application is actually created)
+    from routes import health_bp, channels_bp, accounts_bp, monitoring_bp
     app.register_blueprint(health_bp)
     app.register_blueprint(channels_bp)
     app.register_blueprint(accounts_bp)
@@ -58,61 +64,61 @@ def create_app(config_name=None):
     from routes.service_api import service_api_bp
     app.register_blueprint(service_api_bp)
     
-    # Add explicit OPTIONS handler for CORS preflight requests
-    @app.before_request
-    def handle_preflight():
-        if request.method == "OPTIONS":
-            response = make_response()
-            response.headers.add("Access-Control-Allow-Origin", request.headers.get('Origin', '*'))
-            response.headers.add('Access-Control-Allow-Headers', "Content-Type,Authorization,Accept,X-Requested-With")
-            response.headers.add('Access-Control-Allow-Methods', "GET,POST,PUT,DELETE,OPTIONS")
-            response.headers.add('Access-Control-Allow-Credentials', 'true')
-            response.headers.add('Access-Control-Max-Age', '86400')
-            return response
-    
-    # Create database tables
-    with app.app_context():
-        try:
-            db.create_all()
-            logger.info("Database tables created successfully")
-            
-            # Database migration no longer needed - using Auth Service API
-            logger.info("Using Auth Service API - no database migration required")
-            
-            # Ensure channel_configs table exists for saving channel configurations
-            try:
-                from simple_table_creation import run_simple_migration
-                logger.info("Running simple table creation for channel configs...")
-                migration_success = run_simple_migration()
-                if migration_success:
-                    logger.info("Channel configs table creation completed successfully")
-                else:
-                    logger.warning("Channel configs table creation failed")
-            except Exception as migration_error:
-                logger.error(f"Table creation error: {str(migration_error)}")
-                # Don't fail startup if migration fails
-            
-            # Fix validation history table schema
+    # Create database tables (disabled in production, where the schema is static)
+    if app.config['AUTO_CREATE_TABLES']:
+        with app.app_context():
             try:
-                from fix_validation_history_table import fix_validation_history_table
-                logger.info("Fixing validation history table schema...")
-                fix_success = fix_validation_history_table()
-                if fix_success:
-                    logger.info("Validation history table fix completed successfully")
-                else:
-                    logger.warning("Validation history table fix failed")
-            except Exception as fix_error:
-                logger.error(f"Validation history table fix error: {str(fix_error)}")
-                # Don't fail startup if fix fails
-            
-        except Exception as e:
-            logger.error(f"Error creating database tables: {str(e)}")
+                db.create_all()
+                logger.info("Database tables created successfully")
+                
+                # Database migration no longer needed - using Auth Service API
+                logger.info("Using Auth Service API - no database migration required")
+                
+                # Ensure channel_configs table exists for saving channel configurations
+                try:
+                    from simple_table_creation import run_simple_migration
+                    logger.info("Running simple table creation for channel configs...")
+                    migration_success = run_simple_migration()
+                    if migration_success:
+                        logger.info("Channel configs table creation completed successfully")
+                    else:
+                        logger.warning("Channel configs table creation failed")
+                except Exception as migration_error:
+                    logger.error("Table creation error: %s", migration_error)
+                    # Don't fail startup if migration fails
+                
+                # Fix validation history table schema
+                try:
+                    from fix_validation_history_table import fix_validation_history_table
+                    logger.info("Fixing validation history table schema...")
+                    fix_success = fix_validation_history_table()
+                    if fix_success:
+                        logger.info("Validation history table fix completed successfully")
+                    else:
+                        logger.warning("Validation history table fix failed")
+                except Exception as fix_error:
+                    logger.error("Validation history table fix error: %s", fix_error)
+                    # Don't fail startup if fix fails
+                
+            except Exception as e:
+                logger.error("Error creating database tables: %s", e)
     
     # Initialize periodic validation
+    credentials_cache = TTLCache(maxsize=10000, ttl=app.config['CREDENTIALS_CACHE_TTL'])
+    # Registered so the credentials invalidation hook can clear it too
+    app.extensions['credentials_cache'] = credentials_cache
+    
+    # Development fallback credentials, read once per application
+    fallback_bot_token = os.getenv('TELEGRAM_BOT_TOKEN', 'dummy_token')
+    fallback_bot_id = os.getenv('TELEGRAM_BOT_ID')
+    
     def get_bot_credentials(bot_id):
         """
         Get bot credentials for an account using direct database access
         
+        Results are cached per bot_id; failed lookups are cached for a shorter
+        time so a missing account doesn't hit the lookup on every tick.
+        
         Args:
             bot_id: Bot ID (e.g., 262662172) - this is the Telegram bot ID
             
@@ -120,25 +126,40 @@ def create_app(config_name=None):
             dict: Bot credentials with bot_token and bot_id
         """
         from utils.account_lookup import get_bot_credentials_from_db
-        try:
-            # Use direct database lookup instead of Auth Service API
-            logger.info(f"Getting bot credentials for bot_id {bot_id}")
-            return get_bot_credentials_from_db(bot_id)
-        except Exception as e:
-            logger.error(f"Error getting bot credentials for bot_id {bot_id}: {str(e)}")
+        credentials = credentials_cache.get(bot_id)
+        
+        if credentials is None:
+            try:
+                # Use direct database lookup instead of Auth Service API
+                logger.info("Getting bot credentials for bot_id %s", bot_id)
+                credentials = get_bot_credentials_from_db(bot_id)
+                credentials_cache.set(bot_id, credentials)
+            except Exception as e:
+                logger.error("Error getting bot credentials for bot_id %s: %s", bot_id, e)
+                credentials = {}
+                credentials_cache.set(bot_id, credentials, ttl=app.config['CREDENTIALS_NEGATIVE_CACHE_TTL'])
+        
+        if not credentials:
             # Fallback to environment variables for development
             return {
-                'bot_token': os.getenv('TELEGRAM_BOT_TOKEN', 'dummy_token'),
-                'bot_id': int(os.getenv('TELEGRAM_BOT_ID', bot_id))
+                'bot_token': fallback_bot_token,
+                'bot_id': int(fallback_bot_id if fallback_bot_id is not None else bot_id)
             }
+        
+        return credentials
     
-    # Initialize and start periodic validation
+    # Initialize periodic validation; the scheduler itself only runs in the
+    # dedicated worker process (see worker.py) so web workers don't duplicate it
     try:
-        initialize_periodic_validation(get_bot_credentials)
-        start_periodic_validation()
-        logger.info("Periodic validation initialized and started")
+        from tasks import initialize_periodic_validation, start_periodic_validation
+        initialize_periodic_validation(get_bot_credentials, app)
+        if app.config['RUN_SCHEDULER']:
+            start_periodic_validation()
+            logger.info("Periodic validation initialized and started")
+        else:
+            logger.info("Periodic validation initialized (scheduler disabled in this process)")
     except Exception as e:
-        logger.error(f"Error initializing periodic validation: {str(e)}")
+        logger.error("Error initializing periodic validation: %s", e)
     
     # Add error handlers
     @app.errorhandler(404)
@@ -165,36 +186,39 @@ def create_app(config_name=None):
             'error_code': 'BAD_REQUEST'
         }, 400
     
-    # Add a root endpoint
+    # Add a root endpoint (the payload is static, so it is built once)
+    root_info = {
+        'service': app.config['SERVICE_NAME'],
+        'version': '1.1.0',  # Updated version after bot_token fix
+        'status': 'running',
+        'endpoints': {
+            'health': '/health',
+            'channels': '/api/channels/*'
+        }
+    }
+    
     @app.route('/')
     def root():
-        return {
-            'service': app.config['SERVICE_NAME'],
-            'version': '1.1.0',  # Updated version after bot_token fix
-            'status': 'running',
-            'endpoints': {
-                'health': '/health',
-                'channels': '/api/channels/*'
-            }
-        }
+        return root_info
     
-    # Add shutdown handler
-    @app.teardown_appcontext
-    def shutdown_session(exception=None):
-        db.session.remove()
+    # Session cleanup is handled by Flask-SQLAlchemy, which removes the
+    # scoped session (returning its connection to the pool) on teardown
     
-    logger.info(f"Flask application created with config: {config_name}")
+    logger.info("Flask application created with config: %s", config_name)
     return app
 
-# Create the application instance
-app = create_app()
+# The application is created by the WSGI server (gunicorn 'app:create_app()')
+# or below, so importing this module only loads the factory
 
 if __name__ == '__main__':
+    # Create the application instance
+    app = create_app()
+    
     # Get configuration from environment
     port = int(os.getenv('PORT', app.config['SERVICE_PORT']))
     debug = os.getenv('FLASK_DEBUG', 'False').lower() == 'true'
     
-    logger.info(f"Starting Channel Management Service on port {port}")
+    logger.info("Starting Channel Management Service on port %s", port)
     
     # Run the application
     app.run(
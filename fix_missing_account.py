@@ -7,221 +7,300 @@ Run this script in the production environment to create the missing account reco
 import os
 import sys
 import logging
-from datetime import datetime
+import threading
 
-# Configure logging
+# Configure logging - script output goes to stdout through a single handler
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+output_handler = logging.StreamHandler(sys.stdout)
+output_handler.setFormatter(logging.Formatter('%(message)s'))
+logger.addHandler(output_handler)
+logger.propagate = False
+
+# Read once at import; the script only ever connects to this database
+DATABASE_URL = os.getenv('DATABASE_URL')
+
+# Account this script restores, and the Channel Service endpoint that reads it.
+# The bot token is a secret and comes from the environment only.
+BOT_ID = int(os.getenv('SEED_BOT_ID', 262662172))
+BOT_TOKEN = os.getenv('SEED_BOT_TOKEN')
+CHANNEL_ENDPOINT = f"https://telegive-channel-production.up.railway.app/api/accounts/{BOT_ID}/channel"
+
+# Accounts to (re)create: (bot_id, bot_username, bot_name, bot_token, is_active);
+# nothing is seeded when SEED_BOT_TOKEN is not set
+MISSING_ACCOUNTS = [
+    (BOT_ID, os.getenv('SEED_BOT_USERNAME', 'prohelpBot'), os.getenv('SEED_BOT_NAME', 'helper'), BOT_TOKEN, True),
+] if BOT_TOKEN else []
+
+# Connections are pooled so repeated calls in one process skip the connect/TLS/auth handshake
+_POOL = None
+_POOL_LOCK = threading.Lock()
+
+def _get_pool():
+    """Create the connection pool on first use and return it"""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            from psycopg2.pool import ThreadedConnectionPool
+            # psycopg2 takes the URL as-is, keeping query parameters such as sslmode
+            _POOL = ThreadedConnectionPool(1, 4, DATABASE_URL, connect_timeout=5, application_name='fix_missing_account')
+        return _POOL
+
+# Keep-alive HTTP session for the post-fix API checks
+_SESSION = None
+
+def _get_session():
+    """Create the HTTP session on first use and return it"""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        _SESSION = requests.Session()
+        # Retry connection failures so a cold start doesn't fail the check
+        _SESSION.mount('https://', HTTPAdapter(max_retries=2))
+    return _SESSION
+
+def close_pool():
+    """Close all pooled connections"""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is not None:
+            _POOL.closeall()
+            _POOL = None
+
+def insert_accounts(cursor, accounts, page_size=1000):
+    """
+    Insert account rows with one multi-row INSERT per page
+    
+    Rows whose bot_id already exists are left unchanged but still returned,
+    with was_inserted False.
+    
+    Args:
+        cursor: psycopg2 cursor
+        accounts: Sequence of (bot_id, bot_username, bot_name, bot_token, is_active) tuples
+        page_size: Rows sent per statement
+    
+    Returns:
+        list: Account rows (id, bot_id, bot_username, bot_name, is_active, created_at, was_inserted)
+    """
+    from psycopg2.extras import execute_values
+    
+    return execute_values(cursor, """
+        INSERT INTO accounts (
+            bot_id,
+            bot_username,
+            bot_name,
+            bot_token,
+            is_active,
+            created_at,
+            updated_at
+        ) VALUES %s
+        ON CONFLICT (bot_id) DO UPDATE SET updated_at = accounts.updated_at
+        RETURNING id, bot_id, bot_username, bot_name, is_active, created_at, (xmax = 0) AS was_inserted
+    """, accounts, template='(%s, %s, %s, %s, %s, NOW(), NOW())', page_size=page_size, fetch=True)
+
+def ensure_bot_id_unique(conn):
+    """
+    Make sure accounts.bot_id has a valid unique index
+    
+    ON CONFLICT (bot_id) needs one, and it turns bot_id lookups into a single
+    index probe. The index is built CONCURRENTLY so it doesn't block the Auth
+    Service's traffic; nothing is built when a valid unique index on bot_id
+    exists. An interrupted or failed concurrent build leaves an INVALID
+    uq_accounts_bot_id behind, which is dropped and built again.
+    
+    Args:
+        conn: psycopg2 connection with no transaction in progress
+    
+    Returns:
+        str: 'exists', 'created' or 'rebuilt' (an invalid index was replaced)
+    
+    Raises:
+        psycopg2.Error: If the index can't be built (e.g. duplicate bot_ids)
+    """
+    # CREATE/DROP INDEX CONCURRENTLY can't run inside a transaction block
+    conn.autocommit = True
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("""
+                SELECT EXISTS (
+                    SELECT 1
+                    FROM pg_index i
+                    JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = i.indkey[0]
+                    WHERE i.indrelid = 'accounts'::regclass
+                      AND i.indisunique
+                      AND i.indisvalid
+                      AND i.indnatts = 1
+                      AND a.attname = 'bot_id'
+                ),
+                EXISTS (
+                    SELECT 1
+                    FROM pg_index i
+                    JOIN pg_class c ON c.oid = i.indexrelid
+                    WHERE i.indrelid = 'accounts'::regclass
+                      AND c.relname = 'uq_accounts_bot_id'
+                      AND NOT i.indisvalid
+                )
+            """)
+            has_valid_index, has_invalid_index = cursor.fetchone()
+            if has_valid_index:
+                return 'exists'
+            
+            if has_invalid_index:
+                cursor.execute("DROP INDEX CONCURRENTLY IF EXISTS uq_accounts_bot_id")
+            
+            # No IF NOT EXISTS: if the name is taken by some other index, fail
+            # here rather than at the ON CONFLICT (bot_id) upsert
+            cursor.execute("CREATE UNIQUE INDEX CONCURRENTLY uq_accounts_bot_id ON accounts (bot_id)")
+            return 'rebuilt' if has_invalid_index else 'created'
+    finally:
+        conn.autocommit = False
+
 def fix_missing_account():
     """
-    Create the missing account record for bot_id 262662172
+    Create the missing account record for SEED_BOT_ID
     This script should be run in the production environment with database access
+    
+    Returns True without touching the database when SEED_BOT_TOKEN is not set.
     """
     
-    print("🔧 Production Database Fix - Creating Missing Account")
-    print("=" * 60)
+    logger.info("🔧 Production Database Fix - Creating Missing Account")
+    logger.info("=" * 60)
     
+    if not MISSING_ACCOUNTS:
+        logger.info("ℹ️ SEED_BOT_TOKEN not set - no account to create, skipping")
+        return True
+    
+    pool = conn = None
     try:
-        import psycopg2
-        from urllib.parse import urlparse
+        from psycopg2.extras import NamedTupleCursor
         
-        # Get database URL from environment
-        database_url = os.getenv('DATABASE_URL')
+        database_url = DATABASE_URL
         if not database_url:
-            print("❌ DATABASE_URL environment variable not found")
-            print("   This script must be run in the production environment")
+            logger.error("❌ DATABASE_URL environment variable not found")
+            logger.info("   This script must be run in the production environment")
             return False
         
-        print(f"✅ Found DATABASE_URL: {database_url[:50]}...")
-        
-        # Parse database URL
-        url = urlparse(database_url)
+        logger.info(f"✅ Found DATABASE_URL: {database_url[:50]}...")
         
         # Connect to database
-        print("\n1. Connecting to database...")
-        conn = psycopg2.connect(database_url)
-        cursor = conn.cursor()
-        print("   ✅ Database connection successful")
-        
-        # Check if account already exists
-        print("\n2. Checking if account exists...")
-        cursor.execute("""
-            SELECT id, bot_id, bot_username, bot_name, is_active 
-            FROM accounts 
-            WHERE bot_id = %s
-        """, (262662172,))
-        
-        existing_account = cursor.fetchone()
+        logger.info("\n1. Connecting to database...")
+        pool = _get_pool()
+        conn = pool.getconn()
+        logger.info("   ✅ Database connection successful")
         
-        if existing_account:
-            print(f"   ✅ Account already exists:")
-            print(f"      Database ID: {existing_account[0]}")
-            print(f"      Bot ID: {existing_account[1]}")
-            print(f"      Username: {existing_account[2]}")
-            print(f"      Name: {existing_account[3]}")
-            print(f"      Active: {existing_account[4]}")
-            print(f"\n   No action needed - account exists!")
-            return True
-        
-        print(f"   ❌ Account with bot_id 262662172 not found")
-        
-        # Show existing accounts for reference
-        print("\n3. Showing existing accounts...")
-        cursor.execute("""
-            SELECT id, bot_id, bot_username, bot_name, is_active 
-            FROM accounts 
-            ORDER BY created_at DESC 
-            LIMIT 5
-        """)
-        
-        accounts = cursor.fetchall()
-        if accounts:
-            print(f"   Found {len(accounts)} recent accounts:")
-            for acc in accounts:
-                print(f"      ID: {acc[0]}, Bot ID: {acc[1]}, Username: {acc[2]}, Name: {acc[3]}, Active: {acc[4]}")
+        index_status = ensure_bot_id_unique(conn)
+        if index_status == 'created':
+            logger.info("   ✅ Created unique index uq_accounts_bot_id on accounts.bot_id")
+        elif index_status == 'rebuilt':
+            logger.info("   ✅ Replaced invalid index uq_accounts_bot_id with a valid unique index")
         else:
-            print(f"   No accounts found in database")
-        
-        # Create the missing account
-        print(f"\n4. Creating missing account...")
-        cursor.execute("""
-            INSERT INTO accounts (
-                bot_id,
-                bot_username,
-                bot_name,
-                bot_token,
-                is_active,
-                created_at,
-                updated_at
-            ) VALUES (
-                %s, %s, %s, %s, %s, %s, %s
-            )
-            RETURNING id, bot_id, bot_username
-        """, (
-            262662172,
-            'prohelpBot',
-            'helper',
-            '262662172:AAGyAYVzuFFe23GagWY-FnP2NlAQRy_JsRk',
-            True,
-            datetime.now(),
-            datetime.now()
-        ))
-        
-        new_account = cursor.fetchone()
-        conn.commit()
+            logger.info("   ✅ accounts.bot_id already has a valid unique index")
         
-        print(f"   ✅ Account created successfully:")
-        print(f"      Database ID: {new_account[0]}")
-        print(f"      Bot ID: {new_account[1]}")
-        print(f"      Username: {new_account[2]}")
+        # Create the account, or read it back if it already exists, in one
+        # statement (no separate existence check, no check-then-insert race)
+        logger.info("\n2. Creating missing account (or finding the existing one)...")
+        with conn:  # commits on success, rolls back on error
+            # Rows come back as namedtuples; psycopg2 builds and caches the row class
+            with conn.cursor(cursor_factory=NamedTupleCursor) as cursor:
+                account = insert_accounts(cursor, MISSING_ACCOUNTS)[0]
         
-        # Verify the account was created
-        print(f"\n5. Verifying account creation...")
-        cursor.execute("""
-            SELECT id, bot_id, bot_username, bot_name, is_active, created_at
-            FROM accounts 
-            WHERE bot_id = %s
-        """, (262662172,))
-        
-        verified_account = cursor.fetchone()
-        if verified_account:
-            print(f"   ✅ Verification successful:")
-            print(f"      Database ID: {verified_account[0]}")
-            print(f"      Bot ID: {verified_account[1]}")
-            print(f"      Username: {verified_account[2]}")
-            print(f"      Name: {verified_account[3]}")
-            print(f"      Active: {verified_account[4]}")
-            print(f"      Created: {verified_account[5]}")
+        if account.was_inserted:
+            logger.info("   ✅ Account created successfully:")
         else:
-            print(f"   ❌ Verification failed - account not found after creation")
-            return False
-        
-        cursor.close()
-        conn.close()
+            logger.info("   ✅ Account already exists - no action needed:")
+        logger.info(f"      Database ID: {account.id}")
+        logger.info(f"      Bot ID: {account.bot_id}")
+        logger.info(f"      Username: {account.bot_username}")
+        logger.info(f"      Name: {account.bot_name}")
+        logger.info(f"      Active: {account.is_active}")
+        logger.info(f"      Created: {account.created_at}")
         
-        print(f"\n✅ Database fix completed successfully!")
-        print(f"\n🧪 Next step: Test the Channel Service API")
-        print(f"   curl https://telegive-channel-production.up.railway.app/api/accounts/262662172/channel")
-        print(f"   Expected: 'CHANNEL_NOT_CONFIGURED' (not 'ACCOUNT_NOT_FOUND')")
+        logger.info("\n✅ Database fix completed successfully!")
+        logger.info("\n🧪 Next step: Test the Channel Service API")
+        logger.info(f"   curl {CHANNEL_ENDPOINT}")
+        logger.info("   Expected: 'CHANNEL_NOT_CONFIGURED' (not 'ACCOUNT_NOT_FOUND')")
         
         return True
         
     except ImportError:
-        print("❌ psycopg2 not installed. Install with: pip install psycopg2-binary")
+        logger.error("❌ psycopg2 not installed. Install with: pip install psycopg2-binary")
         return False
     except Exception as e:
-        print(f"❌ Database error: {str(e)}")
-        if 'conn' in locals():
-            conn.rollback()
-            conn.close()
+        logger.error(f"❌ Database error: {str(e)}")
         return False
+    finally:
+        # Every exit path hands the connection back to the pool
+        if conn is not None:
+            pool.putconn(conn)
 
 def test_channel_service_api():
     """Test the Channel Service API after database fix"""
     
-    print(f"\n🧪 Testing Channel Service API")
-    print("=" * 35)
+    logger.info("\n🧪 Testing Channel Service API")
+    logger.info("=" * 35)
     
     try:
-        import requests
+        session = _get_session()
         
         # Test account lookup
-        print(f"Testing: GET /api/accounts/262662172/channel")
-        response = requests.get(
-            "https://telegive-channel-production.up.railway.app/api/accounts/262662172/channel",
+        logger.info(f"Testing: GET /api/accounts/{BOT_ID}/channel")
+        response = session.get(
+            CHANNEL_ENDPOINT,
             timeout=10
         )
         
-        print(f"Status Code: {response.status_code}")
+        logger.info(f"Status Code: {response.status_code}")
         data = response.json()
-        print(f"Response: {data}")
+        logger.info(f"Response: {data}")
         
         if response.status_code == 404 and data.get('code') == 'CHANNEL_NOT_CONFIGURED':
-            print(f"✅ SUCCESS: Account found, no channel configured (expected)")
+            logger.info("✅ SUCCESS: Account found, no channel configured (expected)")
             return True
         elif response.status_code == 404 and data.get('code') == 'ACCOUNT_NOT_FOUND':
-            print(f"❌ FAILED: Account still not found - database fix didn't work")
+            logger.error("❌ FAILED: Account still not found - database fix didn't work")
             return False
         elif response.status_code == 200 and data.get('success'):
-            print(f"✅ SUCCESS: Account found with existing channel configuration")
+            logger.info("✅ SUCCESS: Account found with existing channel configuration")
             return True
         else:
-            print(f"❓ UNEXPECTED: {data}")
+            logger.warning(f"❓ UNEXPECTED: {data}")
             return False
             
     except ImportError:
-        print("❌ requests not installed. Install with: pip install requests")
+        logger.error("❌ requests not installed. Install with: pip install requests")
         return False
     except Exception as e:
-        print(f"❌ Error testing API: {str(e)}")
+        logger.error(f"❌ Error testing API: {str(e)}")
         return False
 
 if __name__ == "__main__":
-    print("🔧 Production Database Fix for bot_id 262662172")
-    print("=" * 60)
-    print("This script creates the missing account record in the shared database")
-    print("Run this script in the production environment with DATABASE_URL access")
-    print("=" * 60)
+    logger.info(f"🔧 Production Database Fix for bot_id {BOT_ID}")
+    logger.info("=" * 60)
+    logger.info("This script creates the missing account record in the shared database")
+    logger.info("Run this script in the production environment with DATABASE_URL access")
+    logger.info("=" * 60)
     
     # Fix the database
     success = fix_missing_account()
+    close_pool()
     
-    if success:
+    if success and MISSING_ACCOUNTS:
         # Test the API
-        print(f"\n" + "="*60)
+        logger.info("\n" + "="*60)
         test_channel_service_api()
     
-    print(f"\n🎯 Database fix script completed!")
+    logger.info("\n🎯 Database fix script completed!")
     
     if success:
-        print(f"\n✅ NEXT STEPS:")
-        print(f"1. Test the Channel Service API manually")
-        print(f"2. Test the frontend channel configuration")
-        print(f"3. Verify end-to-end channel setup flow")
+        logger.info("\n✅ NEXT STEPS:")
+        logger.info("1. Test the Channel Service API manually")
+        logger.info("2. Test the frontend channel configuration")
+        logger.info("3. Verify end-to-end channel setup flow")
     else:
-        print(f"\n❌ TROUBLESHOOTING:")
-        print(f"1. Ensure this script runs in production environment")
-        print(f"2. Verify DATABASE_URL environment variable is set")
-        print(f"3. Check database connection and permissions")
+        logger.error("\n❌ TROUBLESHOOTING:")
+        logger.info("1. Ensure this script runs in production environment")
+        logger.info("2. Verify DATABASE_URL environment variable is set")
+        logger.info("3. Check database connection and permissions")
 
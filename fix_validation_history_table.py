@@ -7,43 +7,63 @@ This script will rename columns to match what the model expects
 import os
 import sys
 import logging
+import functools
 from datetime import datetime
 
 # Add the current directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from flask import Flask
-from models import db
+from sqlalchemy import create_engine, text
 from config.settings import Config
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def create_app():
-    """Create Flask app for database operations"""
-    app = Flask(__name__)
-    app.config.from_object(Config)
-    db.init_app(app)
-    return app
+TABLE_NAME = 'channel_validation_history'
 
-def fix_validation_history_table():
-    """Fix the validation history table schema"""
+# Legacy column names and the names the model expects
+COLUMN_RENAMES = {
+    'result': 'validation_result',
+    'permissions': 'permissions_snapshot',
+    'created_at': 'validated_at'
+}
+
+@functools.lru_cache(maxsize=1)
+def create_script_engine():
+    """Create (once) a single-connection engine for running this script standalone"""
+    return create_engine(Config.DATABASE_URL, pool_size=1, max_overflow=0)
+
+def fix_validation_history_table(connection=None):
+    """
+    Fix the validation history table schema
+    
+    Args:
+        connection: Session or connection to run on (defaults to db.session)
+    """
+    if connection is None:
+        # Imported here so standalone runs don't load Flask and the models
+        from models import db
+        connection = db.session
+    
     try:
         logger.info("🔧 Fixing channel_validation_history table schema...")
         
-        # Check if the table exists
-        result = db.session.execute(db.text("""
-            SELECT EXISTS (
-                SELECT FROM information_schema.tables 
-                WHERE table_name = 'channel_validation_history'
-            );
-        """))
+        # Read the current columns (types are kept to report the final schema);
+        # no columns means the table doesn't exist, so one query covers both checks
+        result = connection.execute(text("""
+            SELECT column_name, data_type 
+            FROM information_schema.columns 
+            WHERE table_name = :table_name
+            ORDER BY ordinal_position;
+        """), {'table_name': TABLE_NAME})
+        
+        schema = result.fetchall()
         
-        if not result.scalar():
+        if not schema:
             logger.info("📋 Table doesn't exist, creating with correct schema...")
             # Create the table with correct schema
-            db.session.execute(db.text("""
+            connection.execute(text("""
                 CREATE TABLE channel_validation_history (
                     id BIGSERIAL PRIMARY KEY,
                     channel_config_id BIGINT NOT NULL,
@@ -55,89 +75,75 @@ def fix_validation_history_table():
                 );
             """))
             
-            db.session.execute(db.text("""
+            connection.execute(text("""
                 CREATE INDEX idx_validation_history_config_id 
                 ON channel_validation_history(channel_config_id);
             """))
             
-            db.session.commit()
+            connection.commit()
             logger.info("✅ Table created with correct schema")
             return True
         
-        # Check current columns
-        result = db.session.execute(db.text("""
-            SELECT column_name 
-            FROM information_schema.columns 
-            WHERE table_name = 'channel_validation_history'
-            ORDER BY ordinal_position;
-        """))
-        
-        columns = [row[0] for row in result.fetchall()]
+        columns = [column_name for column_name, _ in schema]
         logger.info(f"📋 Current columns: {columns}")
         
-        # Check if we need to rename columns
-        needs_fix = False
+        # Collect every needed change and apply them in one DO block, so the
+        # table is altered in a single round trip
+        statements = []
         
-        if 'result' in columns and 'validation_result' not in columns:
-            logger.info("🔧 Renaming 'result' to 'validation_result'...")
-            db.session.execute(db.text("""
-                ALTER TABLE channel_validation_history 
-                RENAME COLUMN result TO validation_result;
-            """))
-            needs_fix = True
+        renamed = {
+            old_name: new_name
+            for old_name, new_name in COLUMN_RENAMES.items()
+            if old_name in columns and new_name not in columns
+        }
+        for old_name, new_name in renamed.items():
+            logger.info(f"🔧 Renaming '{old_name}' to '{new_name}'...")
+            statements.append(f"ALTER TABLE {TABLE_NAME} RENAME COLUMN {old_name} TO {new_name};")
         
-        if 'permissions' in columns and 'permissions_snapshot' not in columns:
-            logger.info("🔧 Renaming 'permissions' to 'permissions_snapshot'...")
-            db.session.execute(db.text("""
-                ALTER TABLE channel_validation_history 
-                RENAME COLUMN permissions TO permissions_snapshot;
-            """))
-            needs_fix = True
-        
-        if 'created_at' in columns and 'validated_at' not in columns:
-            logger.info("🔧 Renaming 'created_at' to 'validated_at'...")
-            db.session.execute(db.text("""
-                ALTER TABLE channel_validation_history 
-                RENAME COLUMN created_at TO validated_at;
-            """))
-            needs_fix = True
+        # Tables created from the old db.JSON model use json; the model now expects jsonb
+        retyped = {}
+        column_types = dict(schema)
+        if column_types.get('permissions_snapshot', column_types.get('permissions')) == 'json':
+            logger.info("🔧 Converting 'permissions_snapshot' to jsonb...")
+            statements.append(
+                f"ALTER TABLE {TABLE_NAME} ALTER COLUMN permissions_snapshot TYPE jsonb "
+                "USING permissions_snapshot::jsonb;"
+            )
+            retyped['permissions_snapshot'] = 'jsonb'
         
-        if needs_fix:
-            db.session.commit()
+        if statements:
+            connection.execute(text(f"DO $$ BEGIN {' '.join(statements)} END $$;"))
+            connection.commit()
             logger.info("✅ Table schema fixed successfully")
         else:
             logger.info("✅ Table schema already correct")
         
-        # Verify the final schema
-        result = db.session.execute(db.text("""
-            SELECT column_name, data_type 
-            FROM information_schema.columns 
-            WHERE table_name = 'channel_validation_history'
-            ORDER BY ordinal_position;
-        """))
-        
+        # Report the final schema (renames and retypes don't change order)
         logger.info("📋 Final schema:")
-        for column_name, data_type in result.fetchall():
-            logger.info(f"   - {column_name}: {data_type}")
+        for column_name, data_type in schema:
+            column_name = renamed.get(column_name, column_name)
+            logger.info(f"   - {column_name}: {retyped.get(column_name, data_type)}")
         
         return True
         
     except Exception as e:
         logger.error(f"❌ Error fixing table schema: {str(e)}")
-        db.session.rollback()
+        connection.rollback()
         return False
 
 def main():
     """Main function"""
-    print("🔧 Fix Channel Validation History Table Schema")
-    print("==============================================")
-    print(f"Timestamp: {datetime.now().isoformat()}")
-    print()
+    # One write for the whole banner
+    print(
+        "🔧 Fix Channel Validation History Table Schema\n"
+        "==============================================\n"
+        f"Timestamp: {datetime.now().isoformat()}\n"
+    )
     
-    app = create_app()
+    engine = create_script_engine()
     
-    with app.app_context():
-        success = fix_validation_history_table()
+    with engine.connect() as connection:
+        success = fix_validation_history_table(connection)
         
         if success:
             print("\n✅ Schema fix completed successfully!")
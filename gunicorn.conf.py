@@ -0,0 +1,38 @@
+"""
+Gunicorn configuration for Channel Management Service
+The app is created once in the master and shared with the forked workers
+"""
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8002')}"
+workers = int(os.getenv('WEB_CONCURRENCY', 2))
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gthread')
+# Requests mostly wait on the database and the Auth Service, so each worker
+# runs more threads than cores; keep this within DB_POOL_SIZE + DB_MAX_OVERFLOW
+threads = int(os.getenv('GUNICORN_THREADS', 8))
+
+if worker_class == 'gevent':
+    # Patch before the app is preloaded so requests/urllib3 sockets, locks and
+    # the thread pools it creates are cooperative; each worker then serves
+    # many concurrent requests, still bounded by the database pool
+    from gevent import monkey
+    monkey.patch_all()
+    
+    worker_connections = int(os.getenv('GUNICORN_WORKER_CONNECTIONS', 1000))
+timeout = 120
+
+# Build the app (config, blueprints, CORS) once before forking
+preload_app = True
+
+def post_fork(server, worker):
+    """Give each worker its own database connections instead of the master's"""
+    from models import db
+    
+    if worker_class == 'gevent':
+        # psycopg2 waits on the server in C; make it yield to other greenlets
+        from psycogreen.gevent import patch_psycopg
+        patch_psycopg()
+    
+    app = server.app.wsgi()
+    with app.app_context():
+        db.engine.dispose(close=False)
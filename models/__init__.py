@@ -1,5 +1,14 @@
-from .channel_config import ChannelConfig, db
+from flask_sqlalchemy import SQLAlchemy
+
+# Single SQLAlchemy instance shared by every model (defined before the model
+# imports below, which pull it from this package).
+# Objects stay loaded after commit: handlers serialize what they just wrote,
+# server-generated columns come back through RETURNING (eager_defaults), and
+# the session is removed at the end of each request, so expiring everything
+# on commit would only cost a refresh SELECT per object.
+db = SQLAlchemy(session_options={'expire_on_commit': False})
+
+from .channel_config import ChannelConfig
 from .validation_history import ChannelValidationHistory
 
 __all__ = ['ChannelConfig', 'ChannelValidationHistory', 'db']
-
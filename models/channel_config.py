@@ -1,14 +1,13 @@
-from flask_sqlalchemy import SQLAlchemy
-from datetime import datetime
 import json
-
-db = SQLAlchemy()
+from sqlalchemy import inspect
+from sqlalchemy.orm import load_only
+from models import db
 
 class ChannelConfig(db.Model):
     __tablename__ = 'channel_configs'
     
     id = db.Column(db.BigInteger, primary_key=True, autoincrement=True)
-    account_id = db.Column(db.BigInteger, nullable=False, index=True)
+    account_id = db.Column(db.BigInteger, nullable=False)  # indexed by ix_channel_configs_account_id_cov
     channel_id = db.Column(db.BigInteger, nullable=False, index=True)
     channel_username = db.Column(db.String(100), nullable=False)
     channel_title = db.Column(db.String(255), nullable=False)
@@ -27,17 +26,102 @@ class ChannelConfig(db.Model):
     last_validation_at = db.Column(db.DateTime(timezone=True), default=None)
     validation_error = db.Column(db.Text, default=None)
     
-    # Timestamps
-    created_at = db.Column(db.DateTime(timezone=True), default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Timestamps (set by the database, not bound per row)
+    created_at = db.Column(db.DateTime(timezone=True), server_default=db.func.now())
+    updated_at = db.Column(db.DateTime(timezone=True), server_default=db.func.now(), onupdate=db.func.now())
+    
+    # Columns returned by the account channel endpoints; the account_id index
+    # carries them so those reads can be answered by an index-only scan
+    SUMMARY_COLUMNS = (
+        'id',
+        'channel_username',
+        'channel_title',
+        'channel_id',
+        'is_validated',
+        'last_validation_at',
+        'created_at',
+        'updated_at'
+    )
     
-    # Unique constraint: one channel per account (removed foreign key constraint)
+    # Unique index: one channel per account (removed foreign key constraint)
     __table_args__ = (
-        db.UniqueConstraint('account_id', name='uq_channel_configs_account_id'),
+        db.Index('ix_channel_configs_account_id_cov', 'account_id', unique=True,
+                 postgresql_include=list(SUMMARY_COLUMNS)),
+        # Range scans for channels due for periodic validation
+        db.Index('idx_channel_configs_last_validation_at', 'last_validation_at'),
     )
     
+    # Columns accepted by update_permissions
+    PERMISSION_FIELDS = frozenset((
+        'can_post_messages',
+        'can_edit_messages',
+        'can_send_media_messages',
+        'can_delete_messages',
+        'can_pin_messages'
+    ))
+    
+    # Also fetch updated_at with RETURNING when a row is updated
+    __mapper_args__ = {'eager_defaults': True}
+    
+    @classmethod
+    def get_by_account(cls, account_id, *options):
+        """
+        Get the channel configuration for an account (bot_id)
+        
+        account_id is unique, so like Session.get() for primary keys, a
+        configuration found once is kept for the lifetime of the session (one
+        request) and later lookups for the same account skip the query.
+        
+        Args:
+            account_id: Account (bot) ID
+            *options: Optional loader options for the query
+        
+        Returns:
+            ChannelConfig or None
+        """
+        by_account = db.session.info.setdefault('channel_configs_by_account', {})
+        
+        channel_config = by_account.get(account_id)
+        if channel_config is not None and inspect(channel_config).persistent:
+            return channel_config
+        
+        channel_config = cls.query.options(*options).filter_by(account_id=account_id).first()
+        if channel_config is not None:
+            by_account[account_id] = channel_config
+        return channel_config
+    
+    @classmethod
+    def get_by_accounts(cls, account_ids):
+        """
+        Get the channel configurations for several accounts in one query
+        
+        Args:
+            account_ids: Account (bot) IDs
+        
+        Returns:
+            dict: ChannelConfig instances keyed by account_id (accounts
+            without a configuration are left out)
+        """
+        by_account = db.session.info.setdefault('channel_configs_by_account', {})
+        
+        channel_configs = cls.query.filter(cls.account_id.in_(set(account_ids))).all()
+        for channel_config in channel_configs:
+            by_account[channel_config.account_id] = channel_config
+        
+        return {channel_config.account_id: channel_config for channel_config in channel_configs}
+    
+    @classmethod
+    def load_summary(cls):
+        """Loader option restricting a query to account_id and SUMMARY_COLUMNS"""
+        return load_only(*(getattr(cls, name) for name in cls.SUMMARY_COLUMNS), cls.account_id)
+    
     def to_dict(self):
         """Convert model to dictionary for JSON serialization"""
+        # Read each timestamp once; attribute access goes through the ORM descriptor
+        last_validation_at = self.last_validation_at
+        created_at = self.created_at
+        updated_at = self.updated_at
+        
         return {
             'id': self.id,
             'account_id': self.account_id,
@@ -54,10 +138,10 @@ class ChannelConfig(db.Model):
                 'can_pin_messages': self.can_pin_messages
             },
             'is_validated': self.is_validated,
-            'last_validation_at': self.last_validation_at.isoformat() if self.last_validation_at else None,
+            'last_validation_at': last_validation_at.isoformat() if last_validation_at else None,
             'validation_error': self.validation_error,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'created_at': created_at.isoformat() if created_at else None,
+            'updated_at': updated_at.isoformat() if updated_at else None
         }
     
     def get_permissions_dict(self):
@@ -73,9 +157,8 @@ class ChannelConfig(db.Model):
     def update_permissions(self, permissions_dict):
         """Update permissions from dictionary"""
         for permission, value in permissions_dict.items():
-            if hasattr(self, permission):
+            if permission in self.PERMISSION_FIELDS:
                 setattr(self, permission, value)
-        self.updated_at = datetime.utcnow()
     
     def __repr__(self):
         return f'<ChannelConfig {self.channel_username} for account {self.account_id}>'
@@ -1,8 +1,7 @@
-from flask_sqlalchemy import SQLAlchemy
-from datetime import datetime
 import json
-
-db = SQLAlchemy()
+from sqlalchemy import insert
+from sqlalchemy.dialects.postgresql import JSONB
+from models import db
 
 class ChannelValidationHistory(db.Model):
     __tablename__ = 'channel_validation_history'
@@ -12,11 +11,17 @@ class ChannelValidationHistory(db.Model):
     validation_type = db.Column(db.String(50), nullable=False)  # setup, permission_check, periodic
     validation_result = db.Column(db.Boolean, nullable=False)
     error_message = db.Column(db.Text, default=None)
-    permissions_snapshot = db.Column(db.JSON, default=None)  # JSONB in PostgreSQL
-    validated_at = db.Column(db.DateTime(timezone=True), default=datetime.utcnow)
+    permissions_snapshot = db.Column(db.JSON().with_variant(JSONB(), 'postgresql'), default=None)
+    validated_at = db.Column(db.DateTime(timezone=True), server_default=db.func.now())  # set by the database
+    
+    __table_args__ = (
+        # Range scans for statistics and history cleanup
+        db.Index('idx_validation_history_validated_at', 'validated_at'),
+    )
     
     def to_dict(self):
         """Convert model to dictionary for JSON serialization"""
+        validated_at = self.validated_at
         return {
             'id': self.id,
             'channel_config_id': self.channel_config_id,
@@ -24,7 +29,7 @@ class ChannelValidationHistory(db.Model):
             'validation_result': self.validation_result,
             'error_message': self.error_message,
             'permissions_snapshot': self.permissions_snapshot,
-            'validated_at': self.validated_at.isoformat() if self.validated_at else None
+            'validated_at': validated_at.isoformat() if validated_at else None
         }
     
     @classmethod
@@ -39,6 +44,21 @@ class ChannelValidationHistory(db.Model):
         )
         return record
     
+    @classmethod
+    def bulk_create(cls, records):
+        """
+        Insert several validation history records in one statement
+        
+        Uses the ORM bulk INSERT path, which the psycopg2 engine sends as a
+        multi-row INSERT instead of flushing one object at a time.
+        
+        Args:
+            records: List of dicts keyed by column attribute name
+        """
+        if not records:
+            return
+        db.session.execute(insert(cls), records)
+    
     def __repr__(self):
         return f'<ChannelValidationHistory {self.validation_type} for config {self.channel_config_id}: {self.validation_result}>'
 
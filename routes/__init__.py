@@ -1,7 +1,21 @@
-from .health import health_bp
-from .channels import channels_bp
-from .accounts import accounts_bp
-from .monitoring import monitoring_bp
+import importlib
 
-__all__ = ['health_bp', 'channels_bp', 'accounts_bp', 'monitoring_bp']
+# Blueprints are imported on first access (PEP 562), so importing one route
+# module (e.g. routes.health) doesn't load every view and its dependencies
+_BLUEPRINT_MODULES = {
+    'health_bp': '.health',
+    'channels_bp': '.channels',
+    'accounts_bp': '.accounts',
+    'monitoring_bp': '.monitoring'
+}
+
+def __getattr__(name):
+    module_name = _BLUEPRINT_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
+    blueprint = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = blueprint
+    return blueprint
+
+__all__ = ['health_bp', 'channels_bp', 'accounts_bp', 'monitoring_bp']
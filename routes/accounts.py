@@ -1,12 +1,97 @@
 from flask import Blueprint, request, jsonify
 import logging
 from datetime import datetime
+from sqlalchemy import insert, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from models import ChannelConfig, db
-from utils.account_lookup import get_bot_credentials_from_db, validate_account_exists
+from config.settings import Config
+from utils.serialization import StaticJSONResponse
+from utils.account_lookup import get_bot_credentials_from_db, get_account_with_channel
 
 logger = logging.getLogger(__name__)
 accounts_bp = Blueprint('accounts', __name__, url_prefix='/api/accounts')
 
+# Static parts of the 404 details; bot_id and timestamp are added per response
+ACCOUNT_NOT_FOUND_DETAILS = {
+    'suggestion': 'This usually indicates an account synchronization issue. Please try logging out and logging back in.',
+    'support_action': 'If the problem persists, contact support with this bot_id.'
+}
+CHANNEL_NOT_CONFIGURED_DETAILS = {
+    'suggestion': 'Please configure your channel first using the channel setup process.',
+    'next_steps': 'Use the channel verification endpoint to set up your channel.'
+}
+
+# Responses that never vary are encoded once at import
+PAYLOAD_TOO_LARGE_RESPONSE = StaticJSONResponse({
+    'success': False,
+    'error': 'Request body too large',
+    'code': 'PAYLOAD_TOO_LARGE'
+}, 413)
+INVALID_REQUEST_RESPONSE = StaticJSONResponse({
+    'success': False,
+    'error': 'No JSON data provided',
+    'code': 'INVALID_REQUEST'
+}, 400)
+INVALID_PERMISSIONS_RESPONSE = StaticJSONResponse({
+    'success': False,
+    'error': 'permissions must be an object',
+    'code': 'INVALID_PERMISSIONS'
+}, 400)
+SAVE_DATABASE_ERROR_RESPONSE = StaticJSONResponse({
+    'success': False,
+    'error': 'Database error while saving channel configuration',
+    'code': 'DATABASE_ERROR'
+}, 500)
+CHANNEL_DELETED_RESPONSE = StaticJSONResponse({
+    'success': True,
+    'message': 'Channel configuration deleted successfully'
+})
+NOTHING_TO_DELETE_RESPONSE = StaticJSONResponse({
+    'success': False,
+    'error': 'No channel configuration found to delete',
+    'code': 'CHANNEL_NOT_CONFIGURED'
+}, 404)
+DELETE_DATABASE_ERROR_RESPONSE = StaticJSONResponse({
+    'success': False,
+    'error': 'Database error while deleting channel configuration',
+    'code': 'DATABASE_ERROR'
+}, 500)
+INTERNAL_ERROR_RESPONSE = StaticJSONResponse({
+    'success': False,
+    'error': 'Internal server error',
+    'code': 'INTERNAL_ERROR'
+}, 500)
+
+# Request body keys accepted by save_account_channel and the columns they set
+CHANNEL_FIELD_COLUMNS = (
+    ('channel_username', 'channel_username'),
+    ('channel_title', 'channel_title'),
+    ('channel_id', 'channel_id'),
+    ('is_verified', 'is_validated'),
+    ('channel_type', 'channel_type'),
+    ('channel_member_count', 'channel_member_count')
+)
+
+# Body keys a new configuration needs (their columns are NOT NULL)
+REQUIRED_CHANNEL_FIELDS = ('channel_username', 'channel_title', 'channel_id')
+
+# Postgres SQLSTATE for unique_violation
+UNIQUE_VIOLATION = '23505'
+
+def is_unique_violation(error):
+    """
+    Check whether an IntegrityError was raised by a unique constraint
+    
+    Args:
+        error: IntegrityError from SQLAlchemy
+    
+    Returns:
+        bool: True for a unique violation (Postgres, or SQLite in tests)
+    """
+    orig = error.orig
+    return (getattr(orig, 'pgcode', None) == UNIQUE_VIOLATION or
+            getattr(orig, 'sqlite_errorname', None) == 'SQLITE_CONSTRAINT_UNIQUE')
+
 def get_bot_credentials(bot_id):
     """
     Get bot credentials for an account using direct database access
@@ -23,10 +108,10 @@ def get_bot_credentials(bot_id):
     try:
         # Use direct database lookup instead of Auth Service API
         # bot_id here is the Telegram bot ID (262662172)
-        logger.info(f"Looking up bot credentials for bot_id {bot_id}")
+        logger.info("Looking up bot credentials for bot_id %s", bot_id)
         return get_bot_credentials_from_db(bot_id)
     except Exception as e:
-        logger.error(f"Error getting bot credentials for bot_id {bot_id}: {str(e)}")
+        logger.error("Error getting bot credentials for bot_id %s: %s", bot_id, e)
         raise
 
 @accounts_bp.route('/<int:account_id>/channel', methods=['GET'])
@@ -38,43 +123,31 @@ def get_account_channel(account_id):
     Note: account_id is actually the bot_id (262662172)
     """
     try:
-        logger.info(f"Getting channel config for bot_id {account_id}")
+        logger.info("Getting channel config for bot_id %s", account_id)
         
-        # Validate account exists using bot_id
-        if not validate_account_exists(account_id):
-            logger.warning(f"Account with bot_id {account_id} not found in database")
+        # Validate account exists using bot_id while loading the channel
+        # configuration (in ChannelConfig, account_id stores the bot_id)
+        account_exists, channel_config = get_account_with_channel(account_id, ChannelConfig.load_summary())
+        if not account_exists:
+            logger.warning("Account with bot_id %s not found in database", account_id)
             return jsonify({
                 'success': False,
                 'error': f'Account with bot_id {account_id} not found in database. Please contact support or try logging in again.',
                 'code': 'ACCOUNT_NOT_FOUND',
-                'details': {
-                    'bot_id': account_id,
-                    'suggestion': 'This usually indicates an account synchronization issue. Please try logging out and logging back in.',
-                    'support_action': 'If the problem persists, contact support with this bot_id.',
-                    'timestamp': datetime.utcnow().isoformat() + 'Z'
-                }
+                'details': dict(ACCOUNT_NOT_FOUND_DETAILS, bot_id=account_id, timestamp=datetime.utcnow())
             }), 404
         
-        # Get channel configuration from database using bot_id as account_id
-        # Note: In ChannelConfig, account_id stores the bot_id (262662172)
-        channel_config = ChannelConfig.query.filter_by(account_id=account_id).first()
-        
         if not channel_config:
-            logger.info(f"No channel configuration found for bot_id {account_id}")
+            logger.info("No channel configuration found for bot_id %s", account_id)
             return jsonify({
                 'success': False,
                 'error': 'No channel configuration found',
                 'code': 'CHANNEL_NOT_CONFIGURED',
-                'details': {
-                    'bot_id': account_id,
-                    'suggestion': 'Please configure your channel first using the channel setup process.',
-                    'next_steps': 'Use the channel verification endpoint to set up your channel.',
-                    'timestamp': datetime.utcnow().isoformat() + 'Z'
-                }
+                'details': dict(CHANNEL_NOT_CONFIGURED_DETAILS, bot_id=account_id, timestamp=datetime.utcnow())
             }), 404
         
         # Return channel configuration
-        logger.info(f"Found channel configuration for bot_id {account_id}: {channel_config.channel_username}")
+        logger.info("Found channel configuration for bot_id %s: %s", account_id, channel_config.channel_username)
         return jsonify({
             'success': True,
             'channel': {
@@ -84,14 +157,15 @@ def get_account_channel(account_id):
                 'channel_title': channel_config.channel_title,
                 'channel_id': channel_config.channel_id,
                 'is_verified': channel_config.is_validated,
-                'verified_at': channel_config.last_validation_at.isoformat() + 'Z' if channel_config.last_validation_at else None,
-                'created_at': channel_config.created_at.isoformat() + 'Z' if channel_config.created_at else None,
-                'updated_at': channel_config.updated_at.isoformat() + 'Z' if channel_config.updated_at else None
+                'verified_at': channel_config.last_validation_at,
+                'created_at': channel_config.created_at,
+                'updated_at': channel_config.updated_at
             }
         }), 200
     
-    except Exception as e:
-        logger.error(f"Error in get_account_channel for bot_id {account_id}: {str(e)}")
+    # Anything else is unexpected and handled by the app's 500 error handler
+    except (SQLAlchemyError, ValueError) as e:
+        logger.error("Error in get_account_channel for bot_id %s: %s", account_id, e, exc_info=True)
         return jsonify({
             'success': False,
             'error': 'Internal server error',
@@ -99,7 +173,7 @@ def get_account_channel(account_id):
             'details': {
                 'bot_id': account_id,
                 'error_message': str(e),
-                'timestamp': datetime.utcnow().isoformat() + 'Z'
+                'timestamp': datetime.utcnow()
             }
         }), 500
 
@@ -112,72 +186,97 @@ def save_account_channel(account_id):
     Note: account_id is actually the bot_id (262662172)
     """
     try:
-        data = request.get_json()
+        # Reject oversized bodies before parsing; the parsed body is used once,
+        # so it isn't cached on the request
+        if request.content_length and request.content_length > Config.MAX_CHANNEL_PAYLOAD_BYTES:
+            return PAYLOAD_TOO_LARGE_RESPONSE()
         
-        if not data:
-            return jsonify({
-                'success': False,
-                'error': 'No JSON data provided',
-                'code': 'INVALID_REQUEST'
-            }), 400
+        data = request.get_json(cache=False, silent=True)
+        
+        if not isinstance(data, dict) or not data:
+            return INVALID_REQUEST_RESPONSE()
         
-        logger.info(f"Saving channel config for bot_id {account_id}: {data}")
+        logger.info("Saving channel config for bot_id %s: %s", account_id, data)
         
-        # Validate account exists using bot_id
-        if not validate_account_exists(account_id):
-            logger.warning(f"Account with bot_id {account_id} not found in database")
+        # Validate account exists using bot_id while loading the channel configuration
+        account_exists, channel_config = get_account_with_channel(account_id)
+        if not account_exists:
+            logger.warning("Account with bot_id %s not found in database", account_id)
             return jsonify({
                 'success': False,
                 'error': f'Account with bot_id {account_id} not found in database',
                 'code': 'ACCOUNT_NOT_FOUND'
             }), 404
         
-        # Get or create channel configuration
-        channel_config = ChannelConfig.query.filter_by(account_id=account_id).first()
+        # Columns to write, taken from the request body
+        fields = {column: data[key] for key, column in CHANNEL_FIELD_COLUMNS if key in data}
         
-        if not channel_config:
-            # Create new channel configuration
-            channel_config = ChannelConfig(
-                account_id=account_id,  # Store bot_id as account_id
-                created_at=datetime.utcnow()
-            )
-            db.session.add(channel_config)
-            logger.info(f"Created new channel config for bot_id {account_id}")
-        else:
-            logger.info(f"Updating existing channel config for bot_id {account_id}")
-        
-        # Update channel configuration fields
-        if 'channel_username' in data:
-            channel_config.channel_username = data['channel_username']
-        if 'channel_title' in data:
-            channel_config.channel_title = data['channel_title']
-        if 'channel_id' in data:
-            channel_config.channel_id = data['channel_id']
-        if 'is_verified' in data:
-            channel_config.is_validated = data['is_verified']
-        if 'channel_type' in data:
-            channel_config.channel_type = data['channel_type']
-        if 'channel_member_count' in data:
-            channel_config.channel_member_count = data['channel_member_count']
-        
-        # Update permissions if provided
+        # Update permissions if provided (only the known permission columns)
         if 'permissions' in data:
             permissions = data['permissions']
-            channel_config.can_post_messages = permissions.get('can_post_messages', False)
-            channel_config.can_edit_messages = permissions.get('can_edit_messages', False)
-            channel_config.can_send_media_messages = permissions.get('can_send_media_messages', False)
-            channel_config.can_delete_messages = permissions.get('can_delete_messages', False)
-            channel_config.can_pin_messages = permissions.get('can_pin_messages', False)
+            if not isinstance(permissions, dict):
+                return INVALID_PERMISSIONS_RESPONSE()
+            for permission in ChannelConfig.PERMISSION_FIELDS:
+                fields[permission] = permissions.get(permission, False)
+        
+        # Drop values the row already holds, so re-sending an unchanged
+        # configuration doesn't write (or bump updated_at)
+        if channel_config:
+            fields = {column: value for column, value in fields.items() if getattr(channel_config, column) != value}
         
-        # Update timestamps
-        channel_config.updated_at = datetime.utcnow()
-        if data.get('is_verified'):
-            channel_config.last_validation_at = datetime.utcnow()
+        # Stamp the verification only when the flag is being set (a repeated
+        # is_verified: true leaves the row alone); updated_at is bumped by the
+        # database on UPDATE
+        if fields.get('is_validated'):
+            fields['last_validation_at'] = datetime.utcnow()
+        
+        # Write with a single INSERT/UPDATE ... RETURNING statement instead of
+        # setting attributes and flushing through the unit of work
+        if not channel_config:
+            # Report missing columns as a bad request instead of letting the
+            # INSERT fail on NOT NULL
+            missing_fields = [key for key in REQUIRED_CHANNEL_FIELDS if fields.get(key) is None]
+            if missing_fields:
+                return jsonify({
+                    'success': False,
+                    'error': 'Missing required fields: ' + ', '.join(missing_fields),
+                    'code': 'MISSING_REQUIRED_FIELDS',
+                    'missing_fields': missing_fields
+                }), 400
+            
+            logger.info("Creating new channel config for bot_id %s", account_id)
+            statement = insert(ChannelConfig).values(account_id=account_id, **fields)  # Store bot_id as account_id
+        elif fields:
+            logger.info("Updating existing channel config for bot_id %s", account_id)
+            statement = update(ChannelConfig).where(ChannelConfig.id == channel_config.id).values(**fields)
+        else:
+            statement = None
         
         # Save to database
         try:
+            if statement is not None:
+                try:
+                    # Write inside a SAVEPOINT so a failed statement only rolls
+                    # back itself, not the session's transaction and state
+                    with db.session.begin_nested():
+                        channel_config = db.session.execute(statement.returning(ChannelConfig)).scalar_one()
+                except IntegrityError as integrity_error:
+                    # Only a duplicate account_id means another request won
+                    # the insert race; other violations are real errors
+                    if channel_config or not is_unique_violation(integrity_error):
+                        raise
+                    
+                    # A concurrent request created the configuration first
+                    logger.info("Channel config for bot_id %s was created concurrently, updating it", account_id)
+                    with db.session.begin_nested():
+                        channel_config = db.session.execute(
+                            update(ChannelConfig)
+                            .where(ChannelConfig.account_id == account_id)
+                            .values(**fields)
+                            .returning(ChannelConfig)
+                        ).scalar_one()
             db.session.commit()
-            logger.info(f"Successfully saved channel config for bot_id {account_id}")
+            logger.info("Successfully saved channel config for bot_id %s", account_id)
             
             return jsonify({
                 'success': True,
@@ -189,28 +288,20 @@ def save_account_channel(account_id):
                     'channel_title': channel_config.channel_title,
                     'channel_id': channel_config.channel_id,
                     'is_verified': channel_config.is_validated,
-                    'verified_at': channel_config.last_validation_at.isoformat() + 'Z' if channel_config.last_validation_at else None,
-                    'created_at': channel_config.created_at.isoformat() + 'Z' if channel_config.created_at else None,
-                    'updated_at': channel_config.updated_at.isoformat() + 'Z' if channel_config.updated_at else None
+                    'verified_at': channel_config.last_validation_at,
+                    'created_at': channel_config.created_at,
+                    'updated_at': channel_config.updated_at
                 }
             }), 200
             
-        except Exception as db_error:
+        except SQLAlchemyError as db_error:
             db.session.rollback()
-            logger.error(f"Database error saving channel config for bot_id {account_id}: {str(db_error)}")
-            return jsonify({
-                'success': False,
-                'error': 'Database error while saving channel configuration',
-                'code': 'DATABASE_ERROR'
-            }), 500
+            logger.error("Database error saving channel config for bot_id %s: %s", account_id, db_error, exc_info=True)
+            return SAVE_DATABASE_ERROR_RESPONSE()
     
-    except Exception as e:
-        logger.error(f"Error in save_account_channel for bot_id {account_id}: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': 'Internal server error',
-            'code': 'INTERNAL_ERROR'
-        }), 500
+    except (SQLAlchemyError, ValueError) as e:
+        logger.error("Error in save_account_channel for bot_id %s: %s", account_id, e, exc_info=True)
+        return INTERNAL_ERROR_RESPONSE()
 
 @accounts_bp.route('/<int:account_id>/channel', methods=['DELETE'])
 def delete_account_channel(account_id):
@@ -221,53 +312,36 @@ def delete_account_channel(account_id):
     Note: account_id is actually the bot_id (262662172)
     """
     try:
-        logger.info(f"Deleting channel config for bot_id {account_id}")
+        logger.info("Deleting channel config for bot_id %s", account_id)
         
-        # Validate account exists using bot_id
-        if not validate_account_exists(account_id):
-            logger.warning(f"Account with bot_id {account_id} not found in database")
+        # Validate account exists using bot_id while finding the channel configuration
+        account_exists, channel_config = get_account_with_channel(account_id)
+        if not account_exists:
+            logger.warning("Account with bot_id %s not found in database", account_id)
             return jsonify({
                 'success': False,
                 'error': f'Account with bot_id {account_id} not found in database',
                 'code': 'ACCOUNT_NOT_FOUND'
             }), 404
         
-        # Find channel configuration
-        channel_config = ChannelConfig.query.filter_by(account_id=account_id).first()
-        
         if not channel_config:
-            logger.info(f"No channel configuration found to delete for bot_id {account_id}")
-            return jsonify({
-                'success': False,
-                'error': 'No channel configuration found to delete',
-                'code': 'CHANNEL_NOT_CONFIGURED'
-            }), 404
+            logger.info("No channel configuration found to delete for bot_id %s", account_id)
+            return NOTHING_TO_DELETE_RESPONSE()
         
         # Delete channel configuration
         try:
             db.session.delete(channel_config)
             db.session.commit()
-            logger.info(f"Successfully deleted channel config for bot_id {account_id}")
+            logger.info("Successfully deleted channel config for bot_id %s", account_id)
             
-            return jsonify({
-                'success': True,
-                'message': 'Channel configuration deleted successfully'
-            }), 200
+            return CHANNEL_DELETED_RESPONSE()
             
-        except Exception as db_error:
+        except SQLAlchemyError as db_error:
             db.session.rollback()
-            logger.error(f"Database error deleting channel config for bot_id {account_id}: {str(db_error)}")
-            return jsonify({
-                'success': False,
-                'error': 'Database error while deleting channel configuration',
-                'code': 'DATABASE_ERROR'
-            }), 500
+            logger.error("Database error deleting channel config for bot_id %s: %s", account_id, db_error, exc_info=True)
+            return DELETE_DATABASE_ERROR_RESPONSE()
     
-    except Exception as e:
-        logger.error(f"Error in delete_account_channel for bot_id {account_id}: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': 'Internal server error',
-            'code': 'INTERNAL_ERROR'
-        }), 500
+    except (SQLAlchemyError, ValueError) as e:
+        logger.error("Error in delete_account_channel for bot_id %s: %s", account_id, e, exc_info=True)
+        return INTERNAL_ERROR_RESPONSE()
 
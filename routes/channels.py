@@ -1,21 +1,162 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, current_app, request, jsonify
 import logging
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from sqlalchemy.orm import load_only
+from werkzeug.exceptions import HTTPException
 from models import ChannelConfig, db
+from utils.cache import TTLCache
+from utils.rate_limit import TokenBucketLimiter, rate_limited
+from utils.serialization import StaticJSONResponse
 from utils import (
     setup_channel_configuration,
     validate_channel_permissions,
     revalidate_channel,
     get_channel_permission_status
 )
-from utils.account_lookup import get_bot_credentials_from_db, validate_account_exists
+from utils.account_lookup import (
+    get_bot_credentials_from_db,
+    validate_account_exists,
+    get_account_with_channel,
+    invalidate_account
+)
 from services import ChannelValidatorService, PermissionCheckerService
+from config.settings import Config
 
 logger = logging.getLogger(__name__)
 channels_bp = Blueprint('channels', __name__, url_prefix='/api/channels')
 
-# Rate limiting would be implemented here in production
-# For now, we'll add basic request validation
+# Runs independent Telegram calls of a channel verification side by side;
+# sized for two calls from each of gunicorn's (default 8) request threads so
+# concurrent verifications don't queue behind each other
+telegram_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix='telegram-verify')
+
+# Bot credentials rarely change, so they are cached per bot_id (only the
+# token and bot_id are kept); invalidate_credentials evicts an entry early in
+# this process only, other workers pick up a new token after the TTL
+credentials_cache = TTLCache(maxsize=10000, ttl=Config.CREDENTIALS_CACHE_TTL)
+
+# Per-account token bucket guarding the endpoints that call Telegram and the
+# Auth Service, so one caller can't saturate them for everyone else
+telegram_rate_limiter = TokenBucketLimiter(
+    capacity=Config.RATE_LIMIT_CAPACITY,
+    refill_per_minute=Config.RATE_LIMIT_PER_MINUTE
+)
+
+# Responses that never vary are encoded once at import
+NO_JSON_RESPONSE = StaticJSONResponse({
+    'success': False,
+    'error': 'No JSON data provided'
+}, 400)
+CHANNEL_USERNAME_REQUIRED_RESPONSE = StaticJSONResponse({
+    'success': False,
+    'error': 'channel_username is required'
+}, 400)
+CHANNEL_NOT_FOUND_RESPONSE = StaticJSONResponse({
+    'success': False,
+    'error': 'No channel configuration found for account'
+}, 404)
+ACCOUNT_ID_REQUIRED_RESPONSE = StaticJSONResponse({
+    'success': False,
+    'error': 'account_id is required'
+}, 400)
+PERMISSIONS_REQUIRED_RESPONSE = StaticJSONResponse({
+    'success': False,
+    'error': 'permissions are required'
+}, 400)
+INVALID_PERMISSIONS_RESPONSE = StaticJSONResponse({
+    'success': False,
+    'error': 'permissions must be an object',
+    'code': 'INVALID_PERMISSIONS'
+}, 400)
+ACCOUNT_NOT_FOUND_RESPONSE = StaticJSONResponse({
+    'success': False,
+    'error': 'Account not found or invalid',
+    'code': 'ACCOUNT_NOT_FOUND'
+}, 404)
+CHANNEL_NOT_CONFIGURED_RESPONSE = StaticJSONResponse({
+    'success': False,
+    'error': 'No channel configuration found',
+    'code': 'CHANNEL_NOT_CONFIGURED'
+}, 404)
+INTERNAL_ERROR_RESPONSE = StaticJSONResponse({
+    'success': False,
+    'error': 'Internal server error',
+    'code': 'INTERNAL_ERROR'
+}, 500)
+VALIDATION_ERROR_RESPONSE = StaticJSONResponse({
+    'valid': False,
+    'error': 'Validation error',
+    'code': 'INTERNAL_ERROR'
+}, 500)
+PAYLOAD_TOO_LARGE_RESPONSE = StaticJSONResponse({
+    'success': False,
+    'error': 'Request body too large',
+    'code': 'PAYLOAD_TOO_LARGE'
+}, 413)
+INVALID_REQUEST_RESPONSE = StaticJSONResponse({
+    'success': False,
+    'error': 'No JSON data provided',
+    'code': 'INVALID_REQUEST'
+}, 400)
+MISSING_CHANNEL_USERNAME_RESPONSE = StaticJSONResponse({
+    'success': False,
+    'error': 'Channel username is required',
+    'code': 'MISSING_CHANNEL_USERNAME'
+}, 400)
+NOTHING_TO_DELETE_RESPONSE = StaticJSONResponse({
+    'success': False,
+    'error': 'No channel configuration found to delete',
+    'code': 'CHANNEL_NOT_CONFIGURED'
+}, 404)
+CHANNEL_DELETED_RESPONSE = StaticJSONResponse({
+    'success': True,
+    'message': 'Channel configuration deleted successfully'
+})
+MISSING_ACCOUNT_ID_RESPONSE = StaticJSONResponse({
+    'success': False,
+    'error': 'Account ID is required',
+    'code': 'MISSING_ACCOUNT_ID'
+}, 400)
+INVALID_BOT_CREDENTIALS_RESPONSE = StaticJSONResponse({
+    'success': False,
+    'error': 'Account not found or invalid bot credentials',
+    'code': 'ACCOUNT_NOT_FOUND'
+}, 404)
+INVALID_BOT_TOKEN_RESPONSE = StaticJSONResponse({
+    'success': False,
+    'code': 'INVALID_BOT_TOKEN',
+    'error': 'Bot token is invalid'
+}, 400)
+BOT_TOKEN_CHECK_FAILED_RESPONSE = StaticJSONResponse({
+    'success': False,
+    'error': 'Failed to validate bot token with Telegram',
+    'code': 'TELEGRAM_API_ERROR'
+}, 500)
+CHANNEL_CHECK_FAILED_RESPONSE = StaticJSONResponse({
+    'success': False,
+    'error': 'Failed to verify channel with Telegram',
+    'code': 'TELEGRAM_API_ERROR'
+}, 500)
+BOT_NOT_MEMBER_RESPONSE = StaticJSONResponse({
+    'success': False,
+    'channel_exists': True,
+    'bot_is_admin': False,
+    'error': 'Bot is not a member of this channel',
+    'code': 'BOT_NOT_MEMBER'
+}, 400)
+BOT_NOT_ADMIN_RESPONSE = StaticJSONResponse({
+    'success': False,
+    'channel_exists': True,
+    'bot_is_admin': False,
+    'error': 'Bot is not an administrator in this channel',
+    'code': 'BOT_NOT_ADMIN'
+}, 400)
+PERMISSIONS_CHECK_FAILED_RESPONSE = StaticJSONResponse({
+    'success': False,
+    'error': 'Failed to verify bot permissions with Telegram',
+    'code': 'TELEGRAM_API_ERROR'
+}, 500)
 
 def get_bot_credentials(bot_id):
     """
@@ -30,69 +171,101 @@ def get_bot_credentials(bot_id):
     Raises:
         Exception: If account not found or database error
     """
+    credentials = credentials_cache.get(bot_id)
+    if credentials is not None:
+        return credentials
+    
     try:
         # Use direct database lookup instead of Auth Service API
-        logger.info(f"Getting bot credentials for bot_id {bot_id}")
-        return get_bot_credentials_from_db(bot_id)
+        logger.info("Getting bot credentials for bot_id %s", bot_id)
+        account_credentials = get_bot_credentials_from_db(bot_id)
     except Exception as e:
-        logger.error(f"Error getting bot credentials for bot_id {bot_id}: {str(e)}")
+        logger.error("Error getting bot credentials for bot_id %s: %s", bot_id, e)
         raise
+    
+    credentials = {
+        'bot_token': account_credentials['bot_token'],
+        'bot_id': account_credentials['bot_id']
+    }
+    credentials_cache.set(bot_id, credentials)
+    return credentials
+
+def invalidate_credentials(bot_id):
+    """
+    Drop cached credentials for a bot_id (e.g. after its token was rotated)
+    
+    Clears this module's cache, the application's periodic validation cache
+    and the account lookup cache. Caches live in each process, so other
+    gunicorn workers (and worker.py) keep theirs until CREDENTIALS_CACHE_TTL.
+    
+    Args:
+        bot_id: Bot ID - this is the Telegram bot ID
+    """
+    credentials_cache.pop(bot_id)
+    invalidate_account(bot_id)
+    
+    app_credentials_cache = current_app.extensions.get('credentials_cache')
+    if app_credentials_cache is not None:
+        app_credentials_cache.pop(bot_id)
+
+@channels_bp.errorhandler(Exception)
+def handle_unexpected_error(error):
+    """
+    Turn errors the channel routes don't handle themselves into a 500
+    
+    The exception is logged with its traceback but kept out of the response
+    body (it can carry database or URL details); HTTP errors such as a
+    malformed JSON body keep their own status.
+    """
+    if isinstance(error, HTTPException):
+        return error
+    
+    db.session.rollback()
+    logger.exception("Unhandled error in %s %s", request.method, request.path)
+    return INTERNAL_ERROR_RESPONSE()
 
 @channels_bp.route('/setup', methods=['POST'])
+@rate_limited(telegram_rate_limiter)
 def setup_channel():
     """
     Setup and validate channel configuration
     POST /api/channels/setup
     """
-    try:
-        data = request.get_json()
-        
-        if not data:
-            return jsonify({
-                'success': False,
-                'error': 'No JSON data provided'
-            }), 400
-        
-        account_id = data.get('account_id')  # Note: This is actually the bot_id (e.g., 262662172)
-        channel_username = data.get('channel_username')
-        
-        if not account_id:
-            return jsonify({
-                'success': False,
-                'error': 'account_id (bot_id) is required'
-            }), 400
-        
-        if not channel_username:
-            return jsonify({
-                'success': False,
-                'error': 'channel_username is required'
-            }), 400
-        
-        # Get bot credentials using direct database access with bot_id
-        # account_id here is actually the bot_id (262662172)
-        credentials = get_bot_credentials(account_id)
-        bot_token = credentials['bot_token']
-        bot_id = credentials['bot_id']
-        
-        # Setup channel configuration
-        result = setup_channel_configuration(
-            account_id=account_id,
-            channel_username=channel_username,
-            bot_token=bot_token,
-            bot_id=bot_id
-        )
-        
-        if result['success']:
-            return jsonify(result), 200
-        else:
-            return jsonify(result), 400
+    data = request.get_json()
     
-    except Exception as e:
-        logger.error(f"Error in setup_channel: {str(e)}")
+    if not data:
+        return NO_JSON_RESPONSE()
+    
+    account_id = data.get('account_id')  # Note: This is actually the bot_id (e.g., 262662172)
+    channel_username = data.get('channel_username')
+    
+    if not account_id:
         return jsonify({
             'success': False,
-            'error': f'Internal server error: {str(e)}'
-        }), 500
+            'error': 'account_id (bot_id) is required'
+        }), 400
+    
+    if not channel_username:
+        return CHANNEL_USERNAME_REQUIRED_RESPONSE()
+    
+    # Get bot credentials using direct database access with bot_id
+    # account_id here is actually the bot_id (262662172)
+    credentials = get_bot_credentials(account_id)
+    bot_token = credentials['bot_token']
+    bot_id = credentials['bot_id']
+    
+    # Setup channel configuration
+    result = setup_channel_configuration(
+        account_id=account_id,
+        channel_username=channel_username,
+        bot_token=bot_token,
+        bot_id=bot_id
+    )
+    
+    if result['success']:
+        return jsonify(result), 200
+    else:
+        return jsonify(result), 400
 
 @channels_bp.route('/validate/<int:account_id>', methods=['GET'])
 def validate_channel(account_id):
@@ -105,7 +278,7 @@ def validate_channel(account_id):
     try:
         # Get channel configuration using bot_id
         # account_id here is actually the bot_id (262662172)
-        channel_config = ChannelConfig.query.filter_by(account_id=account_id).first()
+        channel_config = ChannelConfig.get_by_account(account_id)
         
         if not channel_config:
             return jsonify({
@@ -113,6 +286,25 @@ def validate_channel(account_id):
                 'error': f'No channel configuration found for bot_id {account_id}'
             }), 404
         
+        # A configuration validated within CHANNEL_REVALIDATION_TTL is reported
+        # as is, without fetching credentials or calling Telegram
+        # (the column is timezone-aware; naive values are stored as UTC)
+        last_validation_at = channel_config.last_validation_at
+        if last_validation_at and last_validation_at.tzinfo is None:
+            last_validation_at = last_validation_at.replace(tzinfo=timezone.utc)
+        if (channel_config.is_validated and last_validation_at and
+                (datetime.now(timezone.utc) - last_validation_at).total_seconds() < Config.CHANNEL_REVALIDATION_TTL):
+            return jsonify({
+                'valid': True,
+                'channel_info': {
+                    'id': channel_config.channel_id,
+                    'username': channel_config.channel_username,
+                    'title': channel_config.channel_title
+                },
+                'last_validated': last_validation_at,
+                'cached': True
+            }), 200
+        
         # Get bot credentials using direct database access
         credentials = get_bot_credentials(account_id)
         bot_token = credentials['bot_token']
@@ -128,7 +320,7 @@ def validate_channel(account_id):
                 'username': channel_config.channel_username,
                 'title': channel_config.channel_title
             },
-            'last_validated': channel_config.last_validation_at.isoformat() if channel_config.last_validation_at else None
+            'last_validated': channel_config.last_validation_at
         }
         
         if not validation_result['valid']:
@@ -140,12 +332,11 @@ def validate_channel(account_id):
         
         return jsonify(response_data), 200
     
-    except Exception as e:
-        logger.error(f"Error in validate_channel: {str(e)}")
-        return jsonify({
-            'valid': False,
-            'error': f'Validation error: {str(e)}'
-        }), 500
+    except Exception:
+        # Keeps the 'valid' envelope of this endpoint; the exception text
+        # stays in the log
+        logger.exception("Error in validate_channel for account %s", account_id)
+        return VALIDATION_ERROR_RESPONSE()
 
 @channels_bp.route('/permissions/<int:account_id>', methods=['GET'])
 def get_channel_permissions(account_id):
@@ -153,33 +344,27 @@ def get_channel_permissions(account_id):
     Get bot permissions in channel
     GET /api/channels/permissions/{account_id}
     """
-    try:
-        # Get channel configuration
-        channel_config = ChannelConfig.query.filter_by(account_id=account_id).first()
-        
-        if not channel_config:
-            return jsonify({
-                'success': False,
-                'error': 'No channel configuration found for account'
-            }), 404
-        
-        permissions = channel_config.get_permissions_dict()
-        
-        return jsonify({
-            'success': True,
-            'permissions': permissions,
-            'channel_info': {
-                'id': channel_config.channel_id,
-                'title': channel_config.channel_title
-            }
-        }), 200
+    # Get channel configuration (only the columns returned below)
+    channel_config = ChannelConfig.get_by_account(account_id, load_only(
+        ChannelConfig.account_id,
+        ChannelConfig.channel_id,
+        ChannelConfig.channel_title,
+        *(getattr(ChannelConfig, name) for name in ChannelConfig.PERMISSION_FIELDS)
+    ))
     
-    except Exception as e:
-        logger.error(f"Error in get_channel_permissions: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': f'Error retrieving permissions: {str(e)}'
-        }), 500
+    if not channel_config:
+        return CHANNEL_NOT_FOUND_RESPONSE()
+    
+    permissions = channel_config.get_permissions_dict()
+    
+    return jsonify({
+        'success': True,
+        'permissions': permissions,
+        'channel_info': {
+            'id': channel_config.channel_id,
+            'title': channel_config.channel_title
+        }
+    }), 200
 
 @channels_bp.route('/update-permissions', methods=['PUT'])
 def update_permissions():
@@ -187,61 +372,51 @@ def update_permissions():
     Update permission status after validation
     PUT /api/channels/update-permissions
     """
-    try:
-        data = request.get_json()
-        
-        if not data:
-            return jsonify({
-                'success': False,
-                'error': 'No JSON data provided'
-            }), 400
-        
-        account_id = data.get('account_id')
-        permissions = data.get('permissions')
-        validation_error = data.get('validation_error')
-        
-        if not account_id:
-            return jsonify({
-                'success': False,
-                'error': 'account_id is required'
-            }), 400
-        
-        if not permissions:
-            return jsonify({
-                'success': False,
-                'error': 'permissions are required'
-            }), 400
-        
-        # Get channel configuration
-        channel_config = ChannelConfig.query.filter_by(account_id=account_id).first()
-        
-        if not channel_config:
-            return jsonify({
-                'success': False,
-                'error': 'No channel configuration found for account'
-            }), 404
-        
-        # Update permissions
-        channel_config.update_permissions(permissions)
-        
-        if validation_error:
-            channel_config.validation_error = validation_error
-            channel_config.is_validated = False
-        
-        db.session.commit()
-        
-        return jsonify({
-            'success': True,
-            'updated_permissions': channel_config.get_permissions_dict()
-        }), 200
+    data = request.get_json()
     
-    except Exception as e:
-        logger.error(f"Error in update_permissions: {str(e)}")
-        db.session.rollback()
+    if not data:
+        return NO_JSON_RESPONSE()
+    
+    account_id = data.get('account_id')
+    permissions = data.get('permissions')
+    validation_error = data.get('validation_error')
+    
+    if not account_id:
+        return ACCOUNT_ID_REQUIRED_RESPONSE()
+    
+    if not permissions:
+        return PERMISSIONS_REQUIRED_RESPONSE()
+    
+    if not isinstance(permissions, dict):
+        return INVALID_PERMISSIONS_RESPONSE()
+    
+    unknown_permissions = permissions.keys() - ChannelConfig.PERMISSION_FIELDS
+    if unknown_permissions:
         return jsonify({
             'success': False,
-            'error': f'Error updating permissions: {str(e)}'
-        }), 500
+            'error': f'Unknown permissions: {", ".join(sorted(unknown_permissions))}',
+            'code': 'UNKNOWN_PERMISSIONS'
+        }), 400
+    
+    # Get channel configuration
+    channel_config = ChannelConfig.get_by_account(account_id)
+    
+    if not channel_config:
+        return CHANNEL_NOT_FOUND_RESPONSE()
+    
+    # Update permissions
+    channel_config.update_permissions(permissions)
+    
+    if validation_error:
+        channel_config.validation_error = validation_error
+        channel_config.is_validated = False
+    
+    db.session.commit()
+    
+    return jsonify({
+        'success': True,
+        'updated_permissions': channel_config.get_permissions_dict()
+    }), 200
 
 @channels_bp.route('/info/<int:account_id>', methods=['GET'])
 def get_channel_info(account_id):
@@ -249,86 +424,74 @@ def get_channel_info(account_id):
     Get complete channel information
     GET /api/channels/info/{account_id}
     """
-    try:
-        # Get channel configuration
-        channel_config = ChannelConfig.query.filter_by(account_id=account_id).first()
-        
-        if not channel_config:
-            return jsonify({
-                'success': False,
-                'error': 'No channel configuration found for account'
-            }), 404
-        
-        channel_info = {
-            'id': channel_config.channel_id,
-            'username': channel_config.channel_username,
-            'title': channel_config.channel_title,
-            'member_count': channel_config.channel_member_count,
-            'type': channel_config.channel_type,
-            'is_validated': channel_config.is_validated,
-            'last_validation': channel_config.last_validation_at.isoformat() if channel_config.last_validation_at else None
-        }
-        
-        return jsonify({
-            'success': True,
-            'channel': channel_info
-        }), 200
+    # Get channel configuration (only the columns returned below)
+    channel_config = ChannelConfig.get_by_account(account_id, load_only(
+        ChannelConfig.account_id,
+        ChannelConfig.channel_id,
+        ChannelConfig.channel_username,
+        ChannelConfig.channel_title,
+        ChannelConfig.channel_member_count,
+        ChannelConfig.channel_type,
+        ChannelConfig.is_validated,
+        ChannelConfig.last_validation_at
+    ))
     
-    except Exception as e:
-        logger.error(f"Error in get_channel_info: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': f'Error retrieving channel info: {str(e)}'
-        }), 500
+    if not channel_config:
+        return CHANNEL_NOT_FOUND_RESPONSE()
+    
+    channel_info = {
+        'id': channel_config.channel_id,
+        'username': channel_config.channel_username,
+        'title': channel_config.channel_title,
+        'member_count': channel_config.channel_member_count,
+        'type': channel_config.channel_type,
+        'is_validated': channel_config.is_validated,
+        'last_validation': channel_config.last_validation_at
+    }
+    
+    return jsonify({
+        'success': True,
+        'channel': channel_info
+    }), 200
 
 @channels_bp.route('/revalidate/<int:account_id>', methods=['POST'])
+@rate_limited(telegram_rate_limiter)
 def revalidate_channel_endpoint(account_id):
     """
     Force revalidation of channel
     POST /api/channels/revalidate/{account_id}
     """
-    try:
-        # Get channel configuration
-        channel_config = ChannelConfig.query.filter_by(account_id=account_id).first()
-        
-        if not channel_config:
-            return jsonify({
-                'success': False,
-                'error': 'No channel configuration found for account'
-            }), 404
+    # Get channel configuration
+    channel_config = ChannelConfig.get_by_account(account_id)
+    
+    if not channel_config:
+        return CHANNEL_NOT_FOUND_RESPONSE()
+    
+    # Get bot credentials
+    credentials = get_bot_credentials(account_id)
+    bot_token = credentials['bot_token']
+    bot_id = credentials['bot_id']
+    
+    # Perform revalidation
+    result = revalidate_channel(channel_config, bot_token, bot_id)
+    
+    if result['success']:
+        validation_result = result['validation_result']
         
-        # Get bot credentials
-        credentials = get_bot_credentials(account_id)
-        bot_token = credentials['bot_token']
-        bot_id = credentials['bot_id']
+        response_data = {
+            'success': True,
+            'validation_result': {
+                'valid': validation_result['valid'],
+                'permissions_changed': validation_result.get('permissions_changed', False)
+            }
+        }
         
-        # Perform revalidation
-        result = revalidate_channel(channel_config, bot_token, bot_id)
+        if result.get('channel_info_updated'):
+            response_data['validation_result']['new_member_count'] = channel_config.channel_member_count
         
-        if result['success']:
-            validation_result = result['validation_result']
-            
-            response_data = {
-                'success': True,
-                'validation_result': {
-                    'valid': validation_result['valid'],
-                    'permissions_changed': validation_result.get('permissions_changed', False)
-                }
-            }
-            
-            if result.get('channel_info_updated'):
-                response_data['validation_result']['new_member_count'] = channel_config.channel_member_count
-            
-            return jsonify(response_data), 200
-        else:
-            return jsonify(result), 400
-    
-    except Exception as e:
-        logger.error(f"Error in revalidate_channel: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': f'Revalidation error: {str(e)}'
-        }), 500
+        return jsonify(response_data), 200
+    else:
+        return jsonify(result), 400
 
 # Additional utility endpoints
 
@@ -338,30 +501,29 @@ def get_channel_status(account_id):
     Get comprehensive channel status
     GET /api/channels/status/{account_id}
     """
-    try:
-        # Get channel configuration
-        channel_config = ChannelConfig.query.filter_by(account_id=account_id).first()
-        
-        if not channel_config:
-            return jsonify({
-                'success': False,
-                'error': 'No channel configuration found for account'
-            }), 404
-        
-        # Get comprehensive status
-        status = get_channel_permission_status(channel_config)
-        
-        return jsonify({
-            'success': True,
-            'status': status
-        }), 200
+    # Get channel configuration
+    channel_config = ChannelConfig.get_by_account(account_id)
     
-    except Exception as e:
-        logger.error(f"Error in get_channel_status: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': f'Error retrieving channel status: {str(e)}'
-        }), 500
+    if not channel_config:
+        return CHANNEL_NOT_FOUND_RESPONSE()
+    
+    # Get comprehensive status
+    status = get_channel_permission_status(channel_config)
+    
+    return jsonify({
+        'success': True,
+        'status': status
+    }), 200
+
+# Response keys for the columns projected by list_channels, in query order
+LIST_CHANNEL_KEYS = (
+    'account_id',
+    'channel_id',
+    'channel_username',
+    'channel_title',
+    'is_validated',
+    'last_validation'
+)
 
 @channels_bp.route('/list', methods=['GET'])
 def list_channels():
@@ -369,33 +531,26 @@ def list_channels():
     List all channel configurations (for admin/debugging)
     GET /api/channels/list
     """
-    try:
-        # In production, this would require admin authentication
-        channels = ChannelConfig.query.all()
-        
-        channel_list = []
-        for channel in channels:
-            channel_list.append({
-                'account_id': channel.account_id,
-                'channel_id': channel.channel_id,
-                'channel_username': channel.channel_username,
-                'channel_title': channel.channel_title,
-                'is_validated': channel.is_validated,
-                'last_validation': channel.last_validation_at.isoformat() if channel.last_validation_at else None
-            })
-        
-        return jsonify({
-            'success': True,
-            'channels': channel_list,
-            'total': len(channel_list)
-        }), 200
+    # In production, this would require admin authentication
     
-    except Exception as e:
-        logger.error(f"Error in list_channels: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': f'Error listing channels: {str(e)}'
-        }), 500
+    # Project just the listed columns (no ORM objects are built) and
+    # stream them in chunks; yield_per also enables a server-side cursor
+    rows = ChannelConfig.query.with_entities(
+        ChannelConfig.account_id,
+        ChannelConfig.channel_id,
+        ChannelConfig.channel_username,
+        ChannelConfig.channel_title,
+        ChannelConfig.is_validated,
+        ChannelConfig.last_validation_at
+    ).yield_per(Config.QUERY_STREAM_BATCH_SIZE)
+    
+    channel_list = [dict(zip(LIST_CHANNEL_KEYS, row)) for row in rows]
+    
+    return jsonify({
+        'success': True,
+        'channels': channel_list,
+        'total': len(channel_list)
+    }), 200
 
 
 
@@ -407,51 +562,31 @@ def get_account_channel(account_id):
     Get channel configuration for a specific account
     GET /api/channels/accounts/{account_id}/channel
     """
-    try:
-        # Get bot credentials for the account
-        try:
-            credentials = get_bot_credentials(account_id)
-        except Exception as e:
-            logger.error(f"Failed to get bot credentials for account {account_id}: {str(e)}")
-            return jsonify({
-                'success': False,
-                'error': 'Account not found or invalid',
-                'code': 'ACCOUNT_NOT_FOUND'
-            }), 404
-        
-        # Get channel configuration from database
-        channel_config = ChannelConfig.query.filter_by(account_id=account_id).first()
-        
-        if not channel_config:
-            return jsonify({
-                'success': False,
-                'error': 'No channel configuration found',
-                'code': 'CHANNEL_NOT_CONFIGURED'
-            }), 404
-        
-        # Return channel configuration
-        return jsonify({
-            'success': True,
-            'channel': {
-                'id': channel_config.id,
-                'account_id': channel_config.account_id,
-                'channel_username': channel_config.channel_username,
-                'channel_title': channel_config.channel_title,
-                'channel_id': channel_config.channel_id,
-                'is_verified': channel_config.is_validated,
-                'verified_at': channel_config.last_validation_at.isoformat() + 'Z' if channel_config.last_validation_at else None,
-                'created_at': channel_config.created_at.isoformat() + 'Z' if channel_config.created_at else None,
-                'updated_at': channel_config.updated_at.isoformat() + 'Z' if channel_config.updated_at else None
-            }
-        }), 200
+    # Only the account's existence matters here (the bot token isn't used),
+    # so check it while the channel configuration is loaded
+    account_exists, channel_config = get_account_with_channel(account_id, ChannelConfig.load_summary())
+    if not account_exists:
+        logger.warning("Account not found for account %s", account_id)
+        return ACCOUNT_NOT_FOUND_RESPONSE()
     
-    except Exception as e:
-        logger.error(f"Error in get_account_channel for account {account_id}: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': 'Internal server error',
-            'code': 'INTERNAL_ERROR'
-        }), 500
+    if not channel_config:
+        return CHANNEL_NOT_CONFIGURED_RESPONSE()
+    
+    # Return channel configuration
+    return jsonify({
+        'success': True,
+        'channel': {
+            'id': channel_config.id,
+            'account_id': channel_config.account_id,
+            'channel_username': channel_config.channel_username,
+            'channel_title': channel_config.channel_title,
+            'channel_id': channel_config.channel_id,
+            'is_verified': channel_config.is_validated,
+            'verified_at': channel_config.last_validation_at,
+            'created_at': channel_config.created_at,
+            'updated_at': channel_config.updated_at
+        }
+    }), 200
 
 @channels_bp.route('/accounts/<int:account_id>/channel', methods=['PUT'])
 def save_account_channel(account_id):
@@ -459,90 +594,67 @@ def save_account_channel(account_id):
     Save or update channel configuration for a specific account
     PUT /api/channels/accounts/{account_id}/channel
     """
-    try:
-        data = request.get_json()
-        
-        if not data:
-            return jsonify({
-                'success': False,
-                'error': 'No JSON data provided',
-                'code': 'INVALID_REQUEST'
-            }), 400
-        
-        # Get bot credentials for the account
-        try:
-            credentials = get_bot_credentials(account_id)
-        except Exception as e:
-            logger.error(f"Failed to get bot credentials for account {account_id}: {str(e)}")
-            return jsonify({
-                'success': False,
-                'error': 'Account not found or invalid',
-                'code': 'ACCOUNT_NOT_FOUND'
-            }), 404
-        
-        # Validate required fields
-        channel_username = data.get('channel_username')
-        channel_title = data.get('channel_title')
-        
-        if not channel_username:
-            return jsonify({
-                'success': False,
-                'error': 'Channel username is required',
-                'code': 'MISSING_CHANNEL_USERNAME'
-            }), 400
-        
-        # Validate channel username format
-        if not channel_username.startswith('@'):
-            channel_username = '@' + channel_username
-        
-        # Check if channel configuration already exists
-        channel_config = ChannelConfig.query.filter_by(account_id=account_id).first()
-        
-        if channel_config:
-            # Update existing configuration
-            channel_config.channel_username = channel_username
-            channel_config.channel_title = channel_title or channel_config.channel_title
-            channel_config.is_validated = data.get('is_verified', False)
-            channel_config.updated_at = datetime.utcnow()
-        else:
-            # Create new configuration
-            channel_config = ChannelConfig(
-                account_id=account_id,
-                channel_username=channel_username,
-                channel_title=channel_title or 'Unknown Channel',
-                is_validated=data.get('is_verified', False),
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
-            )
-            db.session.add(channel_config)
-        
-        # Save to database
-        db.session.commit()
-        
-        return jsonify({
-            'success': True,
-            'message': 'Channel configuration saved successfully',
-            'channel': {
-                'id': channel_config.id,
-                'account_id': channel_config.account_id,
-                'channel_username': channel_config.channel_username,
-                'channel_title': channel_config.channel_title,
-                'channel_id': channel_config.channel_id,
-                'is_verified': channel_config.is_validated,
-                'verified_at': channel_config.last_validation_at.isoformat() + 'Z' if channel_config.last_validation_at else None,
-                'created_at': channel_config.created_at.isoformat() + 'Z' if channel_config.created_at else None,
-                'updated_at': channel_config.updated_at.isoformat() + 'Z' if channel_config.updated_at else None
-            }
-        }), 200
+    # Reject oversized bodies before parsing; the parsed body is used once,
+    # so it isn't cached on the request
+    if request.content_length and request.content_length > Config.MAX_CHANNEL_PAYLOAD_BYTES:
+        return PAYLOAD_TOO_LARGE_RESPONSE()
     
-    except Exception as e:
-        db.session.rollback()
-        logger.error(f"Error in save_account_channel for account {account_id}: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': 'Internal server error',
-            'code': 'INTERNAL_ERROR'
-        }), 500
+    data = request.get_json(cache=False, silent=True)
+    
+    if not isinstance(data, dict) or not data:
+        return INVALID_REQUEST_RESPONSE()
+    
+    # Only the account's existence matters here (the bot token isn't used),
+    # so check it while the channel configuration is loaded
+    account_exists, channel_config = get_account_with_channel(account_id)
+    if not account_exists:
+        logger.warning("Account not found for account %s", account_id)
+        return ACCOUNT_NOT_FOUND_RESPONSE()
+    
+    # Validate required fields
+    channel_username = data.get('channel_username')
+    channel_title = data.get('channel_title')
+    
+    if not channel_username:
+        return MISSING_CHANNEL_USERNAME_RESPONSE()
+    
+    # Validate channel username format
+    if not channel_username.startswith('@'):
+        channel_username = '@' + channel_username
+    
+    if channel_config:
+        # Update existing configuration
+        channel_config.channel_username = channel_username
+        channel_config.channel_title = channel_title or channel_config.channel_title
+        channel_config.is_validated = data.get('is_verified', False)
+    else:
+        # Create new configuration
+        channel_config = ChannelConfig(
+            account_id=account_id,
+            channel_username=channel_username,
+            channel_title=channel_title or 'Unknown Channel',
+            is_validated=data.get('is_verified', False)
+        )
+        db.session.add(channel_config)
+    
+    # Save to database (created_at/updated_at are set by the database)
+    db.session.commit()
+    
+    return jsonify({
+        'success': True,
+        'message': 'Channel configuration saved successfully',
+        'channel': {
+            'id': channel_config.id,
+            'account_id': channel_config.account_id,
+            'channel_username': channel_config.channel_username,
+            'channel_title': channel_config.channel_title,
+            'channel_id': channel_config.channel_id,
+            'is_verified': channel_config.is_validated,
+            'verified_at': channel_config.last_validation_at,
+            'created_at': channel_config.created_at,
+            'updated_at': channel_config.updated_at
+        }
+    }), 200
 
 @channels_bp.route('/accounts/<int:account_id>/channel', methods=['DELETE'])
 def delete_account_channel(account_id):
@@ -550,274 +662,235 @@ def delete_account_channel(account_id):
     Delete channel configuration for a specific account
     DELETE /api/channels/accounts/{account_id}/channel
     """
-    try:
-        # Get bot credentials for the account
-        try:
-            credentials = get_bot_credentials(account_id)
-        except Exception as e:
-            logger.error(f"Failed to get bot credentials for account {account_id}: {str(e)}")
-            return jsonify({
-                'success': False,
-                'error': 'Account not found or invalid',
-                'code': 'ACCOUNT_NOT_FOUND'
-            }), 404
-        
-        # Find channel configuration
-        channel_config = ChannelConfig.query.filter_by(account_id=account_id).first()
-        
-        if not channel_config:
-            return jsonify({
-                'success': False,
-                'error': 'No channel configuration found to delete',
-                'code': 'CHANNEL_NOT_CONFIGURED'
-            }), 404
-        
-        # Delete the configuration
-        db.session.delete(channel_config)
-        db.session.commit()
-        
-        return jsonify({
-            'success': True,
-            'message': 'Channel configuration deleted successfully'
-        }), 200
+    # Only the account's existence matters here (the bot token isn't used),
+    # so check it while the channel configuration is loaded
+    account_exists, channel_config = get_account_with_channel(account_id)
+    if not account_exists:
+        logger.warning("Account not found for account %s", account_id)
+        return ACCOUNT_NOT_FOUND_RESPONSE()
     
-    except Exception as e:
-        db.session.rollback()
-        logger.error(f"Error in delete_account_channel for account {account_id}: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': 'Internal server error',
-            'code': 'INTERNAL_ERROR'
-        }), 500
+    if not channel_config:
+        return NOTHING_TO_DELETE_RESPONSE()
+    
+    # Delete the configuration
+    db.session.delete(channel_config)
+    db.session.commit()
+    
+    return CHANNEL_DELETED_RESPONSE()
 
 @channels_bp.route('/verify', methods=['POST'])
+@rate_limited(telegram_rate_limiter)
 def verify_channel():
     """
     Verify that the bot has admin rights in the specified channel
     POST /api/channels/verify
     """
+    data = request.get_json()
+    
+    if not data:
+        return INVALID_REQUEST_RESPONSE()
+    
+    channel_username = data.get('channel_username')
+    account_id = data.get('account_id')
+    
+    if not channel_username:
+        return MISSING_CHANNEL_USERNAME_RESPONSE()
+    
+    if not account_id:
+        return MISSING_ACCOUNT_ID_RESPONSE()
+    
+    # Ensure channel username starts with @
+    if not channel_username.startswith('@'):
+        channel_username = '@' + channel_username
+    
+    logger.info("Verifying channel %s for bot_id %s", channel_username, account_id)
+    
+    # Validate account exists using bot_id (same as accounts endpoint)
+    if not validate_account_exists(account_id):
+        logger.warning("Account with bot_id %s not found in database", account_id)
+        return jsonify({
+            'success': False,
+            'error': f'Account with bot_id {account_id} not found in database',
+            'code': 'ACCOUNT_NOT_FOUND'
+        }), 404
+    
+    # Get bot credentials for the account
     try:
-        data = request.get_json()
-        
-        if not data:
-            return jsonify({
-                'success': False,
-                'error': 'No JSON data provided',
-                'code': 'INVALID_REQUEST'
-            }), 400
-        
-        channel_username = data.get('channel_username')
-        account_id = data.get('account_id')
-        
-        if not channel_username:
+        credentials = get_bot_credentials(account_id)
+        bot_token = credentials['bot_token']
+        bot_id = credentials['bot_id']
+        logger.info("Got credentials for bot_id %s: bot_id=%s", account_id, bot_id)
+    except Exception as e:
+        logger.error("Failed to get bot credentials for bot_id %s: %s", account_id, e)
+        return INVALID_BOT_CREDENTIALS_RESPONSE()
+    
+    # Verify channel with Telegram API
+    import requests
+    from utils.telegram_api import (
+        telegram_session,
+        get_me,
+        method_url,
+        looks_like_bot_token,
+        TELEGRAM_TIMEOUT
+    )
+    
+    logger.info('🔍 === CHANNEL VERIFICATION DEBUG ===')
+    logger.info('📝 Request: account_id=%s, channel_username=%s', account_id, channel_username)
+    logger.info('👤 Account found: True')
+    logger.info('🔑 Bot token exists: %s', bot_token is not None)
+    token_looks_valid = looks_like_bot_token(bot_token)
+    logger.info('🔑 Bot token format: %s', 'VALID_FORMAT' if token_looks_valid else 'INVALID_FORMAT')
+    
+    # A malformed token can't pass getMe, so don't spend Telegram calls on it
+    if not token_looks_valid:
+        logger.error('❌ CRITICAL: Bot token invalid - malformed token')
+        return INVALID_BOT_TOKEN_RESPONSE()
+    
+    # getChat and getChatMember don't depend on getMe (a bot's user ID is
+    # the numeric prefix of its token), so start them while the token is
+    # checked; one verification then costs a single round trip
+    chat_url = method_url(bot_token, 'getChat')
+    chat_future = telegram_executor.submit(
+        telegram_session.get,
+        chat_url,
+        params={'chat_id': channel_username},
+        timeout=TELEGRAM_TIMEOUT
+    )
+    token_bot_id = int(str(bot_token).split(':', 1)[0])
+    member_future = telegram_executor.submit(
+        telegram_session.get,
+        method_url(bot_token, 'getChatMember'),
+        params={
+            'chat_id': channel_username,
+            'user_id': token_bot_id
+        },
+        timeout=TELEGRAM_TIMEOUT
+    )
+    
+    # Test bot token with getMe first
+    logger.info('🤖 Testing bot token with getMe...')
+    try:
+        getme_data = get_me(bot_token)
+        logger.info('🤖 getMe response: %s', getme_data)
+        
+        if not getme_data.get('ok'):
+            logger.error('❌ CRITICAL: Bot token invalid - getMe failed')
+            chat_future.cancel()
+            member_future.cancel()
+            # The cached token may have been rotated; refetch it next time
+            invalidate_credentials(account_id)
             return jsonify({
                 'success': False,
-                'error': 'Channel username is required',
-                'code': 'MISSING_CHANNEL_USERNAME'
+                'code': 'INVALID_BOT_TOKEN',
+                'error': 'Bot token is invalid',
+                'telegram_error': getme_data
             }), 400
+            
+    except requests.exceptions.RequestException as e:
+        logger.error("❌ CRITICAL: getMe request failed: %s", e)
+        chat_future.cancel()
+        member_future.cancel()
+        return BOT_TOKEN_CHECK_FAILED_RESPONSE()
+    
+    # Get chat information
+    logger.info('📺 Testing channel access...')
+    logger.info('📺 Telegram API URL: %s', chat_url.replace(bot_token, 'TOKEN_HIDDEN'))
+    logger.info('📺 Channel parameter: %s', channel_username)
+    
+    try:
+        chat_response = chat_future.result()
+        chat_data = chat_response.json()
+        logger.info('📺 getChat response: %s', chat_data)
         
-        if not account_id:
+        if not chat_data.get('ok'):
+            logger.error('❌ Channel access failed: %s', chat_data)
+            member_future.cancel()
             return jsonify({
                 'success': False,
-                'error': 'Account ID is required',
-                'code': 'MISSING_ACCOUNT_ID'
+                'channel_exists': False,
+                'error': 'Channel not found or is private',
+                'code': 'CHANNEL_NOT_FOUND',
+                'telegram_error': chat_data
             }), 400
         
-        # Ensure channel username starts with @
-        if not channel_username.startswith('@'):
-            channel_username = '@' + channel_username
-        
-        logger.info(f"Verifying channel {channel_username} for bot_id {account_id}")
-        
-        # Validate account exists using bot_id (same as accounts endpoint)
-        from utils.account_lookup import validate_account_exists
-        if not validate_account_exists(account_id):
-            logger.warning(f"Account with bot_id {account_id} not found in database")
-            return jsonify({
-                'success': False,
-                'error': f'Account with bot_id {account_id} not found in database',
-                'code': 'ACCOUNT_NOT_FOUND'
-            }), 404
-        
-        # Get bot credentials for the account
-        try:
-            credentials = get_bot_credentials(account_id)
-            bot_token = credentials['bot_token']
-            bot_id = credentials['bot_id']
-            logger.info(f"Got credentials for bot_id {account_id}: bot_id={bot_id}")
-        except Exception as e:
-            logger.error(f"Failed to get bot credentials for bot_id {account_id}: {str(e)}")
-            return jsonify({
-                'success': False,
-                'error': 'Account not found or invalid bot credentials',
-                'code': 'ACCOUNT_NOT_FOUND'
-            }), 404
+    except requests.exceptions.RequestException as e:
+        logger.error("Error calling Telegram API for chat info: %s", e)
+        member_future.cancel()
+        return CHANNEL_CHECK_FAILED_RESPONSE()
+    
+    # Get bot member information
+    logger.info('👑 Checking bot admin status...')
+    bot_user_id = getme_data['result']['id']  # Use actual bot ID from getMe
+    logger.info('👑 Bot user ID: %s', bot_user_id)
+    
+    try:
+        if bot_user_id == token_bot_id:
+            member_response = member_future.result()
+        else:
+            member_response = telegram_session.get(
+                method_url(bot_token, 'getChatMember'),
+                params={
+                    'chat_id': channel_username,
+                    'user_id': bot_user_id
+                },
+                timeout=TELEGRAM_TIMEOUT
+            )
+        member_data = member_response.json()
+        logger.info('👑 getChatMember response: %s', member_data)
         
-        # Verify channel with Telegram API
-        import requests
+        if not member_data.get('ok'):
+            logger.warning('Bot member check failed: %s', member_data)
+            return BOT_NOT_MEMBER_RESPONSE()
         
-        logger.info('🔍 === CHANNEL VERIFICATION DEBUG ===')
-        logger.info(f'📝 Request: account_id={account_id}, channel_username={channel_username}')
-        logger.info(f'👤 Account found: True')
-        logger.info(f'🔑 Bot token exists: {bot_token is not None}')
-        logger.info(f'🔑 Bot token format: {"VALID_FORMAT" if bot_token and ":" in str(bot_token) else "INVALID_FORMAT"}')
+        member_info = member_data['result']
+        is_admin = member_info['status'] in ['administrator', 'creator']
         
-        # Test bot token with getMe first
-        logger.info('🤖 Testing bot token with getMe...')
-        try:
-            getme_response = requests.get(
-                f'https://api.telegram.org/bot{bot_token}/getMe',
-                timeout=10
-            )
-            getme_data = getme_response.json()
-            logger.info(f'🤖 getMe response: {getme_data}')
-            
-            if not getme_data.get('ok'):
-                logger.error('❌ CRITICAL: Bot token invalid - getMe failed')
-                return jsonify({
-                    'success': False,
-                    'code': 'INVALID_BOT_TOKEN',
-                    'error': 'Bot token is invalid',
-                    'telegram_error': getme_data
-                }), 400
-                
-        except requests.exceptions.RequestException as e:
-            logger.error(f"❌ CRITICAL: getMe request failed: {str(e)}")
-            return jsonify({
-                'success': False,
-                'error': 'Failed to validate bot token with Telegram',
-                'code': 'TELEGRAM_API_ERROR'
-            }), 500
+        logger.info('👑 Bot status: %s', member_info['status'])
+        logger.info('👑 Is admin: %s', is_admin)
         
-        # Get chat information
-        logger.info('📺 Testing channel access...')
-        chat_url = f'https://api.telegram.org/bot{bot_token}/getChat'
-        logger.info(f'📺 Telegram API URL: {chat_url.replace(bot_token, "TOKEN_HIDDEN")}')
-        logger.info(f'📺 Channel parameter: {channel_username}')
+        if not is_admin:
+            logger.warning('Bot is not admin: status=%s', member_info['status'])
+            return BOT_NOT_ADMIN_RESPONSE()
         
-        try:
-            chat_response = requests.get(
-                chat_url,
-                params={'chat_id': channel_username},
-                timeout=10
-            )
-            chat_data = chat_response.json()
-            logger.info(f'📺 getChat response: {chat_data}')
-            
-            if not chat_data.get('ok'):
-                logger.error(f'❌ Channel access failed: {chat_data}')
-                return jsonify({
-                    'success': False,
-                    'channel_exists': False,
-                    'error': 'Channel not found or is private',
-                    'code': 'CHANNEL_NOT_FOUND',
-                    'telegram_error': chat_data
-                }), 400
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error calling Telegram API for chat info: {str(e)}")
-            return jsonify({
-                'success': False,
-                'error': 'Failed to verify channel with Telegram',
-                'code': 'TELEGRAM_API_ERROR'
-            }), 500
+        # Check specific permissions
+        can_post = member_info.get('can_post_messages', False)
+        can_edit = member_info.get('can_edit_messages', False)
         
-        # Get bot member information
-        logger.info('👑 Checking bot admin status...')
-        bot_user_id = getme_data['result']['id']  # Use actual bot ID from getMe
-        logger.info(f'👑 Bot user ID: {bot_user_id}')
+        logger.info('👑 Permissions: post_messages=%s, edit_messages=%s', can_post, can_edit)
         
-        try:
-            member_response = requests.get(
-                f'https://api.telegram.org/bot{bot_token}/getChatMember',
-                params={
-                    'chat_id': channel_username,
-                    'user_id': bot_user_id
-                },
-                timeout=10
-            )
-            member_data = member_response.json()
-            logger.info(f'👑 getChatMember response: {member_data}')
-            
-            if not member_data.get('ok'):
-                logger.warning(f'Bot member check failed: {member_data}')
-                return jsonify({
-                    'success': False,
-                    'channel_exists': True,
-                    'bot_is_admin': False,
-                    'error': 'Bot is not a member of this channel',
-                    'code': 'BOT_NOT_MEMBER'
-                }), 400
-            
-            member_info = member_data['result']
-            is_admin = member_info['status'] in ['administrator', 'creator']
-            
-            logger.info(f'👑 Bot status: {member_info["status"]}')
-            logger.info(f'👑 Is admin: {is_admin}')
-            
-            if not is_admin:
-                logger.warning(f'Bot is not admin: status={member_info["status"]}')
-                return jsonify({
-                    'success': False,
-                    'channel_exists': True,
-                    'bot_is_admin': False,
-                    'error': 'Bot is not an administrator in this channel',
-                    'code': 'BOT_NOT_ADMIN'
-                }), 400
-            
-            # Check specific permissions
-            can_post = member_info.get('can_post_messages', False)
-            can_edit = member_info.get('can_edit_messages', False)
-            
-            logger.info(f'👑 Permissions: post_messages={can_post}, edit_messages={can_edit}')
-            
-            if not can_post or not can_edit:
-                logger.warning(f'Bot lacks required permissions: post={can_post}, edit={can_edit}')
-                return jsonify({
-                    'success': False,
-                    'channel_exists': True,
-                    'bot_is_admin': True,
-                    'bot_can_post_messages': can_post,
-                    'bot_can_edit_messages': can_edit,
-                    'error': 'Bot lacks required permissions (post_messages, edit_messages)',
-                    'code': 'INSUFFICIENT_PERMISSIONS'
-                }), 400
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error calling Telegram API for member info: {str(e)}")
+        if not can_post or not can_edit:
+            logger.warning('Bot lacks required permissions: post=%s, edit=%s', can_post, can_edit)
             return jsonify({
                 'success': False,
-                'error': 'Failed to verify bot permissions with Telegram',
-                'code': 'TELEGRAM_API_ERROR'
-            }), 500
-        
-        # All checks passed - return success
-        chat_info = chat_data['result']
-        
-        logger.info('✅ Verification complete: SUCCESS')
-        logger.info(f'✅ Channel: {chat_info.get("title")} ({channel_username})')
-        logger.info(f'✅ Bot is admin with full permissions')
+                'channel_exists': True,
+                'bot_is_admin': True,
+                'bot_can_post_messages': can_post,
+                'bot_can_edit_messages': can_edit,
+                'error': 'Bot lacks required permissions (post_messages, edit_messages)',
+                'code': 'INSUFFICIENT_PERMISSIONS'
+            }), 400
         
-        return jsonify({
-            'success': True,
-            'channel_exists': True,
-            'bot_is_admin': True,
-            'bot_can_post_messages': True,
-            'bot_can_edit_messages': True,
-            'channel_title': chat_info.get('title', 'Unknown Channel'),
-            'channel_id': chat_info.get('id'),
-            'member_count': chat_info.get('members_count', 0),
-            'channel_type': chat_info.get('type', 'channel'),
-            'verified_at': datetime.utcnow().isoformat() + 'Z'
-        }), 200
+    except requests.exceptions.RequestException as e:
+        logger.error("Error calling Telegram API for member info: %s", e)
+        return PERMISSIONS_CHECK_FAILED_RESPONSE()
     
-    except Exception as e:
-        logger.error(f"💥 CRITICAL ERROR in verify_channel: {str(e)}")
-        logger.exception("Full exception details:")
-        return jsonify({
-            'success': False,
-            'error': 'Internal server error during channel verification',
-            'code': 'INTERNAL_ERROR',
-            'details': str(e)
-        }), 500
+    # All checks passed - return success
+    chat_info = chat_data['result']
+    
+    logger.info('✅ Verification complete: SUCCESS')
+    logger.info('✅ Channel: %s (%s)', chat_info.get('title'), channel_username)
+    logger.info('✅ Bot is admin with full permissions')
+    
+    return jsonify({
+        'success': True,
+        'channel_exists': True,
+        'bot_is_admin': True,
+        'bot_can_post_messages': True,
+        'bot_can_edit_messages': True,
+        'channel_title': chat_info.get('title', 'Unknown Channel'),
+        'channel_id': chat_info.get('id'),
+        'member_count': chat_info.get('members_count', 0),
+        'channel_type': chat_info.get('type', 'channel'),
+        'verified_at': datetime.utcnow()
+    }), 200
 
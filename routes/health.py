@@ -1,10 +1,42 @@
 from flask import Blueprint, jsonify
-import requests
 from config.settings import Config
 from models import db
+from utils.cache import TTLCache
+from utils.http_client import create_session
 
 health_bp = Blueprint('health', __name__)
 
+# Pooled session so repeated health probes reuse the Telegram connection
+probe_session = create_session(pool_maxsize=2)
+
+# The Telegram reachability result is cached briefly; database liveness is
+# always checked fresh
+probe_cache = TTLCache(maxsize=1, ttl=30)
+
+def check_telegram_api():
+    """
+    Check that the Telegram API is reachable
+    
+    Returns:
+        str: accessible, inaccessible or unknown
+    """
+    telegram_status = probe_cache.get('telegram_api')
+    if telegram_status is not None:
+        return telegram_status
+    
+    try:
+        response = probe_session.get(f"{Config.TELEGRAM_API_BASE}/bot123:test/getMe", timeout=5)
+        # We expect this to fail with 401 (unauthorized), but that means API is accessible
+        if response.status_code in [401, 404]:
+            telegram_status = "accessible"
+        else:
+            telegram_status = "unknown"
+    except Exception:
+        telegram_status = "inaccessible"
+    
+    probe_cache.set('telegram_api', telegram_status)
+    return telegram_status
+
 @health_bp.route('/health', methods=['GET'])
 def health_check():
     """
@@ -22,17 +54,8 @@ def health_check():
         except Exception as e:
             db_status = "disconnected"
         
-        # Check Telegram API accessibility
-        telegram_status = "accessible"
-        try:
-            response = requests.get(f"{Config.TELEGRAM_API_BASE}/bot123:test/getMe", timeout=5)
-            # We expect this to fail with 401 (unauthorized), but that means API is accessible
-            if response.status_code in [401, 404]:
-                telegram_status = "accessible"
-            else:
-                telegram_status = "unknown"
-        except Exception:
-            telegram_status = "inaccessible"
+        # Check Telegram API accessibility (cached between probes)
+        telegram_status = check_telegram_api()
         
         # Determine overall status
         overall_status = "healthy"
@@ -2,10 +2,16 @@
 Monitoring and account status endpoints for Channel Management Service
 """
 from flask import Blueprint, request, jsonify
+import os
 import logging
 import time
+import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from models import ChannelConfig, db
+from utils.cache import TTLCache
+from utils.http_client import create_session
+from config.settings import Config
 from utils.error_handling import (
     AccountNotFoundError, 
     create_error_response, 
@@ -16,6 +22,25 @@ from utils.error_handling import (
 logger = logging.getLogger(__name__)
 monitoring_bp = Blueprint('monitoring', __name__, url_prefix='/api/monitoring')
 
+# Auth Service base URL and endpoint templates, built once at import
+AUTH_SERVICE_URL = os.getenv('TELEGIVE_AUTH_URL', 'https://web-production-ddd7e.up.railway.app').rstrip('/')
+AUTH_ACCOUNT_URL = AUTH_SERVICE_URL + '/api/auth/account/%s'
+AUTH_DECRYPT_TOKEN_URL = AUTH_SERVICE_URL + '/api/auth/decrypt-token/%s'
+AUTH_HEALTH_URL = AUTH_SERVICE_URL + '/health'
+
+# Pooled session (and a pool to run its calls concurrently) for Auth Service
+# credential lookups; connect fails fast, reads keep a 10 second budget
+auth_session = create_session(pool_maxsize=8, retries=2, backoff_factor=0.1)
+auth_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='auth-lookup')
+AUTH_SERVICE_TIMEOUT = (2, 10)
+
+# Bot credentials rarely change, so they are cached per account
+credentials_cache = TTLCache(maxsize=1024, ttl=Config.CREDENTIALS_CACHE_TTL)
+
+# Pooled session for dependency health probes (auth service, Telegram API)
+probe_session = create_session(pool_maxsize=4)
+probe_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='health-probe')
+
 # In-memory metrics (in production, use Redis or proper metrics store)
 account_metrics = {
     'lookups_total': 0,
@@ -28,40 +53,52 @@ def get_bot_credentials(account_id):
     """
     Get bot credentials for an account from the Auth Service
     (Imported from accounts.py for consistency)
-    """
-    import os
-    import requests
     
-    auth_service_url = os.getenv('TELEGIVE_AUTH_URL', 'https://web-production-ddd7e.up.railway.app')
+    Results are cached for CREDENTIALS_CACHE_TTL seconds (default 120);
+    call invalidate_bot_credentials after a token rotation.
+    """
+    credentials = credentials_cache.get(account_id)
+    if credentials is not None:
+        return credentials
     
     try:
-        # First, get account information to verify account exists and get bot_id
-        account_response = requests.get(
-            f"{auth_service_url}/api/auth/account/{account_id}",
-            timeout=10
+        # The token lookup only needs account_id, so it runs while the
+        # account is fetched; both calls then cost a single round trip
+        token_future = auth_executor.submit(
+            auth_session.get,
+            AUTH_DECRYPT_TOKEN_URL % account_id,
+            timeout=AUTH_SERVICE_TIMEOUT
         )
         
-        if account_response.status_code == 404:
-            raise AccountNotFoundError(account_id, {
-                "auth_service_response": "Account not found in auth service",
-                "auth_service_url": auth_service_url
-            })
-        elif account_response.status_code != 200:
-            raise Exception(f"Auth service error: {account_response.status_code}")
+        try:
+            # Get account information to verify account exists and get bot_id
+            account_response = auth_session.get(
+                AUTH_ACCOUNT_URL % account_id,
+                timeout=AUTH_SERVICE_TIMEOUT
+            )
             
-        account_data = account_response.json()
-        
-        if not account_data.get('success'):
-            raise Exception(f"Auth service error: {account_data.get('error', 'Unknown error')}")
+            if account_response.status_code == 404:
+                raise AccountNotFoundError(account_id, {
+                    "auth_service_response": "Account not found in auth service",
+                    "auth_service_url": AUTH_SERVICE_URL
+                })
+            elif account_response.status_code != 200:
+                raise Exception(f"Auth service error: {account_response.status_code}")
+                
+            account_data = account_response.json()
             
-        account_info = account_data['account']
-        bot_id = account_info['bot_id']
+            if not account_data.get('success'):
+                raise Exception(f"Auth service error: {account_data.get('error', 'Unknown error')}")
+                
+            account_info = account_data['account']
+            bot_id = account_info['bot_id']
+        except Exception:
+            # The token isn't needed once the account lookup failed
+            token_future.cancel()
+            raise
         
         # Get the decrypted bot token
-        token_response = requests.get(
-            f"{auth_service_url}/api/auth/decrypt-token/{account_id}",
-            timeout=10
-        )
+        token_response = token_future.result()
         
         if token_response.status_code == 404:
             raise Exception(f"Bot token not found for account {account_id}")
@@ -77,11 +114,13 @@ def get_bot_credentials(account_id):
         
         logger.info(f"Successfully retrieved bot credentials for account {account_id}")
         
-        return {
+        credentials = {
             'bot_token': bot_token,
             'bot_id': bot_id,
             'account_info': account_info
         }
+        credentials_cache.set(account_id, credentials)
+        return credentials
         
     except requests.exceptions.Timeout:
         logger.error(f"Timeout connecting to auth service for account {account_id}")
@@ -96,6 +135,10 @@ def get_bot_credentials(account_id):
         logger.error(f"Error getting bot credentials for account {account_id}: {str(e)}")
         raise
 
+def invalidate_bot_credentials(account_id):
+    """Drop cached bot credentials for an account (e.g. after a token rotation)"""
+    credentials_cache.pop(account_id)
+
 @monitoring_bp.route('/accounts/<int:account_id>/status', methods=['GET'])
 def get_account_status(account_id):
     """
@@ -152,13 +195,13 @@ def get_account_status(account_id):
             log_account_lookup(account_id, False, (time.time() - start_time) * 1000)
         
         # Check channel configuration in database
-        channel_config = ChannelConfig.query.filter_by(account_id=account_id).first()
+        channel_config = ChannelConfig.get_by_account(account_id)
         
         channel_status = {
             'has_channel_config': bool(channel_config),
             'channel_username': channel_config.channel_username if channel_config else None,
             'channel_verified': channel_config.is_validated if channel_config else False,
-            'last_validation': channel_config.last_validation_at.isoformat() + 'Z' if channel_config and channel_config.last_validation_at else None
+            'last_validation': channel_config.last_validation_at if channel_config else None
         }
         
         # Calculate response time
@@ -171,7 +214,7 @@ def get_account_status(account_id):
             'validations': validations,
             'channel_status': channel_status,
             'response_time_ms': round(response_time_ms, 2),
-            'timestamp': datetime.utcnow().isoformat() + 'Z'
+            'timestamp': datetime.utcnow()
         }
         
         if account_found:
@@ -191,7 +234,7 @@ def get_account_status(account_id):
             'error': 'Internal server error during account status check',
             'code': 'INTERNAL_ERROR',
             'account_id': account_id,
-            'timestamp': datetime.utcnow().isoformat() + 'Z'
+            'timestamp': datetime.utcnow()
         }), 500
 
 @monitoring_bp.route('/metrics', methods=['GET'])
@@ -206,20 +249,22 @@ def get_service_metrics():
         if account_metrics['lookups_total'] > 0:
             failure_rate = account_metrics['lookups_failed'] / account_metrics['lookups_total']
         
-        # Get database statistics
-        total_channels = ChannelConfig.query.count()
-        verified_channels = ChannelConfig.query.filter_by(is_validated=True).count()
-        
-        # Recent activity (last 24 hours)
+        # Get database statistics, including recent activity (last 24 hours),
+        # in a single round trip
         yesterday = datetime.utcnow() - timedelta(days=1)
-        recent_channels = ChannelConfig.query.filter(ChannelConfig.created_at >= yesterday).count()
+        channel_count = db.func.count(ChannelConfig.id)
+        total_channels, verified_channels, recent_channels = db.session.query(
+            channel_count,
+            channel_count.filter(ChannelConfig.is_validated.is_(True)),
+            channel_count.filter(ChannelConfig.created_at >= yesterday)
+        ).one()
         
         metrics = {
             'service': {
                 'name': 'channel-service',
                 'version': '1.0.0',
-                'uptime_since': account_metrics['last_reset'].isoformat() + 'Z',
-                'timestamp': datetime.utcnow().isoformat() + 'Z'
+                'uptime_since': account_metrics['last_reset'],
+                'timestamp': datetime.utcnow()
             },
             'account_lookups': {
                 'total': account_metrics['lookups_total'],
@@ -248,7 +293,7 @@ def get_service_metrics():
             'success': False,
             'error': 'Failed to retrieve service metrics',
             'code': 'METRICS_ERROR',
-            'timestamp': datetime.utcnow().isoformat() + 'Z'
+            'timestamp': datetime.utcnow()
         }), 500
 
 @monitoring_bp.route('/metrics/reset', methods=['POST'])
@@ -270,7 +315,7 @@ def reset_metrics():
         
         return jsonify(create_success_response({
             'message': 'Service metrics reset successfully',
-            'reset_at': datetime.utcnow().isoformat() + 'Z'
+            'reset_at': datetime.utcnow()
         })), 200
     
     except Exception as e:
@@ -290,6 +335,27 @@ def get_detailed_health():
     try:
         start_time = time.time()
         
+        def check_auth_service():
+            try:
+                auth_response = probe_session.get(AUTH_HEALTH_URL, timeout=5)
+                if auth_response.status_code == 200:
+                    return 'accessible', None
+                return 'error', f"HTTP {auth_response.status_code}"
+            except Exception as e:
+                return 'unreachable', str(e)
+        
+        def check_telegram_api():
+            try:
+                telegram_response = probe_session.get('https://api.telegram.org', timeout=5)
+                return ('accessible' if telegram_response.status_code in [200, 404] else 'error'), None
+            except Exception as e:
+                return 'unreachable', str(e)
+        
+        # Probe the auth service and Telegram API concurrently while the
+        # database check runs on the request thread
+        auth_future = probe_executor.submit(check_auth_service)
+        telegram_future = probe_executor.submit(check_telegram_api)
+        
         # Test database connection
         try:
             db.session.execute(db.text('SELECT 1')).fetchone()
@@ -299,26 +365,8 @@ def get_detailed_health():
             database_status = 'disconnected'
             database_error = str(e)
         
-        # Test auth service connection
-        try:
-            import requests
-            import os
-            auth_service_url = os.getenv('TELEGIVE_AUTH_URL', 'https://web-production-ddd7e.up.railway.app')
-            auth_response = requests.get(f"{auth_service_url}/health", timeout=5)
-            auth_service_status = 'accessible' if auth_response.status_code == 200 else 'error'
-            auth_service_error = None if auth_response.status_code == 200 else f"HTTP {auth_response.status_code}"
-        except Exception as e:
-            auth_service_status = 'unreachable'
-            auth_service_error = str(e)
-        
-        # Test Telegram API
-        try:
-            telegram_response = requests.get('https://api.telegram.org', timeout=5)
-            telegram_status = 'accessible' if telegram_response.status_code in [200, 404] else 'error'
-            telegram_error = None
-        except Exception as e:
-            telegram_status = 'unreachable'
-            telegram_error = str(e)
+        auth_service_status, auth_service_error = auth_future.result()
+        telegram_status, telegram_error = telegram_future.result()
         
         # Calculate overall health
         all_healthy = all([
@@ -335,7 +383,7 @@ def get_detailed_health():
             'service': 'channel-service',
             'version': '1.0.0',
             'status': overall_status,
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': datetime.utcnow(),
             'response_time_ms': round(response_time_ms, 2),
             'components': {
                 'database': {
@@ -345,7 +393,7 @@ def get_detailed_health():
                 'auth_service': {
                     'status': auth_service_status,
                     'error': auth_service_error,
-                    'url': os.getenv('TELEGIVE_AUTH_URL', 'https://web-production-ddd7e.up.railway.app')
+                    'url': AUTH_SERVICE_URL
                 },
                 'telegram_api': {
                     'status': telegram_status,
@@ -369,6 +417,6 @@ def get_detailed_health():
             'service': 'channel-service',
             'status': 'error',
             'error': 'Health check failed',
-            'timestamp': datetime.utcnow().isoformat() + 'Z'
+            'timestamp': datetime.utcnow()
         }), 500
 
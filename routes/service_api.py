@@ -9,11 +9,16 @@ from flask import Blueprint, request, jsonify
 from models import ChannelConfig, db
 from utils.service_auth import require_service_token, require_service_permission, get_requesting_service
 from utils.account_lookup import get_account_by_bot_id
+from routes.channels import invalidate_credentials
+from routes.monitoring import invalidate_bot_credentials
 
 logger = logging.getLogger(__name__)
 
 service_api_bp = Blueprint('service_api', __name__, url_prefix='/api/service')
 
+# Upper bound on bot_ids per batch request (they share one IN (...) query)
+MAX_BATCH_BOT_IDS = 500
+
 @service_api_bp.route('/channel/<int:bot_id>', methods=['GET'])
 @require_service_token
 @require_service_permission('read_channel_config')
@@ -44,7 +49,7 @@ def get_channel_config_for_service(bot_id):
             }), 404
         
         # Get channel configuration
-        channel_config = ChannelConfig.query.filter_by(account_id=bot_id).first()
+        channel_config = ChannelConfig.get_by_account(bot_id)
         
         if not channel_config:
             return jsonify({
@@ -67,7 +72,7 @@ def get_channel_config_for_service(bot_id):
                 'type': channel_config.channel_type,
                 'member_count': channel_config.channel_member_count,
                 'is_validated': channel_config.is_validated,
-                'last_validation_at': channel_config.last_validation_at.isoformat() if channel_config.last_validation_at else None,
+                'last_validation_at': channel_config.last_validation_at,
                 'permissions': {
                     'can_post_messages': channel_config.can_post_messages,
                     'can_edit_messages': channel_config.can_edit_messages,
@@ -75,11 +80,11 @@ def get_channel_config_for_service(bot_id):
                     'can_delete_messages': channel_config.can_delete_messages,
                     'can_pin_messages': channel_config.can_pin_messages
                 },
-                'created_at': channel_config.created_at.isoformat() if channel_config.created_at else None,
-                'updated_at': channel_config.updated_at.isoformat() if channel_config.updated_at else None
+                'created_at': channel_config.created_at,
+                'updated_at': channel_config.updated_at
             },
             'requested_by': service_name,
-            'timestamp': datetime.utcnow().isoformat() + 'Z'
+            'timestamp': datetime.utcnow()
         })
         
     except Exception as e:
@@ -121,7 +126,7 @@ def get_channel_status_for_service(bot_id):
             }), 404
         
         # Get channel configuration
-        channel_config = ChannelConfig.query.filter_by(account_id=bot_id).first()
+        channel_config = ChannelConfig.get_by_account(bot_id)
         
         if not channel_config:
             return jsonify({
@@ -132,7 +137,7 @@ def get_channel_status_for_service(bot_id):
                 'message': 'Channel not configured for this bot',
                 'next_steps': 'Bot owner needs to configure a channel first',
                 'requested_by': service_name,
-                'timestamp': datetime.utcnow().isoformat() + 'Z'
+                'timestamp': datetime.utcnow()
             })
         
         # Determine status
@@ -157,11 +162,11 @@ def get_channel_status_for_service(bot_id):
                 'username': channel_config.channel_username,
                 'title': channel_config.channel_title,
                 'is_validated': channel_config.is_validated,
-                'last_validation_at': channel_config.last_validation_at.isoformat() if channel_config.last_validation_at else None,
+                'last_validation_at': channel_config.last_validation_at,
                 'validation_error': channel_config.validation_error
             },
             'requested_by': service_name,
-            'timestamp': datetime.utcnow().isoformat() + 'Z'
+            'timestamp': datetime.utcnow()
         })
         
     except Exception as e:
@@ -175,7 +180,7 @@ def get_channel_status_for_service(bot_id):
 @service_api_bp.route('/channels/batch', methods=['POST'])
 @require_service_token
 @require_service_permission('read_channel_config')
-def get_multiple_channel_configs(bot_ids):
+def get_multiple_channel_configs():
     """
     Get channel configurations for multiple bots (batch endpoint)
     
@@ -211,8 +216,27 @@ def get_multiple_channel_configs(bot_ids):
                 'code': 'INVALID_BOT_IDS'
             }), 400
         
+        if len(bot_ids) > MAX_BATCH_BOT_IDS:
+            return jsonify({
+                'success': False,
+                'error': f'At most {MAX_BATCH_BOT_IDS} bot_ids can be requested at once',
+                'code': 'TOO_MANY_BOT_IDS'
+            }), 400
+        
+        # Results are keyed by integer bot_id; strings, bools and other values
+        # would miss that lookup or fail the whole query
+        if not all(type(bot_id) is int for bot_id in bot_ids):
+            return jsonify({
+                'success': False,
+                'error': 'bot_ids must contain only integers',
+                'code': 'INVALID_BOT_IDS'
+            }), 400
+        
         logger.info(f"Service {service_name} requesting batch channel configs for {len(bot_ids)} bots")
         
+        # Load every requested configuration with a single IN (...) query
+        channel_configs = ChannelConfig.get_by_accounts(bot_ids)
+        
         results = []
         
         for bot_id in bot_ids:
@@ -228,8 +252,7 @@ def get_multiple_channel_configs(bot_ids):
                     })
                     continue
                 
-                # Get channel configuration
-                channel_config = ChannelConfig.query.filter_by(account_id=bot_id).first()
+                channel_config = channel_configs.get(bot_id)
                 
                 if not channel_config:
                     results.append({
@@ -277,7 +300,7 @@ def get_multiple_channel_configs(bot_ids):
             'total_requested': len(bot_ids),
             'total_processed': len(results),
             'requested_by': service_name,
-            'timestamp': datetime.utcnow().isoformat() + 'Z'
+            'timestamp': datetime.utcnow()
         })
         
     except Exception as e:
@@ -288,6 +311,34 @@ def get_multiple_channel_configs(bot_ids):
             'code': 'INTERNAL_ERROR'
         }), 500
 
+@service_api_bp.route('/accounts/<int:bot_id>/credentials/invalidate', methods=['POST'])
+@require_service_token
+@require_service_permission('invalidate_credentials')
+def invalidate_account_credentials(bot_id):
+    """
+    Drop cached credentials for a bot (e.g. after its token was rotated)
+    
+    Only the caches of the worker process handling this request are cleared;
+    other processes refresh within CREDENTIALS_CACHE_TTL.
+    
+    POST /api/service/accounts/{bot_id}/credentials/invalidate
+    
+    Headers:
+        X-Service-Token: Valid service token
+    """
+    service_name = get_requesting_service()
+    logger.info("Service %s invalidating cached credentials for bot_id %s", service_name, bot_id)
+    
+    invalidate_credentials(bot_id)
+    invalidate_bot_credentials(bot_id)
+    
+    return jsonify({
+        'success': True,
+        'bot_id': bot_id,
+        'requested_by': service_name,
+        'timestamp': datetime.utcnow()
+    })
+
 @service_api_bp.route('/health', methods=['GET'])
 @require_service_token
 def service_health():
@@ -306,11 +357,12 @@ def service_health():
         'service': 'channel-service',
         'status': 'healthy',
         'requested_by': service_name,
-        'timestamp': datetime.utcnow().isoformat() + 'Z',
+        'timestamp': datetime.utcnow(),
         'available_endpoints': [
             'GET /api/service/channel/{bot_id}',
             'GET /api/service/channel/{bot_id}/status',
             'POST /api/service/channels/batch',
+            'POST /api/service/accounts/{bot_id}/credentials/invalidate',
             'GET /api/service/health'
         ]
     })
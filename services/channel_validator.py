@@ -1,8 +1,15 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List
 from datetime import datetime, timedelta
 from models import ChannelConfig, ChannelValidationHistory, db
-from utils import validate_channel_permissions, get_bot_info
+from utils import (
+    validate_channel_permissions,
+    apply_permission_check,
+    record_validation_error,
+    get_bot_member_info,
+    get_bot_info
+)
 from config.settings import Config
 
 logger = logging.getLogger(__name__)
@@ -14,6 +21,7 @@ class ChannelValidatorService:
     
     def __init__(self):
         self.validation_timeout = Config.VALIDATION_TIMEOUT
+        self.max_workers = Config.VALIDATION_CONCURRENCY
     
     def validate_single_channel(self, channel_config: ChannelConfig, bot_token: str, bot_id: int) -> Dict[str, Any]:
         """
@@ -28,21 +36,21 @@ class ChannelValidatorService:
             Dict containing validation result
         """
         try:
-            logger.info(f"Validating channel {channel_config.channel_username} for account {channel_config.account_id}")
+            logger.info("Validating channel %s for account %s", channel_config.channel_username, channel_config.account_id)
             
             # Perform validation
             result = validate_channel_permissions(channel_config, bot_token, bot_id)
             
             # Log result
             if result['valid']:
-                logger.info(f"Channel {channel_config.channel_username} validation successful")
+                logger.info("Channel %s validation successful", channel_config.channel_username)
             else:
-                logger.warning(f"Channel {channel_config.channel_username} validation failed: {result.get('error')}")
+                logger.warning("Channel %s validation failed: %s", channel_config.channel_username, result.get('error'))
             
             return result
         
         except Exception as e:
-            logger.error(f"Error validating channel {channel_config.channel_username}: {str(e)}")
+            logger.error("Error validating channel %s: %s", channel_config.channel_username, e)
             return {
                 'valid': False,
                 'error': f'Validation service error: {str(e)}'
@@ -52,6 +60,9 @@ class ChannelValidatorService:
         """
         Validate multiple channel configurations
         
+        Credential and Telegram lookups run concurrently; all results are then
+        written in a single transaction.
+        
         Args:
             channel_configs: List of ChannelConfig instances
             get_credentials_func: Function to get bot credentials for an account
@@ -66,44 +77,64 @@ class ChannelValidatorService:
             'validation_results': []
         }
         
-        for channel_config in channel_configs:
+        if not channel_configs:
+            return results
+        
+        def fetch_member_info(account_id, channel_id):
+            # Runs in a worker thread - must not touch the database session
+            credentials = get_credentials_func(account_id)
+            return get_bot_member_info(credentials['bot_token'], channel_id, credentials['bot_id'])
+        
+        # History rows are collected and inserted in one statement before the commit;
+        # every channel in the batch is stamped with the same validation time
+        history_records = []
+        validated_at = datetime.utcnow()
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(fetch_member_info, channel_config.account_id, channel_config.channel_id)
+                for channel_config in channel_configs
+            ]
+        
+        for channel_config, future in zip(channel_configs, futures):
             try:
-                # Get credentials for this account
-                credentials = get_credentials_func(channel_config.account_id)
-                bot_token = credentials['bot_token']
-                bot_id = credentials['bot_id']
-                
-                # Validate channel
-                validation_result = self.validate_single_channel(channel_config, bot_token, bot_id)
-                
-                result_entry = {
-                    'account_id': channel_config.account_id,
-                    'channel_username': channel_config.channel_username,
-                    'validation_result': validation_result
+                member_result = future.result()
+            except Exception as e:
+                logger.error("Error validating channel %s: %s", channel_config.channel_username, e)
+                validation_result = {
+                    'valid': False,
+                    'error': f'Service error: {str(e)}'
                 }
-                
-                results['validation_results'].append(result_entry)
+            else:
+                try:
+                    validation_result = apply_permission_check(channel_config, member_result, history_records, validated_at)
+                except Exception as e:
+                    logger.error("Error validating channel permissions: %s", e)
+                    validation_result = record_validation_error(channel_config, e, history_records, validated_at)
                 
                 if validation_result['valid']:
-                    results['successful_validations'] += 1
+                    logger.info("Channel %s validation successful", channel_config.channel_username)
                 else:
-                    results['failed_validations'] += 1
+                    logger.warning("Channel %s validation failed: %s", channel_config.channel_username, validation_result.get('error'))
             
-            except Exception as e:
-                logger.error(f"Error validating channel {channel_config.channel_username}: {str(e)}")
-                
-                result_entry = {
-                    'account_id': channel_config.account_id,
-                    'channel_username': channel_config.channel_username,
-                    'validation_result': {
-                        'valid': False,
-                        'error': f'Service error: {str(e)}'
-                    }
-                }
-                
-                results['validation_results'].append(result_entry)
+            results['validation_results'].append({
+                'account_id': channel_config.account_id,
+                'channel_username': channel_config.channel_username,
+                'validation_result': validation_result
+            })
+            
+            if validation_result['valid']:
+                results['successful_validations'] += 1
+            else:
                 results['failed_validations'] += 1
         
+        try:
+            ChannelValidationHistory.bulk_create(history_records)
+            db.session.commit()
+        except Exception as e:
+            logger.error("Error saving validation results: %s", e)
+            db.session.rollback()
+        
         return results
     
     def get_channels_needing_validation(self, max_age_hours: int = 24) -> List[ChannelConfig]:
@@ -127,11 +158,11 @@ class ChannelValidatorService:
                 )
             ).all()
             
-            logger.info(f"Found {len(channels)} channels needing validation")
+            logger.info("Found %s channels needing validation", len(channels))
             return channels
         
         except Exception as e:
-            logger.error(f"Error getting channels needing validation: {str(e)}")
+            logger.error("Error getting channels needing validation: %s", e)
             return []
     
     def get_validation_statistics(self, days: int = 7) -> Dict[str, Any]:
@@ -147,13 +178,18 @@ class ChannelValidatorService:
         try:
             cutoff_time = datetime.utcnow() - timedelta(days=days)
             
-            # Get validation history
-            validations = ChannelValidationHistory.query.filter(
+            # Stream only the columns the summary needs; yield_per fetches
+            # the window in chunks so memory stays flat however many rows match
+            validations = ChannelValidationHistory.query.with_entities(
+                ChannelValidationHistory.validation_result,
+                ChannelValidationHistory.validation_type,
+                ChannelValidationHistory.error_message
+            ).filter(
                 ChannelValidationHistory.validated_at >= cutoff_time
-            ).all()
+            ).yield_per(Config.QUERY_STREAM_BATCH_SIZE)
             
             stats = {
-                'total_validations': len(validations),
+                'total_validations': 0,
                 'successful_validations': 0,
                 'failed_validations': 0,
                 'validation_types': {},
@@ -161,6 +197,7 @@ class ChannelValidatorService:
             }
             
             for validation in validations:
+                stats['total_validations'] += 1
                 if validation.validation_result:
                     stats['successful_validations'] += 1
                 else:
@@ -184,7 +221,7 @@ class ChannelValidatorService:
             return stats
         
         except Exception as e:
-            logger.error(f"Error getting validation statistics: {str(e)}")
+            logger.error("Error getting validation statistics: %s", e)
             return {
                 'error': f'Statistics error: {str(e)}'
             }
@@ -213,7 +250,7 @@ class ChannelValidatorService:
             old_records.delete()
             db.session.commit()
             
-            logger.info(f"Cleaned up {count_to_delete} old validation history records")
+            logger.info("Cleaned up %s old validation history records", count_to_delete)
             
             return {
                 'success': True,
@@ -222,7 +259,7 @@ class ChannelValidatorService:
             }
         
         except Exception as e:
-            logger.error(f"Error cleaning up validation history: {str(e)}")
+            logger.error("Error cleaning up validation history: %s", e)
             db.session.rollback()
             return {
                 'success': False,
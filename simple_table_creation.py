@@ -7,114 +7,155 @@ This creates the table without foreign key constraints to avoid dependency issue
 import os
 import sys
 import logging
+import functools
 from datetime import datetime
 
 # Add the current directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from flask import Flask
-from models import db
+from sqlalchemy import create_engine, text
 from config.settings import Config
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def create_app():
-    """Create Flask app for database operations"""
-    app = Flask(__name__)
-    app.config.from_object(Config)
-    db.init_app(app)
-    return app
+# Tables and indexes for the Channel Service, without foreign key constraints
+SCHEMA_DDL = """
+    -- Create channel_configs table
+    CREATE TABLE IF NOT EXISTS channel_configs (
+        id BIGSERIAL PRIMARY KEY,
+        account_id BIGINT NOT NULL,
+        channel_id BIGINT NOT NULL,
+        channel_username VARCHAR(100) NOT NULL,
+        channel_title VARCHAR(255) NOT NULL,
+        channel_type VARCHAR(20) DEFAULT 'channel',
+        channel_member_count INTEGER DEFAULT 0,
+        can_post_messages BOOLEAN DEFAULT FALSE,
+        can_edit_messages BOOLEAN DEFAULT FALSE,
+        can_send_media_messages BOOLEAN DEFAULT FALSE,
+        can_delete_messages BOOLEAN DEFAULT FALSE,
+        can_pin_messages BOOLEAN DEFAULT FALSE,
+        is_validated BOOLEAN DEFAULT FALSE,
+        last_validation_at TIMESTAMP WITH TIME ZONE,
+        validation_error TEXT,
+        created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+    );
+    
+    -- One channel per account; the index also covers the columns the account
+    -- channel endpoints read, so those lookups can use index-only scans
+    CREATE UNIQUE INDEX IF NOT EXISTS ix_channel_configs_account_id_cov 
+    ON channel_configs(account_id) 
+    INCLUDE (id, channel_username, channel_title, channel_id, is_validated, 
+             last_validation_at, created_at, updated_at);
+    
+    -- The covering index above replaces the unique constraint and the
+    -- duplicate plain index older versions of the model created; the
+    -- constraint owns its index, so it has to be dropped as a constraint
+    -- (the DROP INDEX covers databases where it was a bare index)
+    ALTER TABLE channel_configs DROP CONSTRAINT IF EXISTS uq_channel_configs_account_id;
+    DROP INDEX IF EXISTS uq_channel_configs_account_id;
+    DROP INDEX IF EXISTS ix_channel_configs_account_id;
+    
+    -- Create indexes for performance
+    CREATE INDEX IF NOT EXISTS idx_channel_configs_channel_id 
+    ON channel_configs(channel_id);
+    
+    CREATE INDEX IF NOT EXISTS idx_channel_configs_last_validation_at 
+    ON channel_configs(last_validation_at);
+    
+    -- Create channel_validation_history table (matching SQLAlchemy model)
+    CREATE TABLE IF NOT EXISTS channel_validation_history (
+        id BIGSERIAL PRIMARY KEY,
+        channel_config_id BIGINT NOT NULL,
+        validation_type VARCHAR(50) NOT NULL,
+        validation_result BOOLEAN NOT NULL,
+        error_message TEXT,
+        permissions_snapshot JSONB,
+        validated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+    );
+    
+    -- Create index for validation history
+    CREATE INDEX IF NOT EXISTS idx_validation_history_config_id 
+    ON channel_validation_history(channel_config_id);
+    
+    CREATE INDEX IF NOT EXISTS idx_validation_history_validated_at 
+    ON channel_validation_history(validated_at);
+    
+    -- Tables created by db.create_all() in older versions have no column
+    -- defaults; the models now leave these timestamps to the database
+    ALTER TABLE channel_configs
+        ALTER COLUMN created_at SET DEFAULT now(),
+        ALTER COLUMN updated_at SET DEFAULT now();
+    ALTER TABLE channel_validation_history
+        ALTER COLUMN validated_at SET DEFAULT now();
+"""
+
+@functools.lru_cache(maxsize=1)
+def create_script_engine():
+    """Create (once) a single-connection engine for running this script standalone"""
+    return create_engine(Config.DATABASE_URL, pool_size=1, max_overflow=0)
 
-def create_tables_simple():
-    """Create tables using simple SQL without foreign key constraints"""
+def create_tables_simple(connection=None):
+    """
+    Create tables using simple SQL without foreign key constraints
+    
+    Args:
+        connection: Session or connection to run on (defaults to db.session)
+    """
+    if connection is None:
+        # Imported here so standalone runs don't load Flask and the models
+        from models import db
+        connection = db.session
+    
     try:
         logger.info("🗄️ Creating channel_configs table with simple SQL...")
         
-        # Create channel_configs table
-        db.session.execute(db.text("""
-            CREATE TABLE IF NOT EXISTS channel_configs (
-                id BIGSERIAL PRIMARY KEY,
-                account_id BIGINT NOT NULL,
-                channel_id BIGINT NOT NULL,
-                channel_username VARCHAR(100) NOT NULL,
-                channel_title VARCHAR(255) NOT NULL,
-                channel_type VARCHAR(20) DEFAULT 'channel',
-                channel_member_count INTEGER DEFAULT 0,
-                can_post_messages BOOLEAN DEFAULT FALSE,
-                can_edit_messages BOOLEAN DEFAULT FALSE,
-                can_send_media_messages BOOLEAN DEFAULT FALSE,
-                can_delete_messages BOOLEAN DEFAULT FALSE,
-                can_pin_messages BOOLEAN DEFAULT FALSE,
-                is_validated BOOLEAN DEFAULT FALSE,
-                last_validation_at TIMESTAMP WITH TIME ZONE,
-                validation_error TEXT,
-                created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
-            );
-        """))
-        
-        # Create unique constraint
-        db.session.execute(db.text("""
-            CREATE UNIQUE INDEX IF NOT EXISTS uq_channel_configs_account_id 
-            ON channel_configs(account_id);
-        """))
-        
-        # Create indexes for performance
-        db.session.execute(db.text("""
-            CREATE INDEX IF NOT EXISTS idx_channel_configs_channel_id 
-            ON channel_configs(channel_id);
-        """))
-        
-        # Create channel_validation_history table (matching SQLAlchemy model)
-        db.session.execute(db.text("""
-            CREATE TABLE IF NOT EXISTS channel_validation_history (
-                id BIGSERIAL PRIMARY KEY,
-                channel_config_id BIGINT NOT NULL,
-                validation_type VARCHAR(50) NOT NULL,
-                validation_result BOOLEAN NOT NULL,
-                error_message TEXT,
-                permissions_snapshot JSONB,
-                validated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
-            );
-        """))
-        
-        # Create index for validation history
-        db.session.execute(db.text("""
-            CREATE INDEX IF NOT EXISTS idx_validation_history_config_id 
-            ON channel_validation_history(channel_config_id);
-        """))
-        
-        db.session.commit()
+        # All DDL goes to the server as one multi-statement batch (a single
+        # round trip); every statement is idempotent
+        connection.execute(text(SCHEMA_DDL))
+        connection.commit()
         
         logger.info("✅ Tables created successfully!")
         
         # Test the tables
-        result = db.session.execute(db.text("SELECT COUNT(*) FROM channel_configs")).scalar()
-        logger.info(f"✅ channel_configs table accessible, count: {result}")
-        
-        result = db.session.execute(db.text("SELECT COUNT(*) FROM channel_validation_history")).scalar()
-        logger.info(f"✅ channel_validation_history table accessible, count: {result}")
+        config_count, history_count = connection.execute(text("""
+            SELECT
+                (SELECT COUNT(*) FROM channel_configs),
+                (SELECT COUNT(*) FROM channel_validation_history)
+        """)).one()
+        logger.info(f"✅ channel_configs table accessible, count: {config_count}")
+        logger.info(f"✅ channel_validation_history table accessible, count: {history_count}")
         
         return True
         
     except Exception as e:
         logger.error(f"❌ Error creating tables: {str(e)}")
-        db.session.rollback()
+        connection.rollback()
         return False
 
-def run_simple_migration():
-    """Run the simple migration"""
+def run_simple_migration(connection=None):
+    """
+    Run the simple migration
+    
+    Args:
+        connection: Session or connection to run on (defaults to db.session)
+    """
+    if connection is None:
+        # Imported here so standalone runs don't load Flask and the models
+        from models import db
+        connection = db.session
+    
     try:
         logger.info("🗄️ Starting simple table creation...")
         
         # Test database connection first
-        result = db.session.execute(db.text("SELECT 1 as test")).scalar()
+        result = connection.execute(text("SELECT 1 as test")).scalar()
         logger.info(f"✅ Database connection test: {result}")
         
         # Create tables
-        success = create_tables_simple()
+        success = create_tables_simple(connection)
         
         if success:
             logger.info("🎉 Simple migration completed successfully!")
@@ -129,15 +170,17 @@ def run_simple_migration():
 
 def main():
     """Main function"""
-    print("🗄️ Simple Channel Service Table Creation")
-    print("========================================")
-    print(f"Timestamp: {datetime.now().isoformat()}")
-    print()
+    # One write for the whole banner
+    print(
+        "🗄️ Simple Channel Service Table Creation\n"
+        "========================================\n"
+        f"Timestamp: {datetime.now().isoformat()}\n"
+    )
     
-    app = create_app()
+    engine = create_script_engine()
     
-    with app.app_context():
-        success = run_simple_migration()
+    with engine.connect() as connection:
+        success = run_simple_migration(connection)
         
         if success:
             print("\n✅ Table creation completed successfully!")
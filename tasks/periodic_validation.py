@@ -14,16 +14,18 @@ class PeriodicValidationTask:
     Handles periodic validation of all channel configurations
     """
     
-    def __init__(self, get_credentials_func: Callable[[int], Dict[str, Any]]):
+    def __init__(self, get_credentials_func: Callable[[int], Dict[str, Any]], app=None):
         """
         Initialize the periodic validation task
         
         Args:
             get_credentials_func: Function to get bot credentials for an account
+            app: Flask application whose context scheduled jobs run in
         """
         self.scheduler = BackgroundScheduler()
         self.validator_service = ChannelValidatorService()
         self.get_credentials_func = get_credentials_func
+        self.app = app
         self.validation_interval = Config.PERIODIC_VALIDATION_INTERVAL
         self.is_running = False
     
@@ -33,7 +35,8 @@ class PeriodicValidationTask:
             if not self.is_running:
                 # Add the periodic validation job
                 self.scheduler.add_job(
-                    func=self.run_periodic_validation,
+                    func=self.run_job,
+                    args=[self.run_periodic_validation],
                     trigger=IntervalTrigger(seconds=self.validation_interval),
                     id='periodic_channel_validation',
                     name='Periodic Channel Validation',
@@ -43,7 +46,8 @@ class PeriodicValidationTask:
                 
                 # Add cleanup job (runs daily)
                 self.scheduler.add_job(
-                    func=self.cleanup_old_validation_history,
+                    func=self.run_job,
+                    args=[self.cleanup_old_validation_history],
                     trigger=IntervalTrigger(hours=24),
                     id='validation_history_cleanup',
                     name='Validation History Cleanup',
@@ -53,12 +57,26 @@ class PeriodicValidationTask:
                 
                 self.scheduler.start()
                 self.is_running = True
-                logger.info(f"Periodic validation scheduler started with {self.validation_interval}s interval")
+                logger.info("Periodic validation scheduler started with %ss interval", self.validation_interval)
             else:
                 logger.warning("Scheduler is already running")
         
         except Exception as e:
-            logger.error(f"Error starting periodic validation scheduler: {str(e)}")
+            logger.error("Error starting periodic validation scheduler: %s", e)
+    
+    def run_job(self, job: Callable[[], None]):
+        """
+        Run a scheduled job inside the application context
+        
+        Args:
+            job: Job function to run
+        """
+        if self.app is None:
+            job()
+            return
+        
+        with self.app.app_context():
+            job()
     
     def stop_scheduler(self):
         """Stop the periodic validation scheduler"""
@@ -71,7 +89,7 @@ class PeriodicValidationTask:
                 logger.warning("Scheduler is not running")
         
         except Exception as e:
-            logger.error(f"Error stopping periodic validation scheduler: {str(e)}")
+            logger.error("Error stopping periodic validation scheduler: %s", e)
     
     def run_periodic_validation(self):
         """
@@ -89,7 +107,7 @@ class PeriodicValidationTask:
                 logger.info("No channels need validation at this time")
                 return
             
-            logger.info(f"Validating {len(channels_to_validate)} channels")
+            logger.info("Validating %s channels", len(channels_to_validate))
             
             # Run validation for all channels
             validation_results = self.validator_service.validate_multiple_channels(
@@ -101,16 +119,16 @@ class PeriodicValidationTask:
             end_time = datetime.utcnow()
             duration = (end_time - start_time).total_seconds()
             
-            logger.info(f"Periodic validation completed in {duration:.2f}s")
-            logger.info(f"Results: {validation_results['successful_validations']} successful, {validation_results['failed_validations']} failed")
+            logger.info("Periodic validation completed in %.2fs", duration)
+            logger.info("Results: %s successful, %s failed", validation_results['successful_validations'], validation_results['failed_validations'])
             
             # Log any failures
             for result in validation_results['validation_results']:
                 if not result['validation_result']['valid']:
-                    logger.warning(f"Validation failed for {result['channel_username']}: {result['validation_result'].get('error')}")
+                    logger.warning("Validation failed for %s: %s", result['channel_username'], result['validation_result'].get('error'))
         
         except Exception as e:
-            logger.error(f"Error in periodic validation: {str(e)}")
+            logger.error("Error in periodic validation: %s", e)
     
     def cleanup_old_validation_history(self):
         """
@@ -123,12 +141,12 @@ class PeriodicValidationTask:
             cleanup_result = self.validator_service.cleanup_old_validation_history(days_to_keep=30)
             
             if cleanup_result['success']:
-                logger.info(f"Cleaned up {cleanup_result['deleted_records']} old validation records")
+                logger.info("Cleaned up %s old validation records", cleanup_result['deleted_records'])
             else:
-                logger.error(f"Validation history cleanup failed: {cleanup_result['error']}")
+                logger.error("Validation history cleanup failed: %s", cleanup_result['error'])
         
         except Exception as e:
-            logger.error(f"Error in validation history cleanup: {str(e)}")
+            logger.error("Error in validation history cleanup: %s", e)
     
     def run_immediate_validation(self, account_id: int = None) -> Dict[str, Any]:
         """
@@ -141,11 +159,13 @@ class PeriodicValidationTask:
             Dict containing validation results
         """
         try:
-            logger.info(f"Starting immediate validation for account {account_id if account_id else 'all'}")
+            logger.info("Starting immediate validation for account %s", account_id if account_id else 'all')
             
             # Get channels to validate
             if account_id:
-                channels_to_validate = ChannelConfig.query.filter_by(account_id=account_id).all()
+                # account_id is unique, so there is at most one channel
+                channel_config = ChannelConfig.get_by_account(account_id)
+                channels_to_validate = [channel_config] if channel_config else []
             else:
                 channels_to_validate = ChannelConfig.query.all()
             
@@ -166,7 +186,7 @@ class PeriodicValidationTask:
                 get_credentials_func=self.get_credentials_func
             )
             
-            logger.info(f"Immediate validation completed: {validation_results['successful_validations']} successful, {validation_results['failed_validations']} failed")
+            logger.info("Immediate validation completed: %s successful, %s failed", validation_results['successful_validations'], validation_results['failed_validations'])
             
             return {
                 'success': True,
@@ -174,7 +194,7 @@ class PeriodicValidationTask:
             }
         
         except Exception as e:
-            logger.error(f"Error in immediate validation: {str(e)}")
+            logger.error("Error in immediate validation: %s", e)
             return {
                 'success': False,
                 'error': f'Immediate validation error: {str(e)}'
@@ -206,7 +226,7 @@ class PeriodicValidationTask:
             }
         
         except Exception as e:
-            logger.error(f"Error getting scheduler status: {str(e)}")
+            logger.error("Error getting scheduler status: %s", e)
             return {
                 'is_running': self.is_running,
                 'error': f'Status error: {str(e)}'
@@ -228,7 +248,8 @@ class PeriodicValidationTask:
                 
                 # Add job with new interval
                 self.scheduler.add_job(
-                    func=self.run_periodic_validation,
+                    func=self.run_job,
+                    args=[self.run_periodic_validation],
                     trigger=IntervalTrigger(seconds=new_interval),
                     id='periodic_channel_validation',
                     name='Periodic Channel Validation',
@@ -236,24 +257,25 @@ class PeriodicValidationTask:
                     max_instances=1
                 )
                 
-                logger.info(f"Updated validation interval to {new_interval}s")
+                logger.info("Updated validation interval to %ss", new_interval)
         
         except Exception as e:
-            logger.error(f"Error updating validation interval: {str(e)}")
+            logger.error("Error updating validation interval: %s", e)
 
 # Global instance for the application
 periodic_validator = None
 
-def initialize_periodic_validation(get_credentials_func: Callable[[int], Dict[str, Any]]):
+def initialize_periodic_validation(get_credentials_func: Callable[[int], Dict[str, Any]], app=None):
     """
     Initialize the global periodic validation instance
     
     Args:
         get_credentials_func: Function to get bot credentials
+        app: Flask application whose context scheduled jobs run in
     """
     global periodic_validator
     if periodic_validator is None:
-        periodic_validator = PeriodicValidationTask(get_credentials_func)
+        periodic_validator = PeriodicValidationTask(get_credentials_func, app)
         logger.info("Periodic validation task initialized")
 
 def start_periodic_validation():
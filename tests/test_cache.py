@@ -0,0 +1,55 @@
+import pytest
+from unittest.mock import patch
+from utils.cache import TTLCache
+
+class TestTTLCache:
+
+    def test_set_and_get(self):
+        """Test cached values are returned until they expire"""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set('key', {'bot_token': 'token'})
+
+        assert cache.get('key') == {'bot_token': 'token'}
+        assert 'key' in cache
+        assert cache.get('missing') is None
+        assert cache.get('missing', 'default') == 'default'
+
+    def test_entry_expires(self):
+        """Test entries expire after their TTL"""
+        cache = TTLCache(maxsize=10, ttl=60)
+
+        with patch('utils.cache.time.monotonic', return_value=1000.0):
+            cache.set('key', 'value')
+            cache.set('short', 'value', ttl=5)
+
+        with patch('utils.cache.time.monotonic', return_value=1010.0):
+            assert cache.get('key') == 'value'
+            assert cache.get('short') is None
+
+        with patch('utils.cache.time.monotonic', return_value=1061.0):
+            assert cache.get('key') is None
+            assert len(cache) == 0
+
+    def test_maxsize_evicts_oldest(self):
+        """Test the oldest entry is evicted when the cache is full"""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.set('c', 3)
+
+        assert len(cache) == 2
+        assert cache.get('a') is None
+        assert cache.get('b') == 2
+        assert cache.get('c') == 3
+
+    def test_pop_and_clear(self):
+        """Test explicit invalidation"""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+
+        assert cache.pop('a') == 1
+        assert cache.pop('a') is None
+
+        cache.clear()
+        assert len(cache) == 0
@@ -132,7 +132,7 @@ class TestChannelServicePerformance:
         # Should handle 100 sequential requests in under 10 seconds
         assert duration < 10.0
     
-    @patch('requests.get')
+    @patch('utils.telegram_api.telegram_session.get')
     def test_telegram_api_timeout_handling(self, mock_get):
         """Test handling of Telegram API timeouts"""
         mock_get.side_effect = requests.Timeout()
@@ -148,7 +148,7 @@ class TestChannelServicePerformance:
         assert result['success'] == False
         assert 'timeout' in result['error'].lower()
     
-    @patch('requests.get')
+    @patch('utils.telegram_api.telegram_session.get')
     def test_telegram_api_slow_response_handling(self, mock_get):
         """Test handling of slow Telegram API responses"""
         def slow_response(*args, **kwargs):
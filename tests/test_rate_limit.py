@@ -0,0 +1,44 @@
+import pytest
+from unittest.mock import patch
+from utils.rate_limit import TokenBucketLimiter
+
+class TestTokenBucketLimiter:
+
+    def test_burst_then_limited(self):
+        """Test a key may burst up to capacity, then has to wait"""
+        limiter = TokenBucketLimiter(capacity=3, refill_per_minute=60)
+
+        with patch('utils.rate_limit.time.monotonic', return_value=1000.0):
+            assert [limiter.acquire('a') for _ in range(3)] == [0, 0, 0]
+            assert limiter.acquire('a') == pytest.approx(1.0)
+            assert limiter.acquire('b') == 0
+
+    def test_tokens_refill(self):
+        """Test tokens come back at the refill rate, up to capacity"""
+        limiter = TokenBucketLimiter(capacity=2, refill_per_minute=60)
+
+        with patch('utils.rate_limit.time.monotonic', return_value=1000.0):
+            limiter.acquire('a')
+            limiter.acquire('a')
+
+        with patch('utils.rate_limit.time.monotonic', return_value=1001.0):
+            assert limiter.acquire('a') == 0
+            assert limiter.acquire('a') > 0
+
+        with patch('utils.rate_limit.time.monotonic', return_value=1100.0):
+            assert [limiter.acquire('a') for _ in range(2)] == [0, 0]
+            assert limiter.acquire('a') > 0
+
+    def test_maxsize_drops_refilled_buckets(self):
+        """Test tracked keys stay bounded"""
+        limiter = TokenBucketLimiter(capacity=2, refill_per_minute=60, maxsize=2)
+
+        with patch('utils.rate_limit.time.monotonic', return_value=1000.0):
+            limiter.acquire('a')
+            limiter.acquire('b')
+
+        with patch('utils.rate_limit.time.monotonic', return_value=1010.0):
+            limiter.acquire('c')
+
+        # 'a' and 'b' refilled, so they were dropped rather than kept around
+        assert list(limiter._buckets) == ['c']
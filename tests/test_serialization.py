@@ -0,0 +1,47 @@
+from datetime import datetime, timezone
+from flask import Flask
+from utils.serialization import ORJSONProvider, StaticJSONResponse
+
+class TestORJSONProvider:
+
+    def setup_method(self):
+        self.app = Flask(__name__)
+        self.app.json = ORJSONProvider(self.app)
+
+    def test_datetimes_serialize_as_utc_iso(self):
+        """Test naive and UTC datetimes are rendered as ISO strings with a 'Z' suffix"""
+        aware = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        payload = {
+            'created_at': datetime(2024, 1, 2, 3, 4, 5, 123456),
+            'verified_at': aware,
+            'updated_at': None
+        }
+
+        body = self.app.json.loads(self.app.json.dumps(payload))
+
+        assert body == {
+            'created_at': '2024-01-02T03:04:05.123456Z',
+            'verified_at': '2024-01-02T03:04:05Z',
+            'updated_at': None
+        }
+
+    def test_jsonify_response(self):
+        """Test jsonify builds a JSON response through the provider"""
+        with self.app.app_context():
+            response = self.app.json.response({'success': True, 'count': 3})
+
+        assert response.mimetype == 'application/json'
+        assert response.get_json() == {'success': True, 'count': 3}
+
+    def test_static_json_response(self):
+        """Test static responses reuse the encoded body but not the response object"""
+        static_response = StaticJSONResponse({'success': False, 'code': 'INTERNAL_ERROR'}, 500)
+
+        with self.app.app_context():
+            first = static_response()
+            second = static_response()
+
+        assert first is not second
+        assert first.status_code == 500
+        assert first.mimetype == 'application/json'
+        assert first.get_json() == {'success': False, 'code': 'INTERNAL_ERROR'}
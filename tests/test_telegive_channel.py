@@ -56,7 +56,21 @@ class TestChannelService:
         assert 'service' in data
         assert 'version' in data
         assert data['service'] == 'channel-service'
-    
+
+    @patch('routes.health.probe_session.get')
+    def test_health_caches_telegram_probe(self, mock_get, client):
+        """Test the Telegram probe is reused between health checks"""
+        from routes.health import probe_cache
+        probe_cache.clear()
+        mock_get.return_value = Mock(status_code=401)
+
+        client.get('/health')
+        response = client.get('/health')
+
+        assert response.get_json()['telegram_api'] == 'accessible'
+        assert mock_get.call_count == 1
+        probe_cache.clear()
+
     def test_root_endpoint(self, client):
         """Test root endpoint"""
         response = client.get('/')
@@ -67,7 +81,17 @@ class TestChannelService:
         assert 'version' in data
         assert 'status' in data
         assert 'endpoints' in data
-    
+
+    def test_cors_preflight(self, client):
+        """Test CORS preflight is answered with a cacheable response"""
+        response = client.options('/api/accounts/1/channel', headers={
+            'Origin': 'https://telegive-dashboard-production.up.railway.app',
+            'Access-Control-Request-Method': 'PUT'
+        })
+        assert response.status_code == 200
+        assert response.headers['Access-Control-Allow-Origin'] == 'https://telegive-dashboard-production.up.railway.app'
+        assert response.headers['Access-Control-Max-Age'] == '86400'
+
     @patch('utils.telegram_api.validate_channel_setup')
     def test_setup_channel_success(self, mock_validate, client):
         """Test successful channel setup"""
@@ -180,6 +204,45 @@ class TestChannelService:
         assert data['valid'] == False
         assert 'not found' in data['error'].lower()
     
+    @patch('routes.channels.validate_channel_permissions')
+    @patch('routes.channels.get_bot_credentials')
+    def test_validate_recently_validated_channel(self, mock_credentials, mock_validate, client):
+        """Test a channel validated within CHANNEL_REVALIDATION_TTL skips credentials and Telegram"""
+        from datetime import datetime, timedelta, timezone
+        channel_config = ChannelConfig(
+            id=1,
+            account_id=1,
+            channel_id=-1001234567890,
+            channel_username='testchannel',
+            channel_title='Test Channel',
+            is_validated=True,
+            last_validation_at=datetime.now(timezone.utc) - timedelta(seconds=30)
+        )
+        db.session.add(channel_config)
+        db.session.commit()
+        
+        response = client.get('/api/channels/validate/1')
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['valid'] == True
+        assert data['cached'] == True
+        assert data['channel_info']['username'] == 'testchannel'
+        mock_credentials.assert_not_called()
+        
+        # Outside the TTL the channel is checked with Telegram again
+        channel_config.last_validation_at = datetime.now(timezone.utc) - timedelta(hours=1)
+        db.session.commit()
+        # Reloaded from SQLite the value is naive; it's read as UTC
+        db.session.expire_all()
+        mock_credentials.return_value = {'bot_token': 'token', 'bot_id': 1}
+        mock_validate.return_value = {'valid': True}
+        
+        response = client.get('/api/channels/validate/1')
+        assert response.status_code == 200
+        assert 'cached' not in response.get_json()
+        mock_credentials.assert_called_once_with(1)
+        mock_validate.assert_called_once()
+    
     def test_get_channel_permissions(self, client, sample_channel_config):
         """Test getting channel permissions"""
         response = client.get('/api/channels/permissions/1')
@@ -236,6 +299,30 @@ class TestChannelService:
         data = response.get_json()
         assert data['success'] == True
     
+    def test_update_permissions_unknown_permission(self, client):
+        """Test updating permissions rejects non-permission fields"""
+        response = client.put('/api/channels/update-permissions', json={
+            'account_id': 1,
+            'permissions': {'can_post_messages': True, 'is_validated': True}
+        })
+        
+        assert response.status_code == 400
+        data = response.get_json()
+        assert data['success'] == False
+        assert data['code'] == 'UNKNOWN_PERMISSIONS'
+        assert 'is_validated' in data['error']
+    
+    def test_update_permissions_not_an_object(self, client):
+        """Test updating permissions rejects a list or string instead of an object"""
+        for permissions in (['can_post_messages'], 'can_post_messages'):
+            response = client.put('/api/channels/update-permissions', json={
+                'account_id': 1,
+                'permissions': permissions
+            })
+            
+            assert response.status_code == 400
+            assert response.get_json()['code'] == 'INVALID_PERMISSIONS'
+    
     def test_get_channel_info(self, client, sample_channel_config):
         """Test getting complete channel information"""
         response = client.get('/api/channels/info/1')
@@ -306,6 +393,10 @@ class TestChannelService:
         assert 'channels' in data
         assert data['total'] == 1
         assert data['channels'][0]['channel_username'] == 'testchannel'
+        assert set(data['channels'][0]) == {
+            'account_id', 'channel_id', 'channel_username',
+            'channel_title', 'is_validated', 'last_validation'
+        }
     
     def test_list_channels_empty(self, client):
         """Test listing channels when none exist"""
@@ -316,6 +407,289 @@ class TestChannelService:
         assert data['total'] == 0
         assert len(data['channels']) == 0
 
+    @patch('routes.channels.validate_account_exists', return_value=True)
+    @patch('routes.channels.get_bot_credentials')
+    @patch('utils.telegram_api.telegram_session.get')
+    def test_verify_channel_success(self, mock_get, mock_credentials, mock_exists, client):
+        """Test channel verification issues getMe, getChat and getChatMember once each"""
+        from utils.telegram_api import bot_info_cache
+        bot_info_cache.clear()
+        bot_token = '123456789:AAFakeTokenForFormatCheck_0123456789'
+        mock_credentials.return_value = {'bot_token': bot_token, 'bot_id': 123456789}
+
+        def telegram_response(url, **kwargs):
+            response = Mock()
+            if url.endswith('/getMe'):
+                response.json.return_value = {'ok': True, 'result': {'id': 123456789}}
+            elif url.endswith('/getChat'):
+                response.json.return_value = {'ok': True, 'result': {'id': -1001234567890, 'title': 'Test Channel', 'type': 'channel'}}
+            else:
+                response.json.return_value = {'ok': True, 'result': {
+                    'status': 'administrator',
+                    'can_post_messages': True,
+                    'can_edit_messages': True
+                }}
+            return response
+
+        mock_get.side_effect = telegram_response
+
+        response = client.post('/api/channels/verify', json={
+            'account_id': 1,
+            'channel_username': '@testchannel'
+        })
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['success'] == True
+        assert data['bot_is_admin'] == True
+        assert mock_get.call_count == 3
+        bot_info_cache.clear()
+
+    @patch('routes.channels.validate_account_exists', return_value=True)
+    @patch('routes.channels.get_bot_credentials')
+    @patch('utils.telegram_api.telegram_session.get')
+    def test_verify_channel_malformed_token(self, mock_get, mock_credentials, mock_exists, client):
+        """Test a malformed bot token is rejected without calling Telegram"""
+        mock_credentials.return_value = {'bot_token': 'dummy_token', 'bot_id': 123456789}
+
+        response = client.post('/api/channels/verify', json={
+            'account_id': 1,
+            'channel_username': '@testchannel'
+        })
+
+        assert response.status_code == 400
+        assert response.get_json()['code'] == 'INVALID_BOT_TOKEN'
+        mock_get.assert_not_called()
+
+    @patch('routes.service_api.get_account_by_bot_id')
+    def test_service_batch_channel_configs(self, mock_account, client):
+        """Test the service batch endpoint loads all requested channels at once"""
+        from utils.service_auth import VALID_SERVICE_TOKENS
+        mock_account.side_effect = lambda bot_id: {'id': bot_id * 10} if bot_id != 3 else None
+
+        db.session.add(ChannelConfig(
+            id=1,
+            account_id=1,
+            channel_id=-1001234567890,
+            channel_username='testchannel',
+            channel_title='Test Channel'
+        ))
+        db.session.commit()
+
+        headers = {'X-Service-Token': VALID_SERVICE_TOKENS['giveaway_service']}
+        with patch.object(ChannelConfig, 'get_by_account') as mock_get_by_account:
+            response = client.post('/api/service/channels/batch', json={'bot_ids': [1, 2, 3]}, headers=headers)
+            mock_get_by_account.assert_not_called()
+
+        assert response.status_code == 200
+        results = response.get_json()['results']
+        assert [result['bot_id'] for result in results] == [1, 2, 3]
+        assert results[0]['success'] == True
+        assert results[0]['channel']['username'] == 'testchannel'
+        assert results[1]['code'] == 'CHANNEL_NOT_CONFIGURED'
+        assert results[2]['code'] == 'ACCOUNT_NOT_FOUND'
+
+        response = client.post('/api/service/channels/batch', json={'bot_ids': list(range(501))}, headers=headers)
+        assert response.status_code == 400
+        assert response.get_json()['code'] == 'TOO_MANY_BOT_IDS'
+        
+        for bot_ids in ([1, '2'], [1, {}], [[1]], [True], ['abc'], [1.5]):
+            response = client.post('/api/service/channels/batch', json={'bot_ids': bot_ids}, headers=headers)
+            assert response.status_code == 400
+            assert response.get_json()['code'] == 'INVALID_BOT_IDS'
+
+    def test_save_account_channel_rejects_bad_bodies(self, client):
+        """Test oversized and non-object bodies are rejected before any lookup"""
+        oversized = '{"channel_username": "%s"}' % ('a' * config['testing'].MAX_CHANNEL_PAYLOAD_BYTES)
+        response = client.put('/api/accounts/1/channel', data=oversized, content_type='application/json')
+        assert response.status_code == 413
+        assert response.get_json()['code'] == 'PAYLOAD_TOO_LARGE'
+        
+        for body in ('not json', '[1, 2]'):
+            response = client.put('/api/accounts/1/channel', data=body, content_type='application/json')
+            assert response.status_code == 400
+            assert response.get_json()['code'] == 'INVALID_REQUEST'
+
+    @patch('utils.account_lookup.validate_account_exists', return_value=True)
+    def test_save_account_channel_skips_unchanged_write(self, mock_exists, client):
+        """Test re-saving an unchanged configuration doesn't issue an UPDATE"""
+        db.session.add(ChannelConfig(
+            id=1,
+            account_id=1,
+            channel_id=-1001234567890,
+            channel_username='@testchannel',
+            channel_title='Test Channel',
+            can_post_messages=True,
+            is_validated=True
+        ))
+        db.session.commit()
+        
+        body = {
+            'channel_username': '@testchannel',
+            'channel_title': 'Test Channel',
+            'permissions': {'can_post_messages': True}
+        }
+        with patch('routes.accounts.update') as mock_update:
+            response = client.put('/api/accounts/1/channel', json=body)
+            mock_update.assert_not_called()
+            
+            # Repeating is_verified: true isn't a change either
+            response = client.put('/api/accounts/1/channel', json=dict(body, is_verified=True))
+            mock_update.assert_not_called()
+        
+        assert response.status_code == 200
+        assert response.get_json()['channel']['channel_title'] == 'Test Channel'
+        
+        response = client.put('/api/accounts/1/channel', json=dict(body, channel_title='Renamed'))
+        assert response.status_code == 200
+        assert response.get_json()['channel']['channel_title'] == 'Renamed'
+        assert response.get_json()['channel']['verified_at'] is None
+        
+        # Turning the flag back on stamps the verification
+        client.put('/api/accounts/1/channel', json=dict(body, is_verified=False))
+        response = client.put('/api/accounts/1/channel', json=dict(body, is_verified=True))
+        assert response.get_json()['channel']['is_verified'] == True
+        assert response.get_json()['channel']['verified_at'] is not None
+        
+        response = client.put('/api/accounts/1/channel', json=dict(body, permissions=['can_post_messages']))
+        assert response.status_code == 400
+        assert response.get_json()['code'] == 'INVALID_PERMISSIONS'
+
+    @patch('utils.account_lookup.validate_account_exists', return_value=True)
+    def test_save_account_channel_missing_required_fields(self, mock_exists, client):
+        """Test a first save without the NOT NULL fields is a 400, not a database error"""
+        response = client.put('/api/accounts/1/channel', json={'channel_username': '@testchannel'})
+        
+        assert response.status_code == 400
+        data = response.get_json()
+        assert data['code'] == 'MISSING_REQUIRED_FIELDS'
+        assert data['missing_fields'] == ['channel_title', 'channel_id']
+        assert ChannelConfig.query.count() == 0
+    
+    def test_only_unique_violations_are_insert_races(self, client):
+        """Test NOT NULL violations aren't mistaken for a lost insert race"""
+        from sqlalchemy import insert
+        from sqlalchemy.exc import IntegrityError
+        from routes.accounts import is_unique_violation
+        
+        row = {'id': 1, 'account_id': 1, 'channel_id': -100, 'channel_username': '@a', 'channel_title': 'A'}
+        db.session.execute(insert(ChannelConfig).values(**row))
+        
+        with pytest.raises(IntegrityError) as duplicate:
+            db.session.execute(insert(ChannelConfig).values(**row))
+        assert is_unique_violation(duplicate.value)
+        db.session.rollback()
+        
+        with pytest.raises(IntegrityError) as not_null:
+            db.session.execute(insert(ChannelConfig).values(dict(row, channel_title=None)))
+        assert not is_unique_violation(not_null.value)
+        db.session.rollback()
+
+    @patch('utils.account_lookup.validate_account_exists', return_value=True)
+    def test_save_account_channel_concurrent_insert(self, mock_exists, client):
+        """Test a save that loses an insert race updates the existing row"""
+        db.session.add(ChannelConfig(
+            id=1,
+            account_id=1,
+            channel_id=-1001234567890,
+            channel_username='@testchannel',
+            channel_title='Test Channel'
+        ))
+        db.session.commit()
+        
+        # The row appears after the handler looked for it. SQLite doesn't
+        # autoincrement BIGINT keys, so the INSERT gets an id and then fails
+        # on account_id, as it would on Postgres
+        from sqlalchemy import insert
+        with patch.object(ChannelConfig, 'get_by_account', return_value=None), \
+                patch('routes.accounts.insert', side_effect=lambda table: insert(table).values(id=2)):
+            response = client.put('/api/accounts/1/channel', json={
+                'channel_username': '@testchannel',
+                'channel_title': 'Renamed',
+                'channel_id': -1001234567890
+            })
+        
+        assert response.status_code == 200
+        assert response.get_json()['channel']['id'] == 1
+        assert response.get_json()['channel']['channel_title'] == 'Renamed'
+
+    @patch('utils.account_lookup.validate_account_exists')
+    @patch('routes.channels.get_bot_credentials')
+    def test_channel_account_endpoints_skip_credentials(self, mock_credentials, mock_exists, client):
+        """Test the account channel endpoints only check the account exists"""
+        mock_exists.return_value = False
+        response = client.get('/api/channels/accounts/1/channel')
+        assert response.status_code == 404
+        assert response.get_json()['code'] == 'ACCOUNT_NOT_FOUND'
+        
+        mock_exists.return_value = True
+        response = client.delete('/api/channels/accounts/1/channel')
+        assert response.status_code == 404
+        assert response.get_json()['code'] == 'CHANNEL_NOT_CONFIGURED'
+        
+        mock_credentials.assert_not_called()
+
+    @patch('routes.channels.get_bot_credentials_from_db')
+    def test_bot_credentials_cached_until_invalidated(self, mock_credentials, app, client):
+        """Test channel endpoints cache bot credentials until the Auth Service invalidates them"""
+        from routes.channels import get_bot_credentials, credentials_cache
+        mock_credentials.return_value = {'bot_token': 'token', 'bot_id': 1, 'bot_name': 'Bot'}
+        credentials_cache.clear()
+        app_credentials_cache = app.extensions['credentials_cache']
+        app_credentials_cache.set(1, {'bot_token': 'token', 'bot_id': 1})
+        
+        assert get_bot_credentials(1) == {'bot_token': 'token', 'bot_id': 1}
+        assert get_bot_credentials(1) == {'bot_token': 'token', 'bot_id': 1}
+        assert mock_credentials.call_count == 1
+        
+        with patch.dict('utils.service_auth.VALID_SERVICE_TOKENS', {'auth_service': 'auth-token'}):
+            response = client.post('/api/service/accounts/1/credentials/invalidate',
+                                   headers={'X-Service-Token': 'auth-token'})
+        assert response.status_code == 200
+        assert 1 not in app_credentials_cache
+        
+        get_bot_credentials(1)
+        assert mock_credentials.call_count == 2
+        credentials_cache.clear()
+
+    @patch('routes.channels.ChannelConfig.get_by_account')
+    def test_unexpected_error_hides_details(self, mock_get_by_account, client):
+        """Test unhandled errors return the generic envelope without the exception text"""
+        mock_get_by_account.side_effect = RuntimeError('postgresql://user:secret@db/telegive')
+        
+        response = client.get('/api/channels/info/1')
+        assert response.status_code == 500
+        data = response.get_json()
+        assert data == {'success': False, 'error': 'Internal server error', 'code': 'INTERNAL_ERROR'}
+        assert b'secret' not in response.data
+        
+        # HTTP errors keep their status
+        response = client.post('/api/channels/setup', data='{', content_type='application/json')
+        assert response.status_code == 400
+    
+    def test_verify_channel_rate_limited(self, app, client):
+        """Test verify requests beyond an account's burst get 429 with Retry-After"""
+        from routes.channels import telegram_rate_limiter
+        app.config['RATE_LIMIT_ENABLED'] = True
+        telegram_rate_limiter.reset()
+        
+        try:
+            with patch.object(telegram_rate_limiter, 'capacity', 2):
+                for _ in range(2):
+                    response = client.post('/api/channels/verify', json={'account_id': 7})
+                    assert response.status_code == 400
+                
+                response = client.post('/api/channels/verify', json={'account_id': 7})
+                assert response.status_code == 429
+                assert response.get_json()['code'] == 'RATE_LIMITED'
+                assert int(response.headers['Retry-After']) > 0
+                
+                # Other accounts have their own bucket
+                response = client.post('/api/channels/verify', json={'account_id': 8})
+                assert response.status_code == 400
+        finally:
+            telegram_rate_limiter.reset()
+
 class TestChannelConfigModel:
     
     @pytest.fixture
@@ -398,6 +772,33 @@ class TestChannelConfigModel:
             assert updated_permissions['can_edit_messages'] == True
             assert updated_permissions['can_send_media_messages'] == True
 
+    def test_get_by_account_reuses_loaded_config(self, app):
+        """Test repeat lookups for an account within a session skip the query"""
+        with app.app_context():
+            db.create_all()
+            
+            config = ChannelConfig(
+                id=1,
+                account_id=1,
+                channel_id=-1001234567890,
+                channel_username='testchannel',
+                channel_title='Test Channel'
+            )
+            db.session.add(config)
+            db.session.commit()
+            
+            assert ChannelConfig.get_by_account(1) is config
+            assert ChannelConfig.get_by_account(2) is None
+            
+            with patch.object(ChannelConfig, 'query') as mock_query:
+                assert ChannelConfig.get_by_account(1) is config
+                mock_query.options.assert_not_called()
+            
+            db.session.delete(config)
+            db.session.commit()
+            
+            assert ChannelConfig.get_by_account(1) is None
+
 class TestValidationHistoryModel:
     
     @pytest.fixture
@@ -438,6 +839,36 @@ class TestValidationHistoryModel:
             assert history.validation_type == 'setup'
             assert history.validation_result == True
     
+    def test_validation_history_bulk_create(self, app):
+        """Test inserting several validation history records at once"""
+        with app.app_context():
+            db.create_all()
+            
+            ChannelValidationHistory.bulk_create([
+                {
+                    'id': 1,
+                    'channel_config_id': 1,
+                    'validation_type': 'permission_check',
+                    'validation_result': True,
+                    'permissions_snapshot': {'can_post_messages': True}
+                },
+                {
+                    'id': 2,
+                    'channel_config_id': 2,
+                    'validation_type': 'permission_check',
+                    'validation_result': False,
+                    'error_message': 'Test error'
+                }
+            ])
+            ChannelValidationHistory.bulk_create([])
+            db.session.commit()
+            
+            records = ChannelValidationHistory.query.order_by(ChannelValidationHistory.id).all()
+            assert len(records) == 2
+            assert records[0].permissions_snapshot == {'can_post_messages': True}
+            assert records[1].error_message == 'Test error'
+            assert records[1].validated_at is not None
+    
     def test_validation_history_to_dict(self, app):
         """Test converting validation history to dictionary"""
         with app.app_context():
@@ -456,3 +887,76 @@ class TestValidationHistoryModel:
             assert history_dict['validation_result'] == False
             assert history_dict['error_message'] == 'Test error'
 
+
+class TestAuthServiceClient:
+    
+    @pytest.fixture
+    def auth_client(self):
+        """Create an Auth Service client with an empty account cache"""
+        from utils.auth_service_client import AuthServiceClient
+        return AuthServiceClient()
+    
+    @patch('utils.auth_service_client.requests.Session.get')
+    def test_account_cached(self, mock_get, auth_client):
+        """Test found accounts are served from the cache until invalidated"""
+        mock_get.return_value = Mock(status_code=200, json=Mock(return_value={
+            'account': {'id': 1, 'bot_token': 'token', 'is_active': True}
+        }))
+        
+        assert auth_client.validate_account_exists(1) == True
+        assert auth_client.get_bot_credentials(1)['bot_token'] == 'token'
+        assert mock_get.call_count == 1
+        
+        auth_client.invalidate_account(1)
+        auth_client.get_account_by_bot_id(1)
+        assert mock_get.call_count == 2
+    
+    @patch('utils.auth_service_client.requests.Session.get')
+    def test_missing_account_cached(self, mock_get, auth_client):
+        """Test not-found answers are cached, errors are not"""
+        mock_get.return_value = Mock(status_code=404)
+        assert auth_client.get_account_by_bot_id(1) is None
+        assert auth_client.validate_account_exists(1) == False
+        assert mock_get.call_count == 1
+        
+        mock_get.return_value = Mock(status_code=500, text='error')
+        assert auth_client.get_account_by_bot_id(2) is None
+        assert auth_client.get_account_by_bot_id(2) is None
+        assert mock_get.call_count == 3
+
+class TestMonitoringCredentials:
+    
+    @patch('routes.monitoring.auth_session.get')
+    def test_bot_credentials_not_found(self, mock_get):
+        """Test a missing account raises AccountNotFoundError and isn't cached"""
+        from routes.monitoring import get_bot_credentials
+        from utils.error_handling import AccountNotFoundError
+        
+        mock_get.return_value = Mock(status_code=404)
+        
+        with pytest.raises(AccountNotFoundError):
+            get_bot_credentials(43)
+        with pytest.raises(AccountNotFoundError):
+            get_bot_credentials(43)
+    
+    @patch('routes.monitoring.auth_session.get')
+    def test_bot_credentials_cached(self, mock_get):
+        """Test credentials come from the Auth Service once and then from the cache"""
+        from routes.monitoring import get_bot_credentials, invalidate_bot_credentials
+        
+        # Both Auth Service calls run concurrently, so answer by URL
+        responses = {
+            'account': {'success': True, 'account': {'bot_id': 42}},
+            'decrypt-token': {'success': True, 'bot_token': 'token'}
+        }
+        mock_get.side_effect = lambda url, **kwargs: Mock(
+            status_code=200,
+            json=Mock(return_value=responses[url.split('/')[-2]])
+        )
+        
+        try:
+            assert get_bot_credentials(42)['bot_token'] == 'token'
+            assert get_bot_credentials(42)['bot_id'] == 42
+            assert mock_get.call_count == 2
+        finally:
+            invalidate_bot_credentials(42)
@@ -5,12 +5,21 @@ from utils.telegram_api import (
     get_channel_info,
     get_bot_member_info,
     validate_channel_setup,
-    get_bot_info
+    get_bot_info,
+    bot_info_cache,
+    looks_like_bot_token
 )
 
 class TestTelegramChannelIntegration:
     
-    @patch('requests.get')
+    @pytest.fixture(autouse=True)
+    def clear_bot_info_cache(self):
+        """Start every test without cached getMe results"""
+        bot_info_cache.clear()
+        yield
+        bot_info_cache.clear()
+    
+    @patch('utils.telegram_api.telegram_session.get')
     def test_get_channel_info_success(self, mock_get):
         """Test successful channel info retrieval"""
         mock_response = Mock()
@@ -35,7 +44,7 @@ class TestTelegramChannelIntegration:
         assert result['channel_info']['username'] == 'testchannel'
         assert result['channel_info']['members_count'] == 1000
     
-    @patch('requests.get')
+    @patch('utils.telegram_api.telegram_session.get')
     def test_get_channel_info_not_found(self, mock_get):
         """Test channel not found scenario"""
         mock_response = Mock()
@@ -48,7 +57,7 @@ class TestTelegramChannelIntegration:
         assert result['success'] == False
         assert 'not found' in result['error'].lower() or 'not accessible' in result['error'].lower()
     
-    @patch('requests.get')
+    @patch('utils.telegram_api.telegram_session.get')
     def test_get_channel_info_api_error(self, mock_get):
         """Test Telegram API error response"""
         mock_response = Mock()
@@ -64,7 +73,7 @@ class TestTelegramChannelIntegration:
         assert result['success'] == False
         assert result['error'] == 'Chat not found'
     
-    @patch('requests.get')
+    @patch('utils.telegram_api.telegram_session.get')
     def test_get_channel_info_timeout(self, mock_get):
         """Test channel info request timeout"""
         mock_get.side_effect = requests.Timeout()
@@ -74,7 +83,7 @@ class TestTelegramChannelIntegration:
         assert result['success'] == False
         assert 'timeout' in result['error'].lower()
     
-    @patch('requests.get')
+    @patch('utils.telegram_api.telegram_session.get')
     def test_get_channel_info_network_error(self, mock_get):
         """Test network error during channel info request"""
         mock_get.side_effect = requests.RequestException('Network error')
@@ -86,7 +95,7 @@ class TestTelegramChannelIntegration:
     
     def test_get_channel_info_username_formatting(self):
         """Test channel username formatting"""
-        with patch('requests.get') as mock_get:
+        with patch('utils.telegram_api.telegram_session.get') as mock_get:
             mock_response = Mock()
             mock_response.ok = True
             mock_response.json.return_value = {
@@ -113,7 +122,7 @@ class TestTelegramChannelIntegration:
                 params = call[1]['params']
                 assert params['chat_id'].startswith('@')
     
-    @patch('requests.get')
+    @patch('utils.telegram_api.telegram_session.get')
     def test_get_bot_member_info_success(self, mock_get):
         """Test successful bot member info retrieval"""
         mock_response = Mock()
@@ -139,7 +148,7 @@ class TestTelegramChannelIntegration:
         assert result['member_info']['can_edit_messages'] == True
         assert result['member_info']['can_send_media_messages'] == True
     
-    @patch('requests.get')
+    @patch('utils.telegram_api.telegram_session.get')
     def test_get_bot_member_info_not_member(self, mock_get):
         """Test bot not member scenario"""
         mock_response = Mock()
@@ -155,7 +164,7 @@ class TestTelegramChannelIntegration:
         assert result['success'] == False
         assert 'user not found' in result['error'].lower()
     
-    @patch('requests.get')
+    @patch('utils.telegram_api.telegram_session.get')
     def test_get_bot_member_info_timeout(self, mock_get):
         """Test bot member info request timeout"""
         mock_get.side_effect = requests.Timeout()
@@ -288,7 +297,7 @@ class TestTelegramChannelIntegration:
         assert result['success'] == False
         assert result['error'] == 'User not found in chat'
     
-    @patch('requests.get')
+    @patch('utils.telegram_api.telegram_session.get')
     def test_get_bot_info_success(self, mock_get):
         """Test successful bot info retrieval"""
         mock_response = Mock()
@@ -311,7 +320,33 @@ class TestTelegramChannelIntegration:
         assert result['bot_info']['username'] == 'test_bot'
         assert result['bot_info']['is_bot'] == True
     
-    @patch('requests.get')
+    @patch('utils.telegram_api.telegram_session.get')
+    def test_get_bot_info_cached(self, mock_get):
+        """Test a successful getMe result is reused for the same token"""
+        mock_response = Mock()
+        mock_response.ok = True
+        mock_response.json.return_value = {
+            'ok': True,
+            'result': {'id': 1234567890, 'username': 'test_bot', 'is_bot': True}
+        }
+        mock_get.return_value = mock_response
+        
+        first = get_bot_info('bot_token')
+        second = get_bot_info('bot_token')
+        
+        assert first == second
+        assert second['bot_info']['id'] == 1234567890
+        assert mock_get.call_count == 1
+    
+    def test_looks_like_bot_token(self):
+        """Test the local bot token format check"""
+        assert looks_like_bot_token('123456789:AAFakeTokenForFormatCheck_0123456789')
+        assert not looks_like_bot_token('dummy_token')
+        assert not looks_like_bot_token('262662172:short')
+        assert not looks_like_bot_token(None)
+        assert not looks_like_bot_token('')
+    
+    @patch('utils.telegram_api.telegram_session.get')
     def test_get_bot_info_invalid_token(self, mock_get):
         """Test bot info with invalid token"""
         mock_response = Mock()
@@ -324,7 +359,7 @@ class TestTelegramChannelIntegration:
         assert result['success'] == False
         assert 'invalid bot token' in result['error'].lower()
     
-    @patch('requests.get')
+    @patch('utils.telegram_api.telegram_session.get')
     def test_get_bot_info_api_error(self, mock_get):
         """Test bot info with API error"""
         mock_response = Mock()
@@ -340,7 +375,7 @@ class TestTelegramChannelIntegration:
         assert result['success'] == False
         assert result['error'] == 'Unauthorized'
     
-    @patch('requests.get')
+    @patch('utils.telegram_api.telegram_session.get')
     def test_get_bot_info_timeout(self, mock_get):
         """Test bot info request timeout"""
         mock_get.side_effect = requests.Timeout()
@@ -352,7 +387,7 @@ class TestTelegramChannelIntegration:
 
 class TestTelegramAPIErrorHandling:
     
-    @patch('requests.get')
+    @patch('utils.telegram_api.telegram_session.get')
     def test_unexpected_response_format(self, mock_get):
         """Test handling of unexpected response format"""
         mock_response = Mock()
@@ -367,7 +402,7 @@ class TestTelegramAPIErrorHandling:
         assert result['success'] == False
         assert 'error' in result
     
-    @patch('requests.get')
+    @patch('utils.telegram_api.telegram_session.get')
     def test_json_decode_error(self, mock_get):
         """Test handling of JSON decode error"""
         mock_response = Mock()
@@ -380,7 +415,7 @@ class TestTelegramAPIErrorHandling:
         assert result['success'] == False
         assert 'error' in result
     
-    @patch('requests.get')
+    @patch('utils.telegram_api.telegram_session.get')
     def test_connection_error(self, mock_get):
         """Test handling of connection error"""
         mock_get.side_effect = requests.ConnectionError('Connection failed')
@@ -7,6 +7,9 @@ from .telegram_api import (
 )
 
 from .validation import (
+    stage_validation_record,
+    apply_permission_check,
+    record_validation_error,
     validate_channel_permissions,
     setup_channel_configuration,
     revalidate_channel
@@ -38,6 +41,8 @@ from .account_lookup import (
     get_account_by_bot_id,
     get_bot_credentials_from_db,
     validate_account_exists,
+    get_account_with_channel,
+    invalidate_account,
     get_account_database_id
 )
 
@@ -47,6 +52,9 @@ __all__ = [
     'validate_channel_setup',
     'get_bot_info',
     'TelegramAPIError',
+    'stage_validation_record',
+    'apply_permission_check',
+    'record_validation_error',
     'validate_channel_permissions',
     'setup_channel_configuration',
     'revalidate_channel',
@@ -69,6 +77,8 @@ __all__ = [
     'get_account_by_bot_id',
     'get_bot_credentials_from_db',
     'validate_account_exists',
+    'get_account_with_channel',
+    'invalidate_account',
     'get_account_database_id'
 ]
 
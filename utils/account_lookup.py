@@ -2,10 +2,16 @@
 Account lookup utilities - Updated to use Auth Service API
 """
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from models import ChannelConfig
 from utils.auth_service_client import auth_client
+from config.settings import Config
 
 logger = logging.getLogger(__name__)
 
+# Runs Auth Service account checks alongside the request's database query
+lookup_executor = ThreadPoolExecutor(max_workers=Config.ACCOUNT_LOOKUP_CONCURRENCY, thread_name_prefix='account-lookup')
+
 def get_account_by_bot_id(bot_id):
     """
     Get account information using Auth Service API
@@ -16,7 +22,7 @@ def get_account_by_bot_id(bot_id):
     Returns:
         dict: Account information or None if not found
     """
-    logger.info(f"🔍 Looking up account for bot_id: {bot_id} via Auth Service")
+    logger.info("🔍 Looking up account for bot_id: %s via Auth Service", bot_id)
     return auth_client.get_account_by_bot_id(bot_id)
 
 def get_bot_credentials_from_db(bot_id):
@@ -32,7 +38,7 @@ def get_bot_credentials_from_db(bot_id):
     Raises:
         Exception: If account not found or credentials unavailable
     """
-    logger.info(f"🔑 Getting bot credentials for bot_id: {bot_id} via Auth Service")
+    logger.info("🔑 Getting bot credentials for bot_id: %s via Auth Service", bot_id)
     
     credentials = auth_client.get_bot_credentials(bot_id)
     
@@ -51,9 +57,42 @@ def validate_account_exists(bot_id):
     Returns:
         bool: True if account exists and is active
     """
-    logger.info(f"✅ Validating account exists for bot_id: {bot_id} via Auth Service")
+    logger.info("✅ Validating account exists for bot_id: %s via Auth Service", bot_id)
     return auth_client.validate_account_exists(bot_id)
 
+def get_account_with_channel(bot_id, *options):
+    """
+    Validate an account and load its channel configuration
+    
+    The Auth Service check runs on a worker thread while the channel
+    configuration is read from the database, so the caller waits for the
+    slower of the two instead of both in turn.
+    
+    Args:
+        bot_id (int): The Telegram bot ID
+        *options: Optional loader options for the ChannelConfig query
+            (e.g. ChannelConfig.load_summary())
+        
+    Returns:
+        tuple: (account_exists, ChannelConfig or None)
+    """
+    account_future = lookup_executor.submit(validate_account_exists, bot_id)
+    channel_config = ChannelConfig.get_by_account(bot_id, *options)
+    return account_future.result(), channel_config
+
+def invalidate_account(bot_id):
+    """
+    Forget the cached Auth Service account for a bot_id
+    
+    Call this when the cached credentials turn out to be stale (e.g. Telegram
+    rejects the bot token after it was rotated).
+    
+    Args:
+        bot_id (int): The Telegram bot ID
+    """
+    logger.info("♻️ Invalidating cached account for bot_id: %s", bot_id)
+    auth_client.invalidate_account(bot_id)
+
 def get_account_database_id(bot_id):
     """
     Get the database primary key ID for a bot_id
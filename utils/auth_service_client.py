@@ -4,63 +4,112 @@ Handles authentication and communication with Auth Service
 """
 
 import os
+import atexit
 import logging
 import requests
 from typing import Dict, Optional
+from utils.cache import TTLCache
+from utils.http_client import create_session
 
 logger = logging.getLogger(__name__)
 
+# Cached marker for bot IDs the Auth Service reported as not found
+ACCOUNT_NOT_FOUND = object()
+
 class AuthServiceClient:
     """Client for communicating with Auth Service API"""
     
     def __init__(self):
-        self.base_url = os.getenv('AUTH_SERVICE_URL', 'https://web-production-ddd7e.up.railway.app')
+        self.base_url = os.getenv('AUTH_SERVICE_URL', 'https://web-production-ddd7e.up.railway.app').rstrip('/')
+        self.account_url = self.base_url + '/api/accounts/%s'
         self.service_token = os.getenv('AUTH_SERVICE_TOKEN', 'ch4nn3l_s3rv1c3_t0k3n_2025_s3cur3_r4nd0m_str1ng')
         self.headers = {
             'Content-Type': 'application/json',
             'X-Service-Token': self.service_token
         }
         
+        # Pooled keep-alive connections, so lookups don't pay a new TCP/TLS
+        # handshake each time; idempotent GETs retry on 502/503/504
+        self.session = create_session(
+            pool_maxsize=int(os.getenv('AUTH_POOL_SIZE', 10)),
+            retries=int(os.getenv('AUTH_RETRIES', 2))
+        )
+        self.session.headers.update(self.headers)
+        
+        # Accounts found recently, so an existence check followed by a
+        # credentials lookup for the same bot costs one Auth Service call
+        self.account_cache = TTLCache(maxsize=1024, ttl=int(os.getenv('ACCOUNT_CACHE_TTL', 60)))
+        # Not-found answers are cached briefly so polling for a missing
+        # account doesn't hit the Auth Service on every request
+        self.missing_account_ttl = int(os.getenv('ACCOUNT_MISS_CACHE_TTL', 10))
+        
     def get_account_by_bot_id(self, bot_id: int) -> Optional[Dict]:
         """
         Get account information from Auth Service
         
+        Found accounts are cached for ACCOUNT_CACHE_TTL seconds (default 60),
+        accounts the Auth Service reports as missing for ACCOUNT_MISS_CACHE_TTL
+        seconds (default 10). Errors are never cached.
+        
         Args:
             bot_id (int): The Telegram bot ID
             
         Returns:
             dict: Account information or None if not found
         """
+        account = self.account_cache.get(bot_id)
+        if account is ACCOUNT_NOT_FOUND:
+            return None
+        
+        if account is None:
+            account = self._fetch_account(bot_id)
+            if account is not None:
+                self.account_cache.set(bot_id, account)
+        
+        return account
+    
+    def invalidate_account(self, bot_id: int):
+        """
+        Drop a cached account so the next lookup asks the Auth Service again
+        
+        Args:
+            bot_id (int): The Telegram bot ID
+        """
+        self.account_cache.pop(bot_id)
+    
+    def _fetch_account(self, bot_id: int) -> Optional[Dict]:
+        """Request account information from Auth Service (uncached)"""
         try:
-            logger.info(f"🔍 Getting account from Auth Service for bot_id: {bot_id}")
+            logger.info("🔍 Getting account from Auth Service for bot_id: %s", bot_id)
             
-            url = f"{self.base_url}/api/accounts/{bot_id}"
-            logger.info(f"📡 Auth Service URL: {url}")
+            url = self.account_url % bot_id
+            logger.info("📡 Auth Service URL: %s", url)
             
-            response = requests.get(url, headers=self.headers, timeout=10)
-            logger.info(f"📡 Auth Service response status: {response.status_code}")
+            response = self.session.get(url, timeout=10)
+            logger.info("📡 Auth Service response status: %s", response.status_code)
             
             if response.status_code == 200:
                 data = response.json()
-                logger.info(f"✅ Account found in Auth Service for bot_id: {bot_id}")
+                logger.info("✅ Account found in Auth Service for bot_id: %s", bot_id)
                 # Extract account data from nested response
                 if 'account' in data:
                     return data['account']  # Return the account object directly
                 else:
-                    logger.warning(f"⚠️ Unexpected response structure: {data}")
+                    logger.warning("⚠️ Unexpected response structure: %s", data)
                     return data  # Fallback to full response
             elif response.status_code == 404:
-                logger.warning(f"❌ Account not found in Auth Service for bot_id: {bot_id}")
+                logger.warning("❌ Account not found in Auth Service for bot_id: %s", bot_id)
+                self.account_cache.set(bot_id, ACCOUNT_NOT_FOUND, ttl=self.missing_account_ttl)
                 return None
             else:
-                logger.error(f"❌ Auth Service error: {response.status_code} - {response.text}")
+                logger.error("❌ Auth Service error: %s - %s", response.status_code, response.text)
                 return None
                 
         except requests.exceptions.RequestException as e:
-            logger.error(f"❌ Auth Service request failed: {str(e)}")
+            logger.error("❌ Auth Service request failed: %s", e)
             return None
         except Exception as e:
-            logger.error(f"❌ Unexpected error calling Auth Service: {str(e)}")
+            logger.error("❌ Unexpected error calling Auth Service: %s", e)
             return None
     
     def get_bot_credentials(self, bot_id: int) -> Optional[Dict]:
@@ -74,25 +123,27 @@ class AuthServiceClient:
             dict: Bot credentials with bot_token, or None if not found
         """
         try:
-            logger.info(f"🔑 Getting bot credentials from Auth Service for bot_id: {bot_id}")
+            logger.info("🔑 Getting bot credentials from Auth Service for bot_id: %s", bot_id)
             
             account = self.get_account_by_bot_id(bot_id)
             
             if not account:
-                logger.error(f"❌ No account found for bot_id: {bot_id}")
+                logger.error("❌ No account found for bot_id: %s", bot_id)
                 return None
             
             # Extract bot token from account
             bot_token = account.get('bot_token')
             
             if not bot_token:
-                logger.error(f"❌ No bot_token found in account for bot_id: {bot_id}")
-                logger.info(f"📋 Available fields: {list(account.keys())}")
+                logger.error("❌ No bot_token found in account for bot_id: %s", bot_id)
+                logger.info("📋 Available fields: %s", list(account.keys()))
                 return None
             
-            logger.info(f"✅ Bot token retrieved successfully for bot_id: {bot_id}")
-            logger.info(f"🔑 Token format: {'VALID' if ':' in str(bot_token) else 'INVALID'}")
-            logger.info(f"🔑 Token length: {len(str(bot_token))}")
+            logger.info("✅ Bot token retrieved successfully for bot_id: %s", bot_id)
+            if logger.isEnabledFor(logging.INFO):
+                token_str = str(bot_token)
+                logger.info("🔑 Token format: %s", 'VALID' if ':' in token_str else 'INVALID')
+                logger.info("🔑 Token length: %s", len(token_str))
             
             return {
                 'bot_token': bot_token,
@@ -103,9 +154,13 @@ class AuthServiceClient:
             }
             
         except Exception as e:
-            logger.error(f"❌ Error getting bot credentials: {str(e)}")
+            logger.error("❌ Error getting bot credentials: %s", e)
             return None
     
+    def close(self):
+        """Close the pooled connections to the Auth Service"""
+        self.session.close()
+    
     def validate_account_exists(self, bot_id: int) -> bool:
         """
         Validate that an account exists for the given bot_id
@@ -120,11 +175,12 @@ class AuthServiceClient:
             account = self.get_account_by_bot_id(bot_id)
             return account is not None and account.get('is_active', False)
         except Exception as e:
-            logger.error(f"❌ Error validating account existence for bot_id {bot_id}: {str(e)}")
+            logger.error("❌ Error validating account existence for bot_id %s: %s", bot_id, e)
             return False
 
 # Global client instance
 auth_client = AuthServiceClient()
+atexit.register(auth_client.close)
 
 # Convenience functions for backward compatibility
 def get_account_by_bot_id(bot_id: int) -> Optional[Dict]:
@@ -139,3 +195,7 @@ def validate_account_exists(bot_id: int) -> bool:
     """Validate account exists using Auth Service"""
     return auth_client.validate_account_exists(bot_id)
 
+def invalidate_account(bot_id: int):
+    """Drop the cached Auth Service account for bot_id"""
+    auth_client.invalidate_account(bot_id)
+
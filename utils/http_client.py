@@ -0,0 +1,36 @@
+"""
+Shared HTTP session helpers
+Pooled requests sessions so outgoing calls reuse keep-alive connections
+"""
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+def create_session(pool_maxsize: int = 10, retries: int = 0, backoff_factor: float = 0.2,
+                   status_forcelist=(502, 503, 504)) -> requests.Session:
+    """
+    Create a requests session with a connection pool mounted for http and https
+
+    Args:
+        pool_maxsize: Maximum number of connections kept per host
+        retries: Number of retries for idempotent requests (0 disables retries)
+        backoff_factor: Backoff factor between retries
+        status_forcelist: HTTP status codes that trigger a retry
+
+    Returns:
+        Configured requests.Session
+    """
+    max_retries = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=status_forcelist,
+        allowed_methods=['GET', 'HEAD'],
+        raise_on_status=False
+    ) if retries else 0
+
+    adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize, max_retries=max_retries)
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
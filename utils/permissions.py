@@ -17,7 +17,7 @@ def check_required_permissions(permissions: Dict[str, bool]) -> Dict[str, Any]:
     """
     missing_permissions = []
     
-    for required_perm in Config.REQUIRED_PERMISSIONS:
+    for required_perm in sorted(Config.REQUIRED_PERMISSIONS):
         if not permissions.get(required_perm, False):
             missing_permissions.append(required_perm)
     
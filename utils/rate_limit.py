@@ -0,0 +1,127 @@
+"""
+In-process rate limiting for Channel Management Service
+"""
+import threading
+import time
+from functools import wraps
+from typing import Callable, Hashable
+
+from flask import current_app, jsonify, request
+
+
+class TokenBucketLimiter:
+    """
+    Thread-safe token bucket per key
+
+    Each key may burst up to capacity requests, after which tokens refill at
+    a steady rate. When more than maxsize keys are tracked, full buckets
+    (which behave exactly like new ones) are dropped first, then the oldest.
+    """
+
+    def __init__(self, capacity: int = 20, refill_per_minute: float = 10, maxsize: int = 10000):
+        """
+        Initialize the limiter
+
+        Args:
+            capacity: Maximum burst of requests per key
+            refill_per_minute: Tokens added back per key every minute
+            maxsize: Maximum number of keys to track
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_per_minute / 60.0
+        self.maxsize = maxsize
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: Hashable) -> float:
+        """
+        Take a token for a key
+
+        Args:
+            key: Rate limit key (e.g. account ID)
+
+        Returns:
+            0 if the request is allowed, otherwise seconds until a token is available
+        """
+        now = time.monotonic()
+
+        with self._lock:
+            bucket = self._buckets.pop(key, None)
+            if bucket is None:
+                if len(self._buckets) >= self.maxsize:
+                    self._evict(now)
+                tokens = float(self.capacity)
+            else:
+                tokens, updated_at = bucket
+                tokens = min(self.capacity, tokens + (now - updated_at) * self.refill_rate)
+
+            if tokens >= 1:
+                self._buckets[key] = (tokens - 1, now)
+                return 0.0
+
+            self._buckets[key] = (tokens, now)
+            return (1 - tokens) / self.refill_rate
+
+    def reset(self):
+        """Forget all buckets"""
+        with self._lock:
+            self._buckets.clear()
+
+    def _evict(self, now: float):
+        """Drop buckets that have refilled, then the oldest one if still full"""
+        for key in [k for k, (tokens, updated_at) in self._buckets.items()
+                    if tokens + (now - updated_at) * self.refill_rate >= self.capacity]:
+            del self._buckets[key]
+
+        if len(self._buckets) >= self.maxsize:
+            del self._buckets[next(iter(self._buckets))]
+
+
+def account_rate_key() -> str:
+    """
+    Rate limit key for the current request: the account_id from the URL or
+    JSON body, falling back to the client address
+    """
+    account_id = (request.view_args or {}).get('account_id')
+    if account_id is None:
+        data = request.get_json(silent=True)
+        if isinstance(data, dict):
+            account_id = data.get('account_id')
+
+    if account_id is not None:
+        return f"account:{account_id}"
+    return f"addr:{request.remote_addr}"
+
+
+def rate_limited(limiter: TokenBucketLimiter, key_func: Callable[[], Hashable] = account_rate_key):
+    """
+    Decorator rejecting requests with 429 once the caller's bucket is empty
+
+    Args:
+        limiter: Token bucket shared by the decorated endpoints
+        key_func: Returns the rate limit key for the current request
+
+    Returns:
+        Decorator for Flask view functions
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if not current_app.config.get('RATE_LIMIT_ENABLED', True):
+                return view(*args, **kwargs)
+
+            retry_after = limiter.acquire(key_func())
+            if retry_after:
+                response = jsonify({
+                    'success': False,
+                    'error': 'Too many requests, please retry later',
+                    'code': 'RATE_LIMITED',
+                    'retry_after': int(retry_after) + 1
+                })
+                response.status_code = 429
+                response.headers['Retry-After'] = str(int(retry_after) + 1)
+                return response
+
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,42 @@
+"""
+JSON serialization helpers for Channel Management Service
+"""
+from typing import Any
+
+import orjson
+from flask import current_app
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+
+
+class ORJSONProvider(JSONProvider):
+    """
+    JSON provider backed by orjson
+
+    Datetimes are written natively as ISO 8601 UTC strings ('...Z'); naive
+    values are treated as UTC, matching how timestamps are stored. Types
+    orjson can't encode fall back to Flask's default conversions.
+    """
+
+    option = orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=DefaultJSONProvider.default, option=self.option).decode()
+
+    def loads(self, s, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
+class StaticJSONResponse:
+    """
+    JSON response with a fixed body that is encoded once
+
+    Calling the instance builds a fresh response (responses are mutable, e.g.
+    CORS adds headers) around the pre-encoded bytes.
+    """
+
+    def __init__(self, payload: Any, status: int = 200):
+        self.body = orjson.dumps(payload)
+        self.status = status
+
+    def __call__(self):
+        return current_app.response_class(self.body, status=self.status, mimetype='application/json')
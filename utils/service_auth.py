@@ -132,7 +132,8 @@ SERVICE_PERMISSIONS = {
     ],
     'auth_service': [
         'read_account_info',
-        'verify_account_status'
+        'verify_account_status',
+        'invalidate_credentials'
     ]
 }
 
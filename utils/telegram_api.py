@@ -1,14 +1,70 @@
+import hashlib
+import re
 import requests
 import logging
 from typing import Dict, Any, Optional
 from config.settings import Config
+from utils.cache import TTLCache
+from utils.http_client import create_session
 
 logger = logging.getLogger(__name__)
 
+# Shared session so Telegram calls reuse pooled keep-alive connections
+# instead of opening a new TLS connection per request; transient 5xx
+# responses are retried with backoff (429s are not, since retrying early
+# only extends Telegram's flood wait)
+telegram_session = create_session(
+    pool_maxsize=Config.VALIDATION_CONCURRENCY,
+    retries=Config.TELEGRAM_MAX_RETRIES,
+    backoff_factor=0.25,
+    status_forcelist=(500, 502, 503, 504)
+)
+
+# (connect, read) timeouts so an unreachable API fails fast
+TELEGRAM_TIMEOUT = (Config.TELEGRAM_CONNECT_TIMEOUT, Config.VALIDATION_TIMEOUT)
+
+# Bot tokens look like '<numeric bot id>:<secret>'
+_BOT_TOKEN_RE = re.compile(r'\d{5,12}:[A-Za-z0-9_-]{30,}')
+
+# Bot API method URL template, resolved once instead of on every call
+_METHOD_URL = f"{Config.TELEGRAM_API_BASE}/bot{{}}/{{}}".format
+
+# Successful getMe payloads keyed by a hash of the bot token; failures are
+# never cached so a fixed token is picked up immediately
+bot_info_cache = TTLCache(maxsize=256, ttl=Config.BOT_INFO_CACHE_TTL)
+
 class TelegramAPIError(Exception):
     """Custom exception for Telegram API errors"""
     pass
 
+def looks_like_bot_token(bot_token: Optional[str]) -> bool:
+    """
+    Check locally whether a value has the shape of a bot token
+    
+    Values that fail this check (missing, encrypted or placeholder tokens)
+    can't pass getMe, so callers can skip the Telegram round trip.
+    
+    Args:
+        bot_token: Value to check
+    
+    Returns:
+        True if the value looks like a bot token
+    """
+    return bool(bot_token) and _BOT_TOKEN_RE.fullmatch(str(bot_token)) is not None
+
+def method_url(bot_token: str, method: str) -> str:
+    """
+    Build the Bot API URL for a method
+    
+    Args:
+        bot_token: Bot token for authentication
+        method: Bot API method name (e.g. getMe)
+    
+    Returns:
+        Method URL
+    """
+    return _METHOD_URL(bot_token, method)
+
 def get_channel_info(bot_token: str, channel_username: str) -> Dict[str, Any]:
     """
     Get channel information from Telegram API
@@ -25,10 +81,10 @@ def get_channel_info(bot_token: str, channel_username: str) -> Dict[str, Any]:
         if not channel_username.startswith('@'):
             channel_username = f'@{channel_username}'
         
-        url = f"{Config.TELEGRAM_API_BASE}/bot{bot_token}/getChat"
+        url = method_url(bot_token, 'getChat')
         params = {'chat_id': channel_username}
         
-        response = requests.get(url, params=params, timeout=Config.VALIDATION_TIMEOUT)
+        response = telegram_session.get(url, params=params, timeout=TELEGRAM_TIMEOUT)
         
         if response.ok:
             data = response.json()
@@ -66,7 +122,7 @@ def get_channel_info(bot_token: str, channel_username: str) -> Dict[str, Any]:
             'error': f'Network error: {str(e)}'
         }
     except Exception as e:
-        logger.error(f"Unexpected error in get_channel_info: {str(e)}")
+        logger.error("Unexpected error in get_channel_info: %s", e)
         return {
             'success': False,
             'error': f'Unexpected error: {str(e)}'
@@ -85,13 +141,13 @@ def get_bot_member_info(bot_token: str, channel_id: int, bot_id: int) -> Dict[st
         Dict containing success status and member info or error
     """
     try:
-        url = f"{Config.TELEGRAM_API_BASE}/bot{bot_token}/getChatMember"
+        url = method_url(bot_token, 'getChatMember')
         params = {
             'chat_id': channel_id,
             'user_id': bot_id
         }
         
-        response = requests.get(url, params=params, timeout=Config.VALIDATION_TIMEOUT)
+        response = telegram_session.get(url, params=params, timeout=TELEGRAM_TIMEOUT)
         
         if response.ok:
             data = response.json()
@@ -130,7 +186,7 @@ def get_bot_member_info(bot_token: str, channel_id: int, bot_id: int) -> Dict[st
             'error': f'Network error: {str(e)}'
         }
     except Exception as e:
-        logger.error(f"Unexpected error in get_bot_member_info: {str(e)}")
+        logger.error("Unexpected error in get_bot_member_info: %s", e)
         return {
             'success': False,
             'error': f'Unexpected error: {str(e)}'
@@ -175,7 +231,7 @@ def validate_channel_setup(bot_token: str, bot_id: int, channel_username: str) -
         missing_permissions = []
         permissions = member_info
         
-        for required_perm in Config.REQUIRED_PERMISSIONS:
+        for required_perm in sorted(Config.REQUIRED_PERMISSIONS):
             if not permissions.get(required_perm, False):
                 missing_permissions.append(required_perm)
         
@@ -199,12 +255,41 @@ def validate_channel_setup(bot_token: str, bot_id: int, channel_username: str) -
         }
     
     except Exception as e:
-        logger.error(f"Unexpected error in validate_channel_setup: {str(e)}")
+        logger.error("Unexpected error in validate_channel_setup: %s", e)
         return {
             'success': False,
             'error': f'Validation failed: {str(e)}'
         }
 
+def _token_key(bot_token: str) -> str:
+    """Cache key for a bot token that doesn't keep the token itself"""
+    return hashlib.sha256(bot_token.encode('utf-8')).hexdigest()
+
+def get_me(bot_token: str) -> Dict[str, Any]:
+    """
+    Call Telegram getMe, reusing a recent successful result for the same token
+    
+    Args:
+        bot_token: Bot token for authentication
+    
+    Returns:
+        Raw getMe response payload
+    
+    Raises:
+        requests.RequestException: If the request fails
+    """
+    key = _token_key(bot_token)
+    data = bot_info_cache.get(key)
+    if data is not None:
+        return data
+    
+    response = telegram_session.get(method_url(bot_token, 'getMe'), timeout=TELEGRAM_TIMEOUT)
+    data = response.json()
+    if data.get('ok'):
+        bot_info_cache.set(key, data)
+    
+    return data
+
 def get_bot_info(bot_token: str) -> Dict[str, Any]:
     """
     Get bot information from Telegram API
@@ -216,32 +301,37 @@ def get_bot_info(bot_token: str) -> Dict[str, Any]:
         Dict containing bot information or error
     """
     try:
-        url = f"{Config.TELEGRAM_API_BASE}/bot{bot_token}/getMe"
-        
-        response = requests.get(url, timeout=Config.VALIDATION_TIMEOUT)
-        
-        if response.ok:
-            data = response.json()
-            if data.get('ok'):
-                bot_info = data['result']
-                return {
-                    'success': True,
-                    'bot_info': {
-                        'id': bot_info.get('id'),
-                        'username': bot_info.get('username'),
-                        'first_name': bot_info.get('first_name'),
-                        'is_bot': bot_info.get('is_bot', False)
-                    }
-                }
-            else:
+        data = bot_info_cache.get(_token_key(bot_token))
+        if data is None:
+            url = method_url(bot_token, 'getMe')
+            
+            response = telegram_session.get(url, timeout=TELEGRAM_TIMEOUT)
+            
+            if not response.ok:
                 return {
                     'success': False,
-                    'error': data.get('description', 'Unknown Telegram API error')
+                    'error': f'HTTP {response.status_code}: Invalid bot token'
                 }
+            
+            data = response.json()
+            if data.get('ok'):
+                bot_info_cache.set(_token_key(bot_token), data)
+        
+        if data.get('ok'):
+            bot_info = data['result']
+            return {
+                'success': True,
+                'bot_info': {
+                    'id': bot_info.get('id'),
+                    'username': bot_info.get('username'),
+                    'first_name': bot_info.get('first_name'),
+                    'is_bot': bot_info.get('is_bot', False)
+                }
+            }
         else:
             return {
                 'success': False,
-                'error': f'HTTP {response.status_code}: Invalid bot token'
+                'error': data.get('description', 'Unknown Telegram API error')
             }
     
     except requests.Timeout:
@@ -255,7 +345,7 @@ def get_bot_info(bot_token: str) -> Dict[str, Any]:
             'error': f'Network error: {str(e)}'
         }
     except Exception as e:
-        logger.error(f"Unexpected error in get_bot_info: {str(e)}")
+        logger.error("Unexpected error in get_bot_info: %s", e)
         return {
             'success': False,
             'error': f'Unexpected error: {str(e)}'
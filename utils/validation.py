@@ -7,6 +7,170 @@ from config.settings import Config
 
 logger = logging.getLogger(__name__)
 
+def stage_validation_record(channel_config: ChannelConfig, result: bool, error_message: Optional[str] = None,
+                            permissions: Optional[Dict[str, Any]] = None, history_records: Optional[list] = None):
+    """
+    Stage a permission check history record for a channel configuration
+    
+    Args:
+        channel_config: ChannelConfig instance
+        result: Whether the validation succeeded
+        error_message: Optional error message
+        permissions: Optional permissions snapshot
+        history_records: Optional list collecting rows for
+            ChannelValidationHistory.bulk_create; when omitted the record is
+            added to the session
+    """
+    if history_records is not None:
+        history_records.append({
+            'channel_config_id': channel_config.id,
+            'validation_type': 'permission_check',
+            'validation_result': result,
+            'error_message': error_message,
+            'permissions_snapshot': permissions
+        })
+        return
+    
+    validation_record = ChannelValidationHistory.create_validation_record(
+        channel_config_id=channel_config.id,
+        validation_type='permission_check',
+        result=result,
+        error_message=error_message,
+        permissions=permissions
+    )
+    db.session.add(validation_record)
+
+def apply_permission_check(channel_config: ChannelConfig, member_result: Dict[str, Any],
+                           history_records: Optional[list] = None,
+                           validated_at: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    Apply a bot member lookup result to a channel configuration
+    
+    Updates the validation status and stages a validation history record in
+    the session without committing, so callers can persist several channels
+    in a single transaction.
+    
+    Args:
+        channel_config: ChannelConfig instance
+        member_result: Result of get_bot_member_info for the channel
+        history_records: Optional list collecting history rows for a bulk insert
+        validated_at: Optional validation time shared by a batch (defaults to now)
+    
+    Returns:
+        Dict containing validation result
+    """
+    validated_at = validated_at or datetime.utcnow()
+    
+    if not member_result['success']:
+        # Log validation failure
+        stage_validation_record(channel_config, False, member_result['error'], history_records=history_records)
+        
+        # Update channel config
+        channel_config.is_validated = False
+        channel_config.last_validation_at = validated_at
+        channel_config.validation_error = member_result['error']
+        
+        return {
+            'valid': False,
+            'error': member_result['error'],
+            'permissions_changed': False
+        }
+    
+    member_info = member_result['member_info']
+    
+    # Check if bot is still administrator
+    if member_info['status'] != 'administrator':
+        error_msg = 'Bot is no longer an administrator in the channel'
+        
+        # Log validation failure
+        stage_validation_record(channel_config, False, error_msg, member_info, history_records)
+        
+        # Update channel config
+        channel_config.is_validated = False
+        channel_config.last_validation_at = validated_at
+        channel_config.validation_error = error_msg
+        
+        return {
+            'valid': False,
+            'error': error_msg,
+            'permissions_changed': False
+        }
+    
+    # Compare current permissions with stored permissions
+    current_permissions = {
+        'can_post_messages': member_info.get('can_post_messages', False),
+        'can_edit_messages': member_info.get('can_edit_messages', False),
+        'can_send_media_messages': member_info.get('can_send_media_messages', False),
+        'can_delete_messages': member_info.get('can_delete_messages', False),
+        'can_pin_messages': member_info.get('can_pin_messages', False)
+    }
+    
+    stored_permissions = channel_config.get_permissions_dict()
+    permissions_changed = current_permissions != stored_permissions
+    
+    # Check if required permissions are still present
+    missing_permissions = []
+    for required_perm in sorted(Config.REQUIRED_PERMISSIONS):
+        if not current_permissions.get(required_perm, False):
+            missing_permissions.append(required_perm)
+    
+    validation_successful = len(missing_permissions) == 0
+    
+    # Update stored permissions if changed
+    if permissions_changed:
+        channel_config.update_permissions(current_permissions)
+    
+    # Update validation status
+    channel_config.is_validated = validation_successful
+    channel_config.last_validation_at = validated_at
+    
+    if validation_successful:
+        channel_config.validation_error = None
+    else:
+        channel_config.validation_error = f'Missing required permissions: {", ".join(missing_permissions)}'
+    
+    # Log validation result
+    stage_validation_record(channel_config, validation_successful, channel_config.validation_error,
+                            current_permissions, history_records)
+    
+    return {
+        'valid': validation_successful,
+        'permissions_changed': permissions_changed,
+        'current_permissions': current_permissions,
+        'missing_permissions': missing_permissions if not validation_successful else []
+    }
+
+def record_validation_error(channel_config: ChannelConfig, error: Exception,
+                            history_records: Optional[list] = None,
+                            validated_at: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    Mark a channel configuration as invalid after an unexpected error
+    
+    Stages the failure in the session without committing.
+    
+    Args:
+        channel_config: ChannelConfig instance
+        error: Exception raised during validation
+        history_records: Optional list collecting history rows for a bulk insert
+        validated_at: Optional validation time shared by a batch (defaults to now)
+    
+    Returns:
+        Dict containing validation result
+    """
+    error_message = f'Validation error: {str(error)}'
+    
+    stage_validation_record(channel_config, False, error_message, history_records=history_records)
+    
+    channel_config.is_validated = False
+    channel_config.last_validation_at = validated_at or datetime.utcnow()
+    channel_config.validation_error = error_message
+    
+    return {
+        'valid': False,
+        'error': error_message,
+        'permissions_changed': False
+    }
+
 def validate_channel_permissions(channel_config: ChannelConfig, bot_token: str, bot_id: int) -> Dict[str, Any]:
     """
     Validate current permissions for a channel configuration
@@ -23,130 +187,20 @@ def validate_channel_permissions(channel_config: ChannelConfig, bot_token: str,
         # Get current bot member info from Telegram
         member_result = get_bot_member_info(bot_token, channel_config.channel_id, bot_id)
         
-        if not member_result['success']:
-            # Log validation failure
-            validation_record = ChannelValidationHistory.create_validation_record(
-                channel_config_id=channel_config.id,
-                validation_type='permission_check',
-                result=False,
-                error_message=member_result['error']
-            )
-            db.session.add(validation_record)
-            
-            # Update channel config
-            channel_config.is_validated = False
-            channel_config.last_validation_at = datetime.utcnow()
-            channel_config.validation_error = member_result['error']
-            
-            db.session.commit()
-            
-            return {
-                'valid': False,
-                'error': member_result['error'],
-                'permissions_changed': False
-            }
-        
-        member_info = member_result['member_info']
-        
-        # Check if bot is still administrator
-        if member_info['status'] != 'administrator':
-            error_msg = 'Bot is no longer an administrator in the channel'
-            
-            # Log validation failure
-            validation_record = ChannelValidationHistory.create_validation_record(
-                channel_config_id=channel_config.id,
-                validation_type='permission_check',
-                result=False,
-                error_message=error_msg,
-                permissions=member_info
-            )
-            db.session.add(validation_record)
-            
-            # Update channel config
-            channel_config.is_validated = False
-            channel_config.last_validation_at = datetime.utcnow()
-            channel_config.validation_error = error_msg
-            
-            db.session.commit()
-            
-            return {
-                'valid': False,
-                'error': error_msg,
-                'permissions_changed': False
-            }
-        
-        # Compare current permissions with stored permissions
-        current_permissions = {
-            'can_post_messages': member_info.get('can_post_messages', False),
-            'can_edit_messages': member_info.get('can_edit_messages', False),
-            'can_send_media_messages': member_info.get('can_send_media_messages', False),
-            'can_delete_messages': member_info.get('can_delete_messages', False),
-            'can_pin_messages': member_info.get('can_pin_messages', False)
-        }
-        
-        stored_permissions = channel_config.get_permissions_dict()
-        permissions_changed = current_permissions != stored_permissions
-        
-        # Check if required permissions are still present
-        missing_permissions = []
-        for required_perm in Config.REQUIRED_PERMISSIONS:
-            if not current_permissions.get(required_perm, False):
-                missing_permissions.append(required_perm)
-        
-        validation_successful = len(missing_permissions) == 0
-        
-        # Update stored permissions if changed
-        if permissions_changed:
-            channel_config.update_permissions(current_permissions)
-        
-        # Update validation status
-        channel_config.is_validated = validation_successful
-        channel_config.last_validation_at = datetime.utcnow()
-        
-        if validation_successful:
-            channel_config.validation_error = None
-        else:
-            channel_config.validation_error = f'Missing required permissions: {", ".join(missing_permissions)}'
-        
-        # Log validation result
-        validation_record = ChannelValidationHistory.create_validation_record(
-            channel_config_id=channel_config.id,
-            validation_type='permission_check',
-            result=validation_successful,
-            error_message=channel_config.validation_error,
-            permissions=current_permissions
-        )
-        db.session.add(validation_record)
-        
+        result = apply_permission_check(channel_config, member_result)
         db.session.commit()
         
-        return {
-            'valid': validation_successful,
-            'permissions_changed': permissions_changed,
-            'current_permissions': current_permissions,
-            'missing_permissions': missing_permissions if not validation_successful else []
-        }
+        return result
     
     except Exception as e:
-        logger.error(f"Error validating channel permissions: {str(e)}")
+        logger.error("Error validating channel permissions: %s", e)
         
         # Log validation error
         try:
-            validation_record = ChannelValidationHistory.create_validation_record(
-                channel_config_id=channel_config.id,
-                validation_type='permission_check',
-                result=False,
-                error_message=f'Validation error: {str(e)}'
-            )
-            db.session.add(validation_record)
-            
-            channel_config.is_validated = False
-            channel_config.last_validation_at = datetime.utcnow()
-            channel_config.validation_error = f'Validation error: {str(e)}'
-            
+            record_validation_error(channel_config, e)
             db.session.commit()
         except Exception as db_error:
-            logger.error(f"Error logging validation failure: {str(db_error)}")
+            logger.error("Error logging validation failure: %s", db_error)
         
         return {
             'valid': False,
@@ -169,7 +223,7 @@ def setup_channel_configuration(account_id: int, channel_username: str, bot_toke
     """
     try:
         # Check if account already has a channel configured
-        existing_config = ChannelConfig.query.filter_by(account_id=account_id).first()
+        existing_config = ChannelConfig.get_by_account(account_id)
         if existing_config:
             return {
                 'success': False,
@@ -224,7 +278,7 @@ def setup_channel_configuration(account_id: int, channel_username: str, bot_toke
         }
     
     except Exception as e:
-        logger.error(f"Error setting up channel configuration: {str(e)}")
+        logger.error("Error setting up channel configuration: %s", e)
         db.session.rollback()
         return {
             'success': False,
@@ -264,7 +318,7 @@ def revalidate_channel(channel_config: ChannelConfig, bot_token: str, bot_id: in
         }
     
     except Exception as e:
-        logger.error(f"Error revalidating channel: {str(e)}")
+        logger.error("Error revalidating channel: %s", e)
         return {
             'success': False,
             'error': f'Revalidation error: {str(e)}'
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Periodic validation worker
+Runs the channel validation scheduler in a single dedicated process instead of
+inside every web worker
+"""
+
+import os
+import signal
+import logging
+import threading
+
+os.environ['RUN_SCHEDULER'] = 'true'
+
+from app import create_app
+from tasks import stop_periodic_validation
+
+logger = logging.getLogger(__name__)
+
+def main():
+    """Main function"""
+    app = create_app()
+    shutdown = threading.Event()
+    
+    def handle_signal(signum, frame):
+        logger.info("Received signal %s, stopping periodic validation worker", signum)
+        shutdown.set()
+    
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
+    
+    logger.info("Periodic validation worker running for %s", app.config['SERVICE_NAME'])
+    shutdown.wait()
+    
+    stop_periodic_validation()
+    return 0
+
+if __name__ == "__main__":
+    exit(main())